@@ -30,9 +30,7 @@ ensemble.models_map = models_map
 oofs = {}
 target = None
 for i in range(1, 30):
-    oof = pd.read_csv(
-        os.path.join(results_path, f"model_{i}", "predictions_out_of_folds.csv")
-    )
+    oof = models_map[f"model_{i}"].get_out_of_folds()
     prediction_cols = [c for c in oof.columns if "prediction" in c]
     oofs[f"model_{i}"] = oof[prediction_cols]
     if target is None:
@@ -64,6 +64,14 @@ class BaseAlgorithm:
     def copy(self):
         pass
 
+    def get_snapshot(self):
+        # state needed to roll back the learner to the current iteration,
+        # learners should return only what changes between iterations
+        return self.copy()
+
+    def restore_snapshot(self, snapshot):
+        self.model = snapshot.model
+
     def save(self, model_file_path):
         pass
 
@@ -293,6 +293,13 @@ class CatBoostAlgorithm(BaseAlgorithm):
     def copy(self):
         return copy.deepcopy(self)
 
+    def get_snapshot(self):
+        # trees are never removed, the best one is selected at prediction
+        return self.best_ntree_limit
+
+    def restore_snapshot(self, snapshot):
+        self.best_ntree_limit = snapshot
+
     def save(self, model_file_path):
         self.model.save_model(model_file_path)
         self.model_file_path = model_file_path
@@ -24,6 +24,7 @@ from supervised.utils.metric import (
     lightgbm_eval_metric_user_defined,
 )
 from supervised.utils.config import LOG_LEVEL
+from supervised.utils.sparse import has_sparse_columns, to_csr
 
 logger = logging.getLogger(__name__)
 logger.setLevel(LOG_LEVEL)
@@ -188,6 +189,15 @@ class LightgbmAlgorithm(BaseAlgorithm):
         return iters
     """
 
+    @staticmethod
+    def _get_values(X):
+        if not isinstance(X, pd.DataFrame):
+            return X
+        # sparse text features are passed without converting to dense matrix
+        if has_sparse_columns(X):
+            return to_csr(X)
+        return X.values
+
     def fit(
         self,
         X,
@@ -200,7 +210,7 @@ class LightgbmAlgorithm(BaseAlgorithm):
         max_time=None,
     ):
         lgb_train = lgb.Dataset(
-            X.values if isinstance(X, pd.DataFrame) else X,
+            self._get_values(X),
             y,
             weight=sample_weight,
         )
@@ -220,9 +230,7 @@ class LightgbmAlgorithm(BaseAlgorithm):
                 valid_sets = [
                     lgb_train,
                     lgb.Dataset(
-                        X_validation.values
-                        if isinstance(X_validation, pd.DataFrame)
-                        else X_validation,
+                        self._get_values(X_validation),
                         y_validation,
                         weight=sample_weight_validation,
                     ),
@@ -267,12 +275,19 @@ class LightgbmAlgorithm(BaseAlgorithm):
 
     def predict(self, X):
         self.reload()
-        return self.model.predict(X.values if isinstance(X, pd.DataFrame) else X)
+        return self.model.predict(self._get_values(X))
 
     def copy(self):
         with open(os.devnull, "w") as f, contextlib.redirect_stdout(f):
             return copy.deepcopy(self)
 
+    def get_snapshot(self):
+        # trees are never removed, prediction is limited with best_iteration
+        return self.model.current_iteration()
+
+    def restore_snapshot(self, snapshot):
+        self.model.best_iteration = snapshot
+
     def save(self, model_file_path):
         self.model.save_model(model_file_path)
         self.model_file_path = model_file_path
@@ -329,6 +344,7 @@ required_preprocessing = [
     "convert_categorical",
     "datetime_transform",
     "text_transform",
+    "sparse_text",
     "target_as_integer",
 ]
 
@@ -370,6 +386,7 @@ regression_required_preprocessing = [
     "convert_categorical",
     "datetime_transform",
     "text_transform",
+    "sparse_text",
     "target_scale",
 ]
 
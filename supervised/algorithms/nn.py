@@ -33,6 +33,16 @@ class NNFit(SklearnAlgorithm):
             and self.model.n_iter_ > 0
         )
 
+    def get_snapshot(self):
+        return {
+            "coefs_": [c.copy() for c in self.model.coefs_],
+            "intercepts_": [i.copy() for i in self.model.intercepts_],
+        }
+
+    def restore_snapshot(self, snapshot):
+        self.model.coefs_ = snapshot["coefs_"]
+        self.model.intercepts_ = snapshot["intercepts_"]
+
     def fit(
         self,
         X,
@@ -40,6 +40,12 @@ class SklearnAlgorithm(BaseAlgorithm):
     def copy(self):
         return copy.deepcopy(self)
 
+    def get_snapshot(self):
+        return copy.deepcopy(self.model)
+
+    def restore_snapshot(self, snapshot):
+        self.model = snapshot
+
     def save(self, model_file_path):
         logger.debug("SklearnAlgorithm save to {0}".format(model_file_path))
         joblib.dump(self.model, model_file_path, compress=True)
@@ -174,6 +180,15 @@ class SklearnTreesEnsembleClassifierAlgorithm(SklearnAlgorithm):
                 df_result["validation"] *= -1.0
             df_result.to_csv(log_to_file, index=False, header=False)
 
+    def get_snapshot(self):
+        # trees are only added with warm start, keep the trees count
+        return len(self.model.estimators_)
+
+    def restore_snapshot(self, snapshot):
+        self.model.estimators_ = self.model.estimators_[:snapshot]
+        # ready for the next warm start step, the same as after fit
+        self.model.n_estimators = snapshot + self.trees_in_step
+
     def get_metric_name(self):
         return self.params.get("eval_metric_name", "logloss")
 
@@ -279,9 +279,30 @@ class XgbAlgorithm(BaseAlgorithm):
 
         return a
 
+    def predict_inplace(self, X):
+        """Predicts NumPy array without DMatrix, much faster for a few samples,
+        used by the compiled predictor."""
+        self.reload()
+
+        if self.model is None:
+            raise XgbAlgorithmException("Xgboost model is None")
+
+        if not hasattr(self.model, "inplace_predict"):
+            return self.predict(X)
+        return self.model.inplace_predict(
+            X, iteration_range=(0, self.best_ntree_limit), missing=np.NaN
+        )
+
     def copy(self):
         return copy.deepcopy(self)
 
+    def get_snapshot(self):
+        # trees are never removed, the best one is selected at prediction
+        return self.best_ntree_limit
+
+    def restore_snapshot(self, snapshot):
+        self.best_ntree_limit = snapshot
+
     def save(self, model_file_path):
         self.model.save_model(model_file_path)
         self.model_file_path = model_file_path
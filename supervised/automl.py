@@ -39,11 +39,16 @@ class AutoML(BaseAutoML):
         boost_on_errors="auto",
         kmeans_features="auto",
         mix_encoding="auto",
+        text_vectorizer="tfidf",
         max_single_prediction_time=None,
         optuna_time_budget=None,
         optuna_init_params={},
         optuna_verbose=True,
         n_jobs=-1,
+        n_parallel_models=1,
+        artifacts_cache_dir=None,
+        artifacts_cache_size=1024,
+        successive_halving=False,
         verbose=1,
         random_state=1234,
     ):
@@ -140,6 +145,11 @@ class AutoML(BaseAutoML):
                         "stratify": True
                     }
 
+                For cross-validation, set `"cache_folds": True` to keep selected folds in memory and reuse them in the next models.
+                Set `"cache_preprocessing": True` to keep preprocessed folds in memory and reuse them in the next models with the same preprocessing.
+                Both options need memory for all folds, preprocessed folds are limited to `PreprocessingCache.MAX_SIZE` MB and the least recently used are removed.
+                Set `"parallel_folds": 3` to train 3 folds at once in separate processes, the `n_jobs` threads are split between processes.
+
             explain_level (int): The level of explanations included to each model:
 
                 - if `explain_level` is `0` no explanations are produced.
@@ -196,6 +206,10 @@ class AutoML(BaseAutoML):
                 for categoricals with more than 25 categories, and one-hot binary encoding for other categoricals. It is only applied if there are
                 categorical features with cardinality smaller than 25. By default it is available in the `Compete` mode.
 
+            text_vectorizer (str): The method used to convert text features. Available options: `tfidf` (default) - TF-IDF with 100 most frequent words
+                from the training data, `hashing` - stateless hashing of words into 100 features, there is no vocabulary fitted and saved.
+                Text features are kept sparse for LightGBM.
+
             max_single_prediction_time (int or float): The limit for prediction time for single sample. Use it if you want to have a model with fast predictions.
                 Ideal for creating ML pipelines used as REST API. Time is in seconds. By default (`max_single_prediction_time=None`) models are not optimized for fast predictions,
                 except the mode `Perform`. For the mode `Perform` the default is `0.5` seconds.
@@ -212,6 +226,23 @@ class AutoML(BaseAutoML):
 
             n_jobs (int): Number of CPU cores to be used. By default is set to `-1` which means using  all processors.
 
+            n_parallel_models (int): Number of models trained at once in separate processes. The `n_jobs` cores are split between models.
+                By default is set to `1`, models are trained one by one. It is not used in the `Optuna` mode.
+
+            artifacts_cache_dir (str): The directory with data-dependent artifacts shared by AutoML runs: data info, EDA, folds indices,
+                golden features and k-means models. They are stored under the fingerprint of `X`, `y`, `sample_weight` and the validation strategy,
+                and reused when a new `results_path` is trained on the same data. By default (`None`) the cache is not used.
+                Cache hits and misses are listed in the `README.md` report.
+
+            artifacts_cache_size (int or float): The maximum size of the `artifacts_cache_dir` in MB. The least recently used artifacts are removed
+                above this size. By default is set to `1024`.
+
+            successive_halving (boolean): If true the `not_so_random` and `hill_climbing` steps check more candidates with low fidelity validation:
+                the first fold of k-fold validation, on 25% of train rows for data with at least 100k rows. The best third of models
+                of each algorithm is trained again with full validation in the `*_promote` step. Low fidelity models are listed in the leaderboard
+                with `fidelity` smaller than 1, they are not used in ensembles and stacking. It is used only with k-fold validation.
+                It is not used in the `Optuna` mode. By default is set to `False`.
+
             verbose (int): Controls the verbosity when fitting and predicting.
 
                 Note:
@@ -311,11 +342,16 @@ class AutoML(BaseAutoML):
         self.boost_on_errors = boost_on_errors
         self.kmeans_features = kmeans_features
         self.mix_encoding = mix_encoding
+        self.text_vectorizer = text_vectorizer
         self.max_single_prediction_time = max_single_prediction_time
         self.optuna_time_budget = optuna_time_budget
         self.optuna_init_params = optuna_init_params
         self.optuna_verbose = optuna_verbose
         self.n_jobs = n_jobs
+        self.n_parallel_models = n_parallel_models
+        self.artifacts_cache_dir = artifacts_cache_dir
+        self.artifacts_cache_size = artifacts_cache_size
+        self.successive_halving = successive_halving
         self.random_state = random_state
 
     def fit(self, X, y, sample_weight=None, cv=None):
@@ -395,6 +431,53 @@ class AutoML(BaseAutoML):
         """
         return self._predict_all(X)
 
+    def predict_iter(self, source, chunk_size=100000, n_prefetch=2):
+        """
+        Computes predictions from AutoML best model in chunks.
+        Only one chunk and its predictions are kept in the memory,
+        so it can be used for data larger than the available memory.
+
+        Arguments:
+            source (str or pandas.DataFrame or numpy.ndarray or iterable):
+                Path to CSV or parquet file (parquet needs `pyarrow`),
+                data frame, array or iterable of data frames.
+
+            chunk_size (int): Maximum number of rows in one chunk.
+
+            n_prefetch (int): Number of chunks read and predicted ahead
+                in background threads. If 0, chunks are read and predicted
+                in the calling thread.
+
+        Returns:
+            generator of pandas.Dataframe:
+                Predictions for each chunk, the same as from `predict_all()`,
+                with index of the input chunk.
+
+        Raises:
+            AutoMLException: Model has not yet been fitted or arguments are wrong,
+                it is raised at the call, before the iteration.
+
+        """
+        return self._predict_iter(source, chunk_size, n_prefetch)
+
+    def compile_predictor(self):
+        """
+        Prepares the best model for predictions on single samples with low latency.
+        Fitted preprocessing is converted into lookup tables and NumPy operations.
+        Models that can't be compiled (stacked models, models with text or
+        datetime features) use the standard predict path.
+
+        Returns:
+            CompiledPredictor:
+                Object with `predict(x)` and `predict_proba(x)` methods,
+                where `x` is a dict with column names as keys or a 1-row array.
+
+        Raises:
+            AutoMLException: Model has not yet been fitted.
+
+        """
+        return self._compile_predictor()
+
     def score(self, X, y=None, sample_weight=None):
         """Calculates a goodness of `fit` for an AutoML instance.
 
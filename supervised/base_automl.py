@@ -26,13 +26,16 @@ from supervised.callbacks.early_stopping import EarlyStopping
 from supervised.callbacks.metric_logger import MetricLogger
 from supervised.callbacks.learner_time_constraint import LearnerTimeConstraint
 from supervised.callbacks.total_time_constraint import TotalTimeConstraint
+from supervised.compiled_predictor import CompiledPredictor
 from supervised.ensemble import Ensemble
 from supervised.exceptions import AutoMLException
 from supervised.exceptions import NotTrainedException
 from supervised.model_framework import ModelFramework
 from supervised.preprocessing.exclude_missing_target import ExcludeRowsMissingTarget
+from supervised.tuner.cost_model import CostModel
 from supervised.tuner.data_info import DataInfo
 from supervised.tuner.mljar_tuner import MljarTuner
+from supervised.utils.chunks import read_chunks, prefetch
 from supervised.utils.config import mem
 from supervised.utils.config import LOG_LEVEL
 from supervised.utils.leaderboard_plots import LeaderboardPlots
@@ -42,6 +45,7 @@ from supervised.utils.automl_plots import AutoMLPlots
 from supervised.preprocessing.eda import EDA
 from supervised.preprocessing.preprocessing_utils import PreprocessingUtils
 from supervised.tuner.time_controller import TimeController
+from supervised.validation.validation_step import ValidationStep
 from supervised.utils.data_validation import (
     check_positive_integer,
     check_greater_than_zero_integer,
@@ -49,7 +53,8 @@ from supervised.utils.data_validation import (
     check_greater_than_zero_integer_or_float,
     check_integer,
 )
-from supervised.utils.utils import dump_data, load_data
+from supervised.utils.utils import dump_data, load_data, release_data
+from supervised.utils.artifacts_cache import ArtifactsCache
 
 logger = logging.getLogger(__name__)
 logger.setLevel(LOG_LEVEL)
@@ -82,6 +87,8 @@ class BaseAutoML(BaseEstimator, ABC):
         self._top_models_to_improve = None
         self._random_state = 1234
         self._models = []  # instances of iterative learner framework or ensemble
+        # models checked with low fidelity validation, not used in ensembles
+        self._low_fidelity_models = []
         self._best_model = None
         self._verbose = True
         self._threshold = None  # used only in classification
@@ -102,11 +109,17 @@ class BaseAutoML(BaseEstimator, ABC):
         self._boost_on_errors = None
         self._kmeans_features = None
         self._mix_encoding = None
+        self._text_vectorizer = "tfidf"
         self._max_single_prediction_time = None
         self._optuna_time_budget = None
         self._optuna_init_params = {}
         self._optuna_verbose = True
         self._n_jobs = -1
+        self._n_parallel_models = 1
+        self._artifacts_cache_dir = None
+        self._artifacts_cache_size = 1024
+        self._successive_halving = False
+        self._models_load_time = {}  # seconds spent on loading each model
 
     def _get_tuner_params(
         self, start_random_models, hill_climbing_steps, top_models_to_improve
@@ -167,19 +180,31 @@ class BaseAutoML(BaseEstimator, ABC):
             self._boost_on_errors = params.get("boost_on_errors", self._boost_on_errors)
             self._kmeans_features = params.get("kmeans_features", self._kmeans_features)
             self._mix_encoding = params.get("mix_encoding", self._mix_encoding)
+            self._text_vectorizer = params.get(
+                "text_vectorizer", self._text_vectorizer
+            )
             self._max_single_prediction_time = params.get(
                 "max_single_prediction_time", self._max_single_prediction_time
             )
             self._n_jobs = params.get("n_jobs", self._n_jobs)
+            self._n_parallel_models = params.get(
+                "n_parallel_models", self._n_parallel_models
+            )
+            self._artifacts_cache_dir = params.get(
+                "artifacts_cache_dir", self._artifacts_cache_dir
+            )
+            self._artifacts_cache_size = params.get(
+                "artifacts_cache_size", self._artifacts_cache_size
+            )
+            self._successive_halving = params.get(
+                "successive_halving", self._successive_halving
+            )
             self._random_state = params.get("random_state", self._random_state)
             stacked_models = params.get("stacked")
 
             best_model_name = params.get("best_model")
             load_on_predict = params.get("load_on_predict")
             self._fit_level = params.get("fit_level")
-            lazy_load = not (
-                self._fit_level is not None and self._fit_level == "finished"
-            )
             load_models = self._model_subpaths
             if load_on_predict is not None and self._fit_level == "finished":
                 load_models = load_on_predict
@@ -190,18 +215,37 @@ class BaseAutoML(BaseEstimator, ABC):
                 load_models = list(np.unique(load_models + models_needed))
 
             models_map = {}
+            self._models_load_time = {}
+
+            # models are loaded in threads, ensembles need loaded models
+            # learners are loaded from files on the first predict
+            frameworks = {}
+            frameworks_subpaths = [
+                model_subpath
+                for model_subpath in load_models
+                if not self._is_ensemble_subpath(model_subpath)
+            ]
+            if frameworks_subpaths:
+                results = joblib.Parallel(n_jobs=self._n_jobs, backend="threading")(
+                    joblib.delayed(_load_model_framework)(path, model_subpath)
+                    for model_subpath in frameworks_subpaths
+                )
+                frameworks = dict(zip(frameworks_subpaths, results))
 
             for model_subpath in load_models:
-                if model_subpath.endswith("Ensemble") or model_subpath.endswith(
-                    "Ensemble_Stacked"
-                ):
-                    ens = Ensemble.load(path, model_subpath, models_map)
-                    self._models += [ens]
-                    models_map[ens.get_name()] = ens
+                if self._is_ensemble_subpath(model_subpath):
+                    start_time = time.time()
+                    m = Ensemble.load(path, model_subpath, models_map)
+                    load_time = time.time() - start_time
+                else:
+                    m, load_time = frameworks[model_subpath]
+                if m.get_fidelity() < 1.0:
+                    self._low_fidelity_models += [m]
                 else:
-                    m = ModelFramework.load(path, model_subpath, lazy_load)
                     self._models += [m]
-                    models_map[m.get_name()] = m
+                models_map[m.get_name()] = m
+                self._models_load_time[m.get_name()] = load_time
+                logger.info(f"Model {m.get_name()} loaded in {load_time:.2f} seconds")
 
             self._best_model = None
             if best_model_name is not None:
@@ -224,6 +268,12 @@ class BaseAutoML(BaseEstimator, ABC):
         except Exception as e:
             raise AutoMLException(f"Cannot load AutoML directory. {str(e)}")
 
+    @staticmethod
+    def _is_ensemble_subpath(model_subpath):
+        return model_subpath.endswith("Ensemble") or model_subpath.endswith(
+            "Ensemble_Stacked"
+        )
+
     def get_leaderboard(
         self, filter_random_feature=False, original_metric_values=False
     ):
@@ -236,7 +286,9 @@ class BaseAutoML(BaseEstimator, ABC):
         }
         if self._max_single_prediction_time is not None:
             ldb["single_prediction_time"] = []
-        for m in self._models:
+        if self._successive_halving:
+            ldb["fidelity"] = []
+        for m in self._models + self._low_fidelity_models:
             # filter model with random feature
             if filter_random_feature and "RandomFeature" in m.get_name():
                 continue
@@ -252,6 +304,8 @@ class BaseAutoML(BaseEstimator, ABC):
                     ]
                 else:
                     ldb["single_prediction_time"] += [None]
+            if self._successive_halving:
+                ldb["fidelity"] += [m.get_fidelity()]
 
         ldb = pd.DataFrame(ldb)
         # need to add argument for sorting
@@ -264,7 +318,9 @@ class BaseAutoML(BaseEstimator, ABC):
 
         return ldb
 
-    def keep_model(self, model, model_subpath):
+    def keep_model(self, model, model_subpath, spend_time=None):
+        # spend_time is the share of the total time used by the model,
+        # it is different than train time when models are trained in parallel
         if model is None:
             return
 
@@ -281,7 +337,10 @@ class BaseAutoML(BaseEstimator, ABC):
             if "Ensemble" not in model.get_type():
                 model.release_learners()
 
-        self._models += [model]
+        if model.get_fidelity() < 1.0:
+            self._low_fidelity_models += [model]
+        else:
+            self._models += [model]
         self._model_subpaths += [model_subpath]
         self.select_and_save_best()
 
@@ -295,8 +354,15 @@ class BaseAutoML(BaseEstimator, ABC):
         if model._single_prediction_time is not None:
             msg += f" (1-sample predict time {np.round(model._single_prediction_time,4)} seconds)"
         self.verbose_print(msg)
+        learner_params = getattr(model, "learner_params", None)
         self._time_ctrl.log_time(
-            model.get_name(), model.get_type(), self._fit_level, model.get_train_time()
+            model.get_name(),
+            model.get_type(),
+            self._fit_level,
+            model.get_train_time() if spend_time is None else spend_time,
+            None
+            if learner_params is None
+            else self._cost_features(learner_params, model.validation_params),
         )
 
         self.tuner.add_key(model)
@@ -308,24 +374,62 @@ class BaseAutoML(BaseEstimator, ABC):
             except Exception as e:
                 raise AutoMLException(f"Cannot create directory {model_path}. {str(e)}")
 
-    def _expected_learners_cnt(self):
+    def _cost_features(self, learner_params, validation_params=None):
+        """Returns features used to predict the train time of the model"""
+        rows = self._data_info["rows"]
+        if validation_params is not None:
+            rows *= validation_params.get("fidelity_rows", 1.0)
+        return CostModel.get_features(
+            learner_params,
+            rows,
+            self._data_info["cols"],
+            self._expected_learners_cnt(validation_params),
+        )
+
+    def _expected_learners_cnt(self, validation_params=None):
         try:
             repeats = self._validation_strategy.get("repeats", 1)
             folds = self._validation_strategy.get("k_folds", 1)
+            # low fidelity model is trained only on the first folds
+            if validation_params is not None and validation_params.get(
+                "fidelity_folds"
+            ):
+                return min(repeats * folds, validation_params["fidelity_folds"])
             return repeats * folds
         except Exception as e:
             pass
         return 1
 
     def train_model(self, params):
+        mf = self._get_model_framework(params)
+        if mf is None:
+            return False
+        results_path, model_subpath = self._results_path, params["name"]
 
+        # start training
+        logger.info(
+            f"Train model #{len(self._models)+1} / Model name: {params['name']}"
+        )
+        mf.train(results_path, model_subpath)
+
+        # keep info about the model
+        self.keep_model(mf, model_subpath)
+
+        # save the model
+        mf.save(results_path, model_subpath)
+
+        return True
+
+    def _get_model_framework(self, params):
         # do we have enough time to train?
         # if not, skip
         if not self._time_ctrl.enough_time(
-            params["learner"]["model_type"], self._fit_level
+            params["learner"]["model_type"],
+            self._fit_level,
+            self._cost_features(params["learner"], params["validation_strategy"]),
         ):
             logger.info(f"Cannot train {params['name']} because of the time constraint")
-            return False
+            return None
         # let's create directory to log all training artifacts
         results_path, model_subpath = self._results_path, params["name"]
         model_path = os.path.join(results_path, model_subpath)
@@ -354,30 +458,18 @@ class BaseAutoML(BaseEstimator, ABC):
                 if self._model_time_limit is None
                 else None,
                 "total_time_start": self._start_time,
-                "expected_learners_cnt": self._expected_learners_cnt(),
+                "expected_learners_cnt": self._expected_learners_cnt(
+                    params["validation_strategy"]
+                ),
             }
         )
 
         # create model framework
-        mf = ModelFramework(
+        return ModelFramework(
             params,
             callbacks=[early_stop, total_time_constraint],
         )
 
-        # start training
-        logger.info(
-            f"Train model #{len(self._models)+1} / Model name: {params['name']}"
-        )
-        mf.train(results_path, model_subpath)
-
-        # keep info about the model
-        self.keep_model(mf, model_subpath)
-
-        # save the model
-        mf.save(results_path, model_subpath)
-
-        return True
-
     def verbose_print(self, msg):
         if self._verbose > 0:
             # self._progress_bar.write(msg)
@@ -407,8 +499,9 @@ class BaseAutoML(BaseEstimator, ABC):
         # if multiclass and too many classes then No
         return True
 
-    def get_stacked_data(self, X, mode="training"):
+    def get_stacked_data(self, X, mode="training", predictions_cache=None):
         # mode can be `training` or `predict`
+        # predictions_cache keeps models predictions on X, to be reused by Ensemble
         if self._stacked_models is None:
             return X
         all_oofs = []
@@ -417,7 +510,14 @@ class BaseAutoML(BaseEstimator, ABC):
             if mode == "training":
                 oof = m.get_out_of_folds()
             else:
-                oof = m.predict(X)
+                if predictions_cache is not None and m.get_name() in predictions_cache:
+                    oof = predictions_cache[m.get_name()]
+                elif m.get_type() == "Ensemble":
+                    oof = m.predict(X, predictions_cache=predictions_cache)
+                else:
+                    oof = m.predict(X)
+                if predictions_cache is not None:
+                    predictions_cache[m.get_name()] = oof
                 if self._ml_task == BINARY_CLASSIFICATION:
                     cols = [f for f in oof.columns if "prediction" in f]
                     if len(cols) == 2:
@@ -614,7 +714,21 @@ class BaseAutoML(BaseEstimator, ABC):
         if self._ml_task == MULTICLASS_CLASSIFICATION:
             y = y.astype(str)
 
-        columns_and_target_info = DataInfo.compute(X, y, self._ml_task)
+        artifacts_cache = ArtifactsCache.from_params(self._validation_strategy)
+        cache_params = {"ml_task": self._ml_task}
+        columns_and_target_info = None
+        if artifacts_cache is not None:
+            columns_and_target_info = artifacts_cache.get_object(
+                "data_info", cache_params
+            )
+        if columns_and_target_info is None:
+            columns_and_target_info = DataInfo.compute(
+                X, y, self._ml_task, n_jobs=self._n_jobs
+            )
+            if artifacts_cache is not None:
+                artifacts_cache.set_object(
+                    "data_info", cache_params, columns_and_target_info
+                )
 
         self.n_features_in_ = X.shape[1]
         self.n_classes = len(np.unique(y[~pd.isnull(y)]))
@@ -639,6 +753,40 @@ class BaseAutoML(BaseEstimator, ABC):
         with open(data_info_path, "w") as fout:
             fout.write(json.dumps(self._data_info, indent=4))
 
+    def _set_artifacts_cache(self, X, y, sample_weight=None):
+        """Sets the cache shared by AutoML runs in the validation params"""
+        if self._artifacts_cache_dir is None:
+            return None
+        try:
+            fingerprint = ArtifactsCache.fingerprint(X, y, sample_weight)
+        except TypeError as e:
+            self.verbose_print(f"Artifacts cache is not used. {e}")
+            return None
+        os.makedirs(self._artifacts_cache_dir, exist_ok=True)
+        self._validation_strategy["artifacts_cache"] = {
+            "path": self._artifacts_cache_dir,
+            "max_size": self._artifacts_cache_size,
+            "fingerprint": fingerprint,
+            "results_path": self._results_path,
+        }
+        return ArtifactsCache.from_params(self._validation_strategy)
+
+    def _cache_golden_features(self, restore=False):
+        """Restores golden features from the artifacts cache or saves them there"""
+        artifacts_cache = ArtifactsCache.from_params(self._validation_strategy)
+        if artifacts_cache is None:
+            return
+        fname = os.path.join(self._results_path, "golden_features.json")
+        cache_params = {
+            "golden_features": self._golden_features,
+            "ml_task": self._ml_task,
+        }
+        if restore:
+            if not os.path.exists(fname):
+                artifacts_cache.restore("golden_features", cache_params, fname)
+        elif os.path.exists(fname):
+            artifacts_cache.set("golden_features", cache_params, fname)
+
     def save_progress(self, step=None, generated_params=None):
         if step is not None and generated_params is not None:
             self._all_params[step] = generated_params
@@ -915,11 +1063,16 @@ class BaseAutoML(BaseEstimator, ABC):
         self._boost_on_errors = self._get_boost_on_errors()
         self._kmeans_features = self._get_kmeans_features()
         self._mix_encoding = self._get_mix_encoding()
+        self._text_vectorizer = self._get_text_vectorizer()
         self._max_single_prediction_time = self._get_max_single_prediction_time()
         self._optuna_time_budget = self._get_optuna_time_budget()
         self._optuna_init_params = self._get_optuna_init_params()
         self._optuna_verbose = self._get_optuna_verbose()
         self._n_jobs = self._get_n_jobs()
+        self._n_parallel_models = self._get_n_parallel_models()
+        self._artifacts_cache_dir = self._get_artifacts_cache_dir()
+        self._artifacts_cache_size = self._get_artifacts_cache_size()
+        self._successive_halving = self._get_successive_halving()
         self._random_state = self._get_random_state()
 
         self._adjust_validation = False
@@ -964,9 +1117,17 @@ class BaseAutoML(BaseEstimator, ABC):
             if self._time_ctrl is not None:
                 self._start_time -= self._time_ctrl.already_spend()
 
+            artifacts_cache = self._set_artifacts_cache(X, y, sample_weight)
+
             # Automatic Exloratory Data Analysis
             if self._explain_level == 2:
-                EDA.compute(X, y, os.path.join(self._results_path, "EDA"))
+                eda_path = os.path.join(self._results_path, "EDA")
+                if artifacts_cache is None or not artifacts_cache.restore(
+                    "EDA", None, eda_path
+                ):
+                    EDA.compute(X, y, eda_path)
+                    if artifacts_cache is not None:
+                        artifacts_cache.set("EDA", None, eda_path)
 
             # Save data
             if sample_weight is not None:
@@ -1004,6 +1165,8 @@ class BaseAutoML(BaseEstimator, ABC):
                 self._optuna_verbose,
                 self._n_jobs,
                 self._random_state,
+                self._text_vectorizer,
+                self._successive_halving,
             )
             self.tuner = tuner
 
@@ -1033,6 +1196,9 @@ class BaseAutoML(BaseEstimator, ABC):
                 if step in ["stack", "ensemble_stacked"] and not self._stack_models:
                     continue
 
+                if step == "golden_features":
+                    self._cache_golden_features(restore=True)
+
                 if step == "stack":
                     self.prepare_for_stacking()
                 if "hill_climbing" in step or step in ["ensemble", "stack"]:
@@ -1052,6 +1218,7 @@ class BaseAutoML(BaseEstimator, ABC):
                         self._results_path,
                         self._stacked_models,
                         self._total_time_limit,
+                        self._low_fidelity_models,
                     )
 
                 if generated_params is None or not generated_params:
@@ -1069,6 +1236,25 @@ class BaseAutoML(BaseEstimator, ABC):
                             f"* Step {step} will try to check up to {len(generated_params)} {model_str}"
                         )
 
+                # models with the lowest predicted train time are trained first
+                order = self._time_ctrl.order_by_cost(
+                    step,
+                    [
+                        (
+                            p.get("learner", {}).get("model_type"),
+                            self._cost_features(
+                                p.get("learner", {}), p.get("validation_strategy")
+                            ),
+                        )
+                        for p in generated_params
+                    ],
+                )
+                generated_params[:] = [generated_params[i] for i in order]
+
+                if self._can_train_in_parallel(step):
+                    self._train_models_in_parallel(step, generated_params)
+                    continue
+
                 for params in generated_params:
                     if params.get("status", "") in ["trained", "skipped", "error"]:
                         self.verbose_print(f"{params['name']}: {params['status']}.")
@@ -1083,8 +1269,11 @@ class BaseAutoML(BaseEstimator, ABC):
                         else:
                             trained = self.train_model(params)
                         params["status"] = "trained" if trained else "skipped"
-                        params["final_loss"] = self._models[-1].get_final_loss()
-                        params["train_time"] = self._models[-1].get_train_time()
+                        last_model = self._models[-1]
+                        if params.get("fidelity_step") and self._low_fidelity_models:
+                            last_model = self._low_fidelity_models[-1]
+                        params["final_loss"] = last_model.get_final_loss()
+                        params["train_time"] = last_model.get_train_time()
 
                         if (
                             self._adjust_validation
@@ -1110,6 +1299,7 @@ class BaseAutoML(BaseEstimator, ABC):
 
             if not self._models:
                 raise AutoMLException("No models produced.")
+            self._cache_golden_features()
             self._fit_level = "finished"
             self.save_progress()
             self.select_and_save_best(show_warnings=True)
@@ -1121,9 +1311,103 @@ class BaseAutoML(BaseEstimator, ABC):
 
         except Exception as e:
             raise e
+        finally:
+            # training data is needed only during the fit
+            release_data(self._results_path)
 
         return self
 
+    def _can_train_in_parallel(self, step):
+        return (
+            self._n_parallel_models > 1
+            # Optuna tuning results are shared between models
+            and self._mode != "Optuna"
+            and "ensemble" not in step
+            # validation is adjusted after the first model
+            # and golden features are computed in the first model
+            and step not in ["adjust_validation", "golden_features"]
+        )
+
+    def _train_models_in_parallel(self, step, generated_params):
+        """Trains models from the step in batches of n_parallel_models processes"""
+        to_train = []
+        for params in generated_params:
+            if params.get("status", "") in ["trained", "skipped", "error"]:
+                self.verbose_print(f"{params['name']}: {params['status']}.")
+                continue
+            to_train += [params]
+
+        for i in range(0, len(to_train), self._n_parallel_models):
+            batch = []
+            for params in to_train[i : i + self._n_parallel_models]:
+                try:
+                    mf = self._get_model_framework(params)
+                    if mf is None:
+                        params["status"] = "skipped"
+                    else:
+                        batch += [(params, mf)]
+                except Exception as e:
+                    import traceback
+
+                    self._update_errors_report(
+                        params.get("name"), str(e) + "\n" + traceback.format_exc()
+                    )
+                    params["status"] = "error"
+
+            if batch:
+                logger.info(f"Train models {[p['name'] for p, _ in batch]} in parallel")
+                # split the cores between processes
+                n_jobs = self._n_jobs if self._n_jobs > 0 else os.cpu_count() or 1
+                n_jobs = max(1, n_jobs // len(batch))
+                # folds are created once, before the training in processes
+                for _, mf in batch:
+                    ValidationStep(mf.validation_params)
+
+                start_time = time.time()
+                with joblib.parallel_backend("loky", inner_max_num_threads=n_jobs):
+                    results = joblib.Parallel(n_jobs=len(batch))(
+                        joblib.delayed(_train_model_in_worker)(
+                            mf, self._results_path, params["name"], n_jobs
+                        )
+                        for params, mf in batch
+                    )
+                batch_time = time.time() - start_time
+                models_time = np.sum(
+                    [mf.get_train_time() for mf, _, _ in results if mf is not None]
+                )
+
+                for (params, _), (mf, error, error_traceback) in zip(batch, results):
+                    try:
+                        if error is not None:
+                            raise error
+                        # the time controller gets the share of the batch time,
+                        # models were trained at the same time
+                        spend_time = batch_time / len(batch)
+                        if models_time > 0:
+                            spend_time = batch_time * mf.get_train_time() / models_time
+                        self.keep_model(mf, params["name"], spend_time)
+                        mf.save(self._results_path, params["name"])
+                        params["status"] = "trained"
+                        params["final_loss"] = mf.get_final_loss()
+                        params["train_time"] = mf.get_train_time()
+
+                    except NotTrainedException as e:
+                        params["status"] = "error"
+                        self.verbose_print(
+                            params.get("name") + " not trained. " + str(e)
+                        )
+                    except Exception as e:
+                        import traceback
+
+                        if error is None:
+                            error_traceback = traceback.format_exc()
+                        self._update_errors_report(
+                            params.get("name"), str(e) + "\n" + error_traceback
+                        )
+                        params["status"] = "error"
+
+            self.save_progress(step, generated_params)
+
     def _update_errors_report(self, model_name, error_msg):
         """Append error message to errors.md file."""
         errors_filename = os.path.join(self._get_results_path(), "errors.md")
@@ -1195,8 +1479,13 @@ class BaseAutoML(BaseEstimator, ABC):
                 "boost_on_errors": self._boost_on_errors,
                 "kmeans_features": self._kmeans_features,
                 "mix_encoding": self._mix_encoding,
+                "text_vectorizer": self._text_vectorizer,
                 "max_single_prediction_time": self._max_single_prediction_time,
                 "n_jobs": self._n_jobs,
+                "n_parallel_models": self._n_parallel_models,
+                "artifacts_cache_dir": self._artifacts_cache_dir,
+                "artifacts_cache_size": self._artifacts_cache_size,
+                "successive_halving": self._successive_halving,
                 "random_state": self._random_state,
                 "saved": self._model_subpaths,
                 "fit_level": self._fit_level,
@@ -1233,6 +1522,13 @@ class BaseAutoML(BaseEstimator, ABC):
                 if self._fit_level == "finished":
                     AutoMLPlots.add(self._results_path, self._models, fout)
 
+                cache_stats = ArtifactsCache.stats(self._results_path)
+                if cache_stats is not None:
+                    fout.write("\n\n## Artifacts cache\n\n")
+                    fout.write(
+                        tabulate(cache_stats.values, cache_stats.columns, tablefmt="pipe")
+                    )
+
     def get_ensemble_models(self, ensemble_name="Ensemble"):
         try:
             params = json.load(
@@ -1312,11 +1608,15 @@ class BaseAutoML(BaseEstimator, ABC):
         # is stacked model
         if model._is_stacked:
             self._perform_model_stacking()
-            X_stacked = self.get_stacked_data(X, mode="predict")
+            # each model predicts only once in this call
+            predictions_cache = {}
+            X_stacked = self.get_stacked_data(
+                X, mode="predict", predictions_cache=predictions_cache
+            )
 
             if model.get_type() == "Ensemble":
                 # Ensemble is using both original and stacked data
-                predictions = model.predict(X, X_stacked)
+                predictions = model.predict(X, X_stacked, predictions_cache)
             else:
                 predictions = model.predict(X_stacked)
         else:
@@ -1381,6 +1681,35 @@ class BaseAutoML(BaseEstimator, ABC):
         # Make and return predictions
         return self._base_predict(X)
 
+    def _predict_iter(self, source, chunk_size=100000, n_prefetch=2):
+        # checks run at the call, not at the first iteration
+        if self._best_model is None:
+            self.load(self.results_path)
+        if self._best_model is None:
+            raise AutoMLException(
+                "This model has not been fitted yet. Please call `fit()` first."
+            )
+        chunks = read_chunks(source, chunk_size)
+        return self._predict_chunks(chunks, n_prefetch)
+
+    def _predict_chunks(self, chunks, n_prefetch):
+        def predict_chunks(chunks):
+            for chunk in chunks:
+                index = chunk.index if isinstance(chunk, pd.DataFrame) else None
+                predictions = self._base_predict(chunk)
+                if index is not None:
+                    predictions.index = index
+                yield predictions
+
+        if not n_prefetch:
+            yield from predict_chunks(chunks)
+            return
+        # reading, predicting and consuming of chunks run in separate threads
+        yield from prefetch(predict_chunks(prefetch(chunks, n_prefetch)), n_prefetch)
+
+    def _compile_predictor(self):
+        return CompiledPredictor(self)
+
     def _score(self, X, y=None, sample_weight=None):
         # y default must be None for scikit-learn compatibility
 
@@ -1730,6 +2059,11 @@ class BaseAutoML(BaseEstimator, ABC):
         else:
             return deepcopy(self.mix_encoding)
 
+    def _get_text_vectorizer(self):
+        """Gets the current text_vectorizer"""
+        self._validate_text_vectorizer()
+        return deepcopy(self.text_vectorizer)
+
     def _get_max_single_prediction_time(self):
         """Gets the current max_single_prediction_time"""
         self._validate_max_single_prediction_time()
@@ -1775,6 +2109,29 @@ class BaseAutoML(BaseEstimator, ABC):
         self._validate_n_jobs()
         return deepcopy(self.n_jobs)
 
+    def _get_n_parallel_models(self):
+        """Gets the current n_parallel_models"""
+        self._validate_n_parallel_models()
+        return deepcopy(self.n_parallel_models)
+
+    def _get_artifacts_cache_dir(self):
+        """Gets the current artifacts_cache_dir"""
+        self._validate_artifacts_cache_dir()
+        return deepcopy(self.artifacts_cache_dir)
+
+    def _get_artifacts_cache_size(self):
+        """Gets the current artifacts_cache_size"""
+        self._validate_artifacts_cache_size()
+        return deepcopy(self.artifacts_cache_size)
+
+    def _get_successive_halving(self):
+        """Gets the current successive_halving"""
+        self._validate_successive_halving()
+        # Optuna tunes the models on the first fold already
+        if self._get_mode() == "Optuna":
+            return False
+        return deepcopy(self.successive_halving)
+
     def _get_random_state(self):
         """Gets the current random_state"""
         self._validate_random_state()
@@ -1984,6 +2341,14 @@ class BaseAutoML(BaseEstimator, ABC):
             return
         check_bool(self.mix_encoding, "mix_encoding")
 
+    def _validate_text_vectorizer(self):
+        """Validates text_vectorizer parameter"""
+        valid_vectorizers = ["tfidf", "hashing"]
+        if self.text_vectorizer not in valid_vectorizers:
+            raise ValueError(
+                f"Expected 'text_vectorizer' to be {' or '.join(valid_vectorizers)}, got '{self.text_vectorizer}'"
+            )
+
     def _validate_max_single_prediction_time(self):
         """Validates max_single_prediction_time parameter"""
         if self.max_single_prediction_time is None:
@@ -2017,6 +2382,29 @@ class BaseAutoML(BaseEstimator, ABC):
         """Validates mix_encoding parameter"""
         check_integer(self.n_jobs, "n_jobs")
 
+    def _validate_n_parallel_models(self):
+        """Validates n_parallel_models parameter"""
+        check_greater_than_zero_integer(self.n_parallel_models, "n_parallel_models")
+
+    def _validate_artifacts_cache_dir(self):
+        """Validates artifacts_cache_dir parameter"""
+        if self.artifacts_cache_dir is None:
+            return
+        if not isinstance(self.artifacts_cache_dir, str):
+            raise ValueError(
+                f"'artifacts_cache_dir' must be a string or None, got '{type(self.artifacts_cache_dir)}'."
+            )
+
+    def _validate_artifacts_cache_size(self):
+        """Validates artifacts_cache_size parameter"""
+        check_greater_than_zero_integer_or_float(
+            self.artifacts_cache_size, "artifacts_cache_size"
+        )
+
+    def _validate_successive_halving(self):
+        """Validates successive_halving parameter"""
+        check_bool(self.successive_halving, "successive_halving")
+
     def _validate_random_state(self):
         """Validates random_state parameter"""
         check_positive_integer(self.random_state, "random_state")
@@ -2281,3 +2669,28 @@ margin-right: auto;display: block;"/>\n\n"""
                 f"Model performance increased by {np.round(change*100.0,2)}%"
             )
             return False
+
+
+def _train_model_in_worker(mf, results_path, model_subpath, n_jobs):
+    # the model is trained on a copy, it is returned to the main process
+    try:
+        original_n_jobs = mf.learner_params.get("n_jobs")
+        if original_n_jobs is not None:
+            mf.learner_params["n_jobs"] = n_jobs
+        mf.train(results_path, model_subpath)
+        if original_n_jobs is not None:
+            # keep the same params as in sequential training
+            mf.learner_params["n_jobs"] = original_n_jobs
+            for learner in mf.learners:
+                learner.params["n_jobs"] = original_n_jobs
+        return mf, None, None
+    except Exception as e:
+        import traceback
+
+        return None, e, traceback.format_exc()
+
+
+def _load_model_framework(results_path, model_subpath):
+    start_time = time.time()
+    mf = ModelFramework.load(results_path, model_subpath, lazy_load=True)
+    return mf, time.time() - start_time
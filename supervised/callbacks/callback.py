@@ -23,3 +23,10 @@ class Callback(object):
 
     def on_framework_train_end(self, logs):
         pass
+
+    def get_learner_state(self, learner):
+        # state of the learner training, used to move results between processes
+        return None
+
+    def set_learner_state(self, learner, state):
+        pass
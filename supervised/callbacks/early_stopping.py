@@ -22,9 +22,13 @@ class EarlyStopping(Callback):
         self.log_to_dir = params.get("log_to_dir")
 
         self.keep_best_model = params.get("keep_best_model", True)
+        # roll back the learner to the best iteration after the training,
+        # it changes the saved learner, so it is disabled by default
+        self.restore_best_model = params.get("restore_best_model", False)
         self.best_iter = {}
         self.best_loss = {}
         self.loss_values = {}
+        # learners snapshots from the best iteration
         self.best_models = {}
         self.best_y_predicted = {}
         self.best_y_oof = (
@@ -33,7 +37,7 @@ class EarlyStopping(Callback):
         self.final_loss = (
             None  # final score computed on combined predictions from all learners
         )
-        # path to best model local copy, only used if cannot deep copy
+        # path to best model local copy, only used if cannot snapshot
         self.best_model_paths = {}
         self.multiple_target = False
         self.target_columns = None
@@ -51,6 +55,43 @@ class EarlyStopping(Callback):
     def on_learner_train_start(self, logs):
         self.no_improvement_cnt = 0
 
+    def on_learner_train_end(self, logs):
+        uid = self.learner.uid
+        iters = self.loss_values[uid]["iters"]
+        if (
+            self.keep_best_model
+            and self.restore_best_model
+            and len(iters)
+            and self.best_iter[uid] is not None
+            and self.best_iter[uid] != iters[-1]
+        ):
+            # roll back the learner to the best iteration
+            if self.best_models[uid] is not None:
+                self.learner.restore_snapshot(self.best_models[uid])
+            elif self.best_model_paths[uid] is not None:
+                self.learner.load(self.best_model_paths[uid])
+        # snapshot is not needed anymore
+        self.best_models[uid] = None
+
+    def get_learner_state(self, learner):
+        # the best model is not needed, the learner is saved after training
+        return {
+            "best_iter": self.best_iter[learner.uid],
+            "best_loss": self.best_loss[learner.uid],
+            "loss_values": self.loss_values[learner.uid],
+            "best_y_predicted": self.best_y_predicted[learner.uid],
+            "multiple_target": self.multiple_target,
+            "target_columns": self.target_columns,
+        }
+
+    def set_learner_state(self, learner, state):
+        self.best_iter[learner.uid] = state["best_iter"]
+        self.best_loss[learner.uid] = state["best_loss"]
+        self.loss_values[learner.uid] = state["loss_values"]
+        self.best_y_predicted[learner.uid] = state["best_y_predicted"]
+        self.multiple_target = state["multiple_target"]
+        self.target_columns = state["target_columns"]
+
     def on_framework_train_end(self, logs):
         # aggregate predictions from all learners
         # it has two columns: 'prediction', 'target'
@@ -162,7 +203,7 @@ class EarlyStopping(Callback):
                     sample_weight_validation
                 )
 
-            self.best_models[self.learner.uid] = self.learner.copy()
+            self.best_models[self.learner.uid] = self.learner.get_snapshot()
             # if local copy is not available, save model and keep path
             if self.best_models[self.learner.uid] is None:
                 self.best_model_paths[self.learner.uid] = self.learner.save()
@@ -25,6 +25,12 @@ class MetricLogger(Callback):
 
         self.current_learner_uid = learner.uid
 
+    def get_learner_state(self, learner):
+        return self.loss_values[learner.uid]
+
+    def set_learner_state(self, learner, state):
+        self.loss_values[learner.uid] = state
+
     def on_iteration_end(self, logs, predictions):
 
         for metric in self.metrics:
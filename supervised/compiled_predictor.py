@@ -0,0 +1,224 @@
+import logging
+import warnings
+import numpy as np
+import pandas as pd
+
+from supervised.algorithms.registry import BINARY_CLASSIFICATION
+from supervised.algorithms.registry import MULTICLASS_CLASSIFICATION
+from supervised.algorithms.registry import REGRESSION
+from supervised.exceptions import AutoMLException
+from supervised.preprocessing.compiled_preprocessing import CompiledPreprocessing
+from supervised.utils.config import LOG_LEVEL
+
+logger = logging.getLogger(__name__)
+logger.setLevel(LOG_LEVEL)
+
+
+class CompiledPredictor(object):
+    """Computes predictions for a single sample with the best AutoML model.
+
+    Preprocessing of each fold is compiled into `CompiledPreprocessing`,
+    transformed values are passed to learners as a NumPy array. Models that
+    can't be compiled (stacked models, text or datetime features, leave one
+    out encoding) are computed with the standard `AutoML` predict path.
+    """
+
+    def __init__(self, automl):
+        if automl._best_model is None:
+            automl.load(automl.results_path)
+        model = automl._best_model
+        if model is None:
+            raise AutoMLException(
+                "This model has not been fitted yet. Please call `fit()` first."
+            )
+        self._automl = automl
+        self._ml_task = automl._ml_task
+        self._columns = automl._data_info["columns"]
+        self._threshold = model._threshold
+        self._labels = None
+        # list of (frameworks, weight), frameworks is a list of
+        # (compiled preprocessing, [(learner, inverse target scaling)])
+        self._models = self._compile_models(model)
+        if self._models is not None:
+            self._labels = self._get_labels(model)
+
+    def is_compiled(self):
+        return self._models is not None
+
+    def predict_proba(self, x):
+        """Returns class probabilities for sample `x` (dict or 1-row array)."""
+        if self._ml_task == REGRESSION:
+            raise AutoMLException(
+                f"Method `predict_proba()` can only be used when in classification tasks. Current task: '{self._ml_task}'."
+            )
+        row = self._get_row(x)
+        if self._models is None:
+            return self._automl.predict_proba(pd.DataFrame([row]))[0]
+        return self._predict(row)
+
+    def predict(self, x):
+        """Returns label (classification) or value (regression) for sample `x`."""
+        row = self._get_row(x)
+        if self._models is None:
+            return self._automl.predict(pd.DataFrame([row]))[0]
+        y = self._predict(row)
+        if self._ml_task == BINARY_CLASSIFICATION:
+            return self._labels[1] if y[1] > self._threshold else self._labels[0]
+        if self._ml_task == MULTICLASS_CLASSIFICATION:
+            return self._labels[int(np.argmax(y))]
+        return y[0]
+
+    def _get_row(self, x):
+        if isinstance(x, dict) or isinstance(x, pd.Series):
+            for column in self._columns:
+                if column not in x:
+                    raise AutoMLException(
+                        f"Missing column: {column} in input data. Cannot predict"
+                    )
+            return {column: x[column] for column in self._columns}
+        values = np.asarray(x, dtype=object).ravel()
+        if values.shape[0] != len(self._columns):
+            raise ValueError(
+                f"Number of features of the model must match the input. Model n_features_in_ is {len(self._columns)} and input n_features is {values.shape[0]}. Reshape your data."
+            )
+        return dict(zip(self._columns, values.tolist()))
+
+    def _predict(self, row):
+        y_total, total_weight = None, 0.0
+        for frameworks, weight in self._models:
+            y_model, learners_cnt = None, 0
+            for compiled, learners in frameworks:
+                transformed = compiled.transform(row)
+                X_array = self._to_learner_input(transformed, learners)
+                for learner, inverse_scale_target in learners:
+                    X = X_array
+                    if learner.algorithm_short_name == "CatBoost":
+                        X = pd.DataFrame([transformed])
+                    with warnings.catch_warnings():
+                        # learners were trained on data with feature names
+                        warnings.simplefilter("ignore", category=UserWarning)
+                        if learner.algorithm_short_name == "Xgboost":
+                            y_p = learner.predict_inplace(X)
+                        else:
+                            y_p = learner.predict(X)
+                        y_p = np.asarray(y_p, dtype=np.float64)[0]
+                    if inverse_scale_target is not None:
+                        y_p = inverse_scale_target(y_p)
+                    y_model = y_p if y_model is None else y_model + y_p
+                    learners_cnt += 1
+            y_model = np.atleast_1d(y_model / float(learners_cnt))
+            if self._ml_task == BINARY_CLASSIFICATION:
+                y_model = np.array([1.0 - y_model[0], y_model[0]])
+            y_total = y_model * weight if y_total is None else y_total + y_model * weight
+            total_weight += weight
+        return y_total / total_weight
+
+    @staticmethod
+    def _to_learner_input(transformed, learners):
+        if all(l.algorithm_short_name == "CatBoost" for l, _ in learners):
+            return None
+        return np.array([list(transformed.values())], dtype=np.float64)
+
+    def _compile_models(self, model):
+        selected = [{"model": model, "repeat": 1}]
+        if model.get_type() == "Ensemble":
+            selected = model.selected_models
+        models = []
+        for s in selected:
+            mf = s["model"]
+            if mf._is_stacked or mf.get_type() == "Ensemble":
+                logger.info(f"Model {model.get_name()} can't be compiled")
+                return None
+            frameworks = self._compile_framework(mf)
+            if frameworks is None:
+                logger.info(f"Preprocessing of {mf.get_name()} can't be compiled")
+                return None
+            models += [(frameworks, float(s["repeat"]))]
+        return models
+
+    def _compile_framework(self, mf):
+        frameworks = []
+        for group in mf._get_preprocessings_groups():
+            preprocessing = mf.preprocessings[group[0]]
+            if not CompiledPreprocessing.is_supported(preprocessing):
+                return None
+            compiled = CompiledPreprocessing(preprocessing)
+            if not self._check(preprocessing, compiled):
+                return None
+            learners = [
+                (
+                    mf.learners[ind],
+                    CompiledPreprocessing.inverse_scale_target(
+                        mf.preprocessings[ind]
+                    ),
+                )
+                for ind in group
+            ]
+            frameworks += [(compiled, learners)]
+        return frameworks
+
+    def _check(self, preprocessing, compiled):
+        # compare compiled and standard preprocessing on a sample row
+        columns_info = self._automl._data_info.get("columns_info", {})
+        row = {}
+        for i, column in enumerate(self._columns):
+            if "categorical" in columns_info.get(column, []):
+                row[column] = self._get_category(preprocessing, column)
+            else:
+                row[column] = 1.0 + 0.1 * i
+        try:
+            expected, _, _ = preprocessing.transform(pd.DataFrame([row]), None)
+            transformed = compiled.transform(row)
+        except Exception as e:
+            logger.info(f"Cannot check compiled preprocessing. {str(e)}")
+            return False
+        if list(transformed.keys()) != expected.columns.tolist():
+            return False
+        for column, value in transformed.items():
+            expected_value = expected[column].iloc[0]
+            if isinstance(value, str) or isinstance(expected_value, str):
+                if value != expected_value:
+                    return False
+            elif not np.isclose(value, expected_value, equal_nan=True):
+                return False
+        return True
+
+    @staticmethod
+    def _get_category(preprocessing, column):
+        # a value seen in training, so it is encoded in the same way as in data
+        for convert in preprocessing._categorical:
+            lbl_params = (convert._convert_params or {}).get(column)
+            if lbl_params is None:
+                continue
+            if "unique_values" in lbl_params:
+                return lbl_params["unique_values"][-1]
+            return list(lbl_params.keys())[-1]
+        return "category"
+
+    def _get_labels(self, model):
+        if self._ml_task == REGRESSION:
+            return None
+        if model.get_type() == "Ensemble":
+            model = model.selected_models[0]["model"]
+        preprocessing = model.preprocessings[0]
+        if self._ml_task == BINARY_CLASSIFICATION:
+            columns = preprocessing.prepare_target_labels(np.array([0.5])).columns
+        else:
+            n_classes = self._automl._data_info["n_classes"]
+            columns = preprocessing.prepare_target_labels(
+                np.ones((1, n_classes)) / n_classes
+            ).columns
+        labels = [c[11:] for c in columns if c.startswith("prediction_")]
+        target_is_numeric = self._automl._data_info.get("target_is_numeric", False)
+        if self._ml_task == BINARY_CLASSIFICATION:
+            # the same labels as in AutoML predict
+            if labels == ["0", "1"]:
+                labels = [0, 1]
+            if target_is_numeric:
+                labels = [int(l) for l in labels]
+        elif target_is_numeric:
+            try:
+                labels = [int(np.int32(l)) for l in labels]
+            except Exception as e:
+                labels = [float(l) for l in labels]
+        return labels
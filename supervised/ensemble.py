@@ -15,6 +15,7 @@ from supervised.model_framework import ModelFramework
 from supervised.utils.metric import Metric
 from supervised.utils.config import LOG_LEVEL
 from supervised.utils.additional_metrics import AdditionalMetrics
+from supervised.utils.oof_store import OOFStore
 from supervised.exceptions import NotTrainedException
 
 logger = logging.getLogger(__name__)
@@ -60,9 +61,11 @@ class Ensemble:
         self._scores = []
         self.oof_predictions = None
         self._oof_predictions_fname = None
+        self._oof_predictions_view = None  # read-only predictions from OOFStore
         self._single_prediction_time = None  # prediction time on single sample
         self._max_single_prediction_time = max_single_prediction_time
         self.model_prediction_time = {}
+        self._oof_columns = None
 
     def get_train_time(self):
         return self.train_time
@@ -70,6 +73,9 @@ class Ensemble:
     def get_final_loss(self):
         return self.best_loss
 
+    def get_fidelity(self):
+        return 1.0
+
     def is_valid(self):
         return len(self.selected_models) > 1
 
@@ -118,8 +124,10 @@ class Ensemble:
             return self.oof_predictions.copy(deep=True)
 
         if self._oof_predictions_fname is not None:
-            self.oof_predictions = pd.read_csv(self._oof_predictions_fname)
-            return self.oof_predictions.copy(deep=True)
+            if self._oof_predictions_view is None:
+                self._oof_predictions_view = OOFStore.load(self._oof_predictions_fname)
+            # data is shared, only the DataFrame is copied
+            return self._oof_predictions_view.copy(deep=False)
 
         ensemble_oof = pd.DataFrame(
             data=self.total_best_sum, columns=self.total_best_sum.columns
@@ -131,12 +139,30 @@ class Ensemble:
         self.oof_predictions = ensemble_oof
         return ensemble_oof
 
-    def _get_mean(self, oof_selected, best_sum, best_count):
-        resp = copy.deepcopy(oof_selected)
-        if best_count > 1:
-            resp += best_sum
-            resp /= float(best_count)
-        return resp
+    def _get_scores(
+        self, oof_matrix, candidates, best_sum, best_count, y, sample_weight
+    ):
+        # score all candidates added to the current ensemble,
+        # candidates are scored in blocks to limit the memory usage
+        scores = []
+        block_size = max(1, int(2 ** 23 / best_sum.size))
+        for i in range(0, len(candidates), block_size):
+            block = candidates[i : i + block_size]
+            y_ens = oof_matrix[block] + best_sum
+            y_ens /= float(best_count)
+            block_scores = self.metric.batch(y, y_ens, sample_weight)
+            if block_scores is None:
+                # metric without vectorized version, score one by one
+                block_scores = [
+                    self.metric(
+                        y,
+                        pd.DataFrame(y_ens[k], columns=self._oof_columns),
+                        sample_weight,
+                    )
+                    for k in range(len(block))
+                ]
+            scores += list(block_scores)
+        return scores
 
     def get_oof_matrix(self, models):
         # remember models, will be needed in predictions
@@ -216,13 +242,23 @@ class Ensemble:
         selected_algs_cnt = 0  # number of selected algorithms
         self.best_algs = []  # selected algoritms indices from each loop
 
+        # all predictions in one array with shape (models, rows, columns)
+        model_names = list(oofs.keys())
+        first_oof = oofs[model_names[0]]
+        self._oof_columns = first_oof.columns
+        oof_matrix = np.empty((len(model_names),) + first_oof.shape, dtype=np.float32)
+        for i, model_name in enumerate(model_names):
+            oof_matrix[i] = oofs[model_name].values
+
         total_prediction_time = 0
-        best_sum = None  # sum of best algorihtms
+        best_sum = np.zeros(first_oof.shape)  # sum of best algorihtms
+        total_best_sum = None
         for j in range(len(oofs)):  # iterate over all solutions
             min_score = self.metric.get_maximum()
             best_model = None
             # try to add some algorithm to the best_sum to minimize metric
-            for model_name in oofs.keys():
+            candidates = []
+            for i, model_name in enumerate(model_names):
                 if (
                     self._max_single_prediction_time
                     and model_name in self.model_prediction_time
@@ -232,11 +268,15 @@ class Ensemble:
                         > self._max_single_prediction_time
                     ):
                         continue
-                y_ens = self._get_mean(oofs[model_name], best_sum, j + 1)
-                score = self.metric(y, y_ens, sample_weight)
+                candidates += [i]
+
+            scores = self._get_scores(
+                oof_matrix, candidates, best_sum, j + 1, y, sample_weight
+            )
+            for i, score in zip(candidates, scores):
                 if self.metric.improvement(previous=min_score, current=score):
                     min_score = score
-                    best_model = model_name
+                    best_model = i
 
             if best_model is None:
                 continue
@@ -251,13 +291,11 @@ class Ensemble:
                 self.best_loss = min_score
                 selected_algs_cnt = j
 
-            self.best_algs.append(best_model)  # save the best algoritm
+            self.best_algs.append(model_names[best_model])  # save the best algoritm
             # update best_sum value
-            best_sum = (
-                oofs[best_model] if best_sum is None else best_sum + oofs[best_model]
-            )
+            best_sum += oof_matrix[best_model]
             if j == selected_algs_cnt:
-                self.total_best_sum = copy.deepcopy(best_sum)
+                total_best_sum = best_sum.copy()
 
             # update prediction time estimate
             if self._max_single_prediction_time is not None:
@@ -273,7 +311,11 @@ class Ensemble:
             raise NotTrainedException("Ensemble wasn't fitted.")
 
         # keep oof predictions of ensemble
-        self.total_best_sum /= float(selected_algs_cnt + 1)
+        self.total_best_sum = pd.DataFrame(
+            total_best_sum / float(selected_algs_cnt + 1),
+            columns=self._oof_columns,
+            index=first_oof.index,
+        )
         self.best_algs = self.best_algs[: (selected_algs_cnt + 1)]
 
         logger.debug("Selected models for ensemble:")
@@ -290,7 +332,9 @@ class Ensemble:
 
         self.train_time = time.time() - start_time
 
-    def predict(self, X, X_stacked=None):
+    def predict(self, X, X_stacked=None, predictions_cache=None):
+        # predictions_cache keeps predictions on X computed by the caller,
+        # they are reused and new predictions are added to it
         logger.debug(
             "Ensemble.predict with {} models".format(len(self.selected_models))
         )
@@ -304,8 +348,20 @@ class Ensemble:
 
             if model._is_stacked:
                 y_predicted_from_model = model.predict(X_stacked)
+            elif (
+                predictions_cache is not None and model.get_name() in predictions_cache
+            ):
+                y_predicted_from_model = predictions_cache[model.get_name()]
             else:
-                y_predicted_from_model = model.predict(X)
+                if model.get_type() == "Ensemble":
+                    # ensemble of not stacked models, share the predictions with it
+                    y_predicted_from_model = model.predict(
+                        X, predictions_cache=predictions_cache
+                    )
+                else:
+                    y_predicted_from_model = model.predict(X)
+                if predictions_cache is not None:
+                    predictions_cache[model.get_name()] = y_predicted_from_model
 
             prediction_cols = []
             if self._ml_task in [BINARY_CLASSIFICATION, MULTICLASS_CLASSIFICATION]:
@@ -375,10 +431,9 @@ class Ensemble:
         model_path = os.path.join(results_path, model_subpath)
         logger.info(f"Save the ensemble to {model_path}")
 
-        predictions = self.get_out_of_folds()
-        predictions_fname = os.path.join(model_subpath, f"predictions_ensemble.csv")
-        self._oof_predictions_fname = os.path.join(results_path, predictions_fname)
-        predictions.to_csv(self._oof_predictions_fname, index=False)
+        predictions_fname = OOFStore.save(
+            results_path, model_subpath, self.get_out_of_folds()
+        )
 
         with open(os.path.join(model_path, "ensemble.json"), "w") as fout:
             ms = []
@@ -410,6 +465,10 @@ class Ensemble:
             self._additional_metrics, self._ml_task, self.model_markdown(), model_path
         )
 
+        # release predictions from memory, they are read from OOFStore from now on
+        self._oof_predictions_fname = os.path.join(results_path, predictions_fname)
+        self.oof_predictions = None
+
         with open(os.path.join(model_path, "status.txt"), "w") as fout:
             fout.write("ALL OK!")
 
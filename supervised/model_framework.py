@@ -14,12 +14,15 @@ from supervised.callbacks.callback_list import CallbackList
 from supervised.validation.validation_step import ValidationStep
 from supervised.algorithms.factory import AlgorithmFactory
 from supervised.preprocessing.preprocessing import Preprocessing
+from supervised.preprocessing.preprocessing_cache import PreprocessingCache
 from supervised.preprocessing.exclude_missing_target import ExcludeRowsMissingTarget
 from supervised.algorithms.registry import AlgorithmsRegistry
 from supervised.exceptions import AutoMLException
 from supervised.utils.config import LOG_LEVEL
 from supervised.utils.additional_metrics import AdditionalMetrics
 from supervised.utils.metric import Metric
+from supervised.utils.oof_store import OOFStore
+from supervised.utils.artifacts_cache import ArtifactsCache
 
 from supervised.algorithms.registry import (
     BINARY_CLASSIFICATION,
@@ -35,6 +38,7 @@ from supervised.utils.learning_curves import LearningCurves
 
 import optuna
 import joblib
+from sklearn.model_selection import train_test_split
 
 from supervised.tuner.optuna.tuner import OptunaTuner
 
@@ -75,11 +79,18 @@ class ModelFramework:
         self._threshold = None  # used only for binary classifiers
         self._max_time_for_learner = params.get("max_time_for_learner", 3600)
         self._oof_predictions_fname = None
+        self._oof_predictions_view = None  # read-only predictions from OOFStore
         self._single_prediction_time = None  # prediction time on single sample
+        self._preprocessings_groups = None  # learners with the same preprocessing
         self._optuna_time_budget = params.get("optuna_time_budget")
         self._optuna_init_params = params.get("optuna_init_params", {})
         self._optuna_verbose = params.get("optuna_verbose", True)
 
+        # reuse preprocessed folds from models with the same preprocessing
+        self._cache_preprocessing = self.validation_params.get(
+            "cache_preprocessing", False
+        ) and PreprocessingCache.is_cacheable(self.preprocessing_params)
+
         # the automl random state from AutoML constructor, used in Optuna optimizer
         self._automl_random_state = params.get("automl_random_state", 42)
 
@@ -158,165 +169,320 @@ class ModelFramework:
             )
 
         self.validation = ValidationStep(self.validation_params)
+        self.learner_params["explain_level"] = self._explain_level
 
         repeats = self.validation.get_repeats()
-        for repeat in range(repeats):
-            for k_fold in range(self.validation.get_n_splits()):
-                train_data, validation_data = self.validation.get_split(k_fold, repeat)
-                logger.debug(
-                    "Data split, train X:{} y:{}, validation X:{}, y:{}".format(
-                        train_data["X"].shape,
-                        train_data["y"].shape,
-                        validation_data["X"].shape,
-                        validation_data["y"].shape,
-                    )
+        folds = [
+            (k_fold, repeat)
+            for repeat in range(repeats)
+            for k_fold in range(self.validation.get_n_splits())
+        ]
+        # low fidelity model is trained only on the first folds
+        fidelity_folds = self.validation_params.get("fidelity_folds")
+        if fidelity_folds is not None:
+            folds = folds[:fidelity_folds]
+        parallel_folds = self._get_parallel_folds(optuna_tuner, len(folds))
+        if parallel_folds > 1:
+            self._train_folds_in_parallel(
+                results_path, model_subpath, folds, repeats, parallel_folds
+            )
+        else:
+            for k_fold, repeat in folds:
+                start_time += self._train_fold(
+                    results_path, model_subpath, k_fold, repeat, repeats, optuna_tuner
                 )
-                if "sample_weight" in train_data:
-                    logger.debug("Sample weight available during the training.")
-
-                # the proprocessing is done at every validation step
-                self.preprocessings += [
-                    Preprocessing(
-                        self.preprocessing_params, self.get_name(), k_fold, repeat
-                    )
-                ]
-
-                X_train, y_train, sample_weight = self.preprocessings[
-                    -1
-                ].fit_and_transform(
-                    train_data["X"], train_data["y"], train_data.get("sample_weight")
+
+        # end of validation loop
+        self.callbacks.on_framework_train_end()
+        # self.get_additional_metrics()
+        self._additional_metrics = self.get_additional_metrics()
+
+        self.train_time = time.time() - start_time
+        logger.debug("ModelFramework end of training")
+
+    def _fidelity_sample(self, train_data):
+        """Returns the sample of train rows used by the low fidelity model"""
+        fidelity_rows = self.validation_params.get("fidelity_rows")
+        if fidelity_rows is None or fidelity_rows >= 1.0:
+            return train_data
+        y = train_data["y"]
+        stratify = None
+        if self.validation_params.get("stratify", False):
+            stratify = y
+        try:
+            index, _ = train_test_split(
+                np.arange(y.shape[0]),
+                train_size=fidelity_rows,
+                stratify=stratify,
+                random_state=self.validation_params.get("random_seed", 1906),
+            )
+        except ValueError:
+            # too few samples in some class to stratify
+            index, _ = train_test_split(
+                np.arange(y.shape[0]),
+                train_size=fidelity_rows,
+                random_state=self.validation_params.get("random_seed", 1906),
+            )
+        index = np.sort(index)
+        return {k: v.iloc[index] for k, v in train_data.items()}
+
+    def _get_fold_seed(self, k_fold, repeat):
+        fold = repeat * self.validation.get_n_splits() + k_fold
+        return (self.learner_params["seed"] + fold) % (2 ** 32)
+
+    def _get_parallel_folds(self, optuna_tuner, folds_cnt):
+        parallel_folds = self.validation_params.get("parallel_folds", 1)
+        if parallel_folds is None or optuna_tuner is not None:
+            # Optuna tunes hyperparameters on the first fold and reuse them
+            return 1
+        return max(1, min(int(parallel_folds), folds_cnt))
+
+    def _train_folds_in_parallel(
+        self, results_path, model_subpath, folds, repeats, parallel_folds
+    ):
+        logger.debug(f"Train {len(folds)} folds in {parallel_folds} processes")
+        # split the threads between processes
+        n_jobs = self.learner_params.get("n_jobs", -1)
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = os.cpu_count() or 1
+        n_jobs = max(1, n_jobs // parallel_folds)
+
+        # the time constraint is checked after the first fold in each process,
+        # folds are trained in rounds of parallel_folds
+        learners_cnt = int(np.ceil(len(folds) / parallel_folds))
+
+        with joblib.parallel_backend("loky", inner_max_num_threads=n_jobs):
+            results = joblib.Parallel(n_jobs=parallel_folds)(
+                joblib.delayed(_train_fold_in_worker)(
+                    self,
+                    results_path,
+                    model_subpath,
+                    k_fold,
+                    repeat,
+                    repeats,
+                    n_jobs,
+                    learners_cnt,
                 )
-                (
-                    X_validation,
-                    y_validation,
-                    sample_weight_validation,
-                ) = self.preprocessings[-1].transform(
+                for k_fold, repeat in folds
+            )
+
+        # merge results in the same order as in sequential training
+        for preprocessing, learner, callbacks_state in results:
+            self.preprocessings += [preprocessing]
+            self.learners += [learner]
+            self.callbacks.add_and_set_learner(learner)
+            for cb, state in zip(self.callbacks.callbacks, callbacks_state):
+                cb.set_learner_state(learner, state)
+
+    def _train_fold(
+        self, results_path, model_subpath, k_fold, repeat, repeats, optuna_tuner=None
+    ):
+        """Train the learner on a single fold, returns the time of Optuna tuning."""
+        # the global random state depends only on the fold,
+        # folds trained in parallel are the same as in sequential training
+        np.random.seed(self._get_fold_seed(k_fold, repeat))
+        optuna_time = 0
+        preprocessing_key, cached = None, None
+        if self._cache_preprocessing:
+            preprocessing_key = PreprocessingCache.get_key(
+                results_path,
+                self.preprocessing_params,
+                self.validation_params,
+                k_fold,
+                repeat,
+            )
+            cached = PreprocessingCache.get(preprocessing_key)
+
+        if cached is not None:
+            logger.debug("Reuse preprocessed data from cache")
+            preprocessing, train_data, validation_data = cached
+            self.preprocessings += [preprocessing]
+            X_train, y_train, sample_weight = (
+                train_data["X"],
+                train_data["y"],
+                train_data["sample_weight"],
+            )
+            X_validation, y_validation, sample_weight_validation = (
+                validation_data["X"],
+                validation_data["y"],
+                validation_data["sample_weight"],
+            )
+        else:
+            train_data, validation_data = self.validation.get_split(k_fold, repeat)
+            train_data = self._fidelity_sample(train_data)
+            logger.debug(
+                "Data split, train X:{} y:{}, validation X:{}, y:{}".format(
+                    train_data["X"].shape,
+                    train_data["y"].shape,
+                    validation_data["X"].shape,
+                    validation_data["y"].shape,
+                )
+            )
+            if "sample_weight" in train_data:
+                logger.debug("Sample weight available during the training.")
+
+            # the proprocessing is done at every validation step
+            self.preprocessings += [
+                Preprocessing(
+                    self.preprocessing_params,
+                    self.get_name(),
+                    k_fold,
+                    repeat,
+                    ArtifactsCache.from_params(self.validation_params),
+                )
+            ]
+
+            X_train, y_train, sample_weight = self.preprocessings[-1].fit_and_transform(
+                train_data["X"], train_data["y"], train_data.get("sample_weight")
+            )
+            (
+                X_validation,
+                y_validation,
+                sample_weight_validation,
+            ) = self.preprocessings[-1].transform(
+                validation_data["X"],
+                validation_data["y"],
+                validation_data.get("sample_weight"),
+            )
+
+            if preprocessing_key is not None:
+                # cached values are not copied, the copies are used from now on
+                preprocessing, train_data, validation_data = PreprocessingCache.set(
+                    preprocessing_key,
+                    self.preprocessings[-1],
+                    {"X": X_train, "y": y_train, "sample_weight": sample_weight},
+                    {
+                        "X": X_validation,
+                        "y": y_validation,
+                        "sample_weight": sample_weight_validation,
+                    },
+                )
+                self.preprocessings[-1] = preprocessing
+                X_train, y_train, sample_weight = (
+                    train_data["X"],
+                    train_data["y"],
+                    train_data["sample_weight"],
+                )
+                X_validation, y_validation, sample_weight_validation = (
                     validation_data["X"],
                     validation_data["y"],
-                    validation_data.get("sample_weight"),
+                    validation_data["sample_weight"],
                 )
 
-                if optuna_tuner is not None:
-                    optuna_start_time = time.time()
-                    self.learner_params = optuna_tuner.optimize(
-                        self.learner_params.get("model_type", ""),
-                        self.params.get("data_type", ""),
-                        X_train,
-                        y_train,
-                        sample_weight,
-                        X_validation,
-                        y_validation,
-                        sample_weight_validation,
-                        self.learner_params,
-                    )
-                    # exclude optuna optimize time from model training
-                    start_time += time.time() - optuna_start_time
-
-                self.learner_params["explain_level"] = self._explain_level
-                self.learners += [
-                    AlgorithmFactory.get_algorithm(copy.deepcopy(self.learner_params))
-                ]
-                learner = self.learners[-1]
-                learner.set_learner_name(k_fold, repeat, repeats)
-
-                self.callbacks.add_and_set_learner(learner)
-                self.callbacks.on_learner_train_start()
-
-                log_to_file = os.path.join(
-                    results_path, model_subpath, f"{learner.name}_training.log"
-                )
+        if optuna_tuner is not None:
+            optuna_start_time = time.time()
+            self.learner_params = optuna_tuner.optimize(
+                self.learner_params.get("model_type", ""),
+                self.params.get("data_type", ""),
+                X_train,
+                y_train,
+                sample_weight,
+                X_validation,
+                y_validation,
+                sample_weight_validation,
+                self.learner_params,
+            )
+            # exclude optuna optimize time from model training
+            optuna_time += time.time() - optuna_start_time
 
-                for i in range(learner.max_iters):
-
-                    self.callbacks.on_iteration_start()
-
-                    learner.fit(
-                        X_train,
-                        y_train,
-                        sample_weight,
-                        X_validation,
-                        y_validation,
-                        sample_weight_validation,
-                        log_to_file,
-                        self._max_time_for_learner,
-                    )
-
-                    if self.params.get("injected_sample_weight", False):
-                        # print("Dont use sample weight in model evaluation")
-                        sample_weight = None
-                        sample_weight_validation = None
-
-                    self.callbacks.on_iteration_end(
-                        {"iter_cnt": i},
-                        self.predictions(
-                            learner,
-                            self.preprocessings[-1],
-                            X_train,
-                            y_train,
-                            sample_weight,
-                            X_validation,
-                            y_validation,
-                            sample_weight_validation,
-                        ),
-                    )
-
-                    if learner.stop_training:
-                        break
-                    learner.update({"step": i})
-
-                # end of learner iters loop
-                self.callbacks.on_learner_train_end()
-
-                model_path = os.path.join(results_path, model_subpath)
-                learner.interpret(
+        self.learners += [
+            AlgorithmFactory.get_algorithm(copy.deepcopy(self.learner_params))
+        ]
+        learner = self.learners[-1]
+        learner.set_learner_name(k_fold, repeat, repeats)
+
+        self.callbacks.add_and_set_learner(learner)
+        self.callbacks.on_learner_train_start()
+
+        log_to_file = os.path.join(
+            results_path, model_subpath, f"{learner.name}_training.log"
+        )
+
+        for i in range(learner.max_iters):
+
+            self.callbacks.on_iteration_start()
+
+            learner.fit(
+                X_train,
+                y_train,
+                sample_weight,
+                X_validation,
+                y_validation,
+                sample_weight_validation,
+                log_to_file,
+                self._max_time_for_learner,
+            )
+
+            if self.params.get("injected_sample_weight", False):
+                # print("Dont use sample weight in model evaluation")
+                sample_weight = None
+                sample_weight_validation = None
+
+            self.callbacks.on_iteration_end(
+                {"iter_cnt": i},
+                self.predictions(
+                    learner,
+                    self.preprocessings[-1],
                     X_train,
                     y_train,
+                    sample_weight,
                     X_validation,
                     y_validation,
-                    model_file_path=model_path,
-                    learner_name=learner.name,
-                    class_names=self.preprocessings[-1].get_target_class_names(),
-                    metric_name=self.get_metric_name(),
-                    ml_task=self._ml_task,
-                    explain_level=self._explain_level,
-                )
+                    sample_weight_validation,
+                ),
+            )
 
-                # save learner and free the memory
-                p = os.path.join(model_path, learner.get_fname())
-                learner.save(p)
-                del learner.model
-                learner.model = None
-                # end of learner training
-
-                # clear data
-                del X_train
-                del y_train
-                del X_validation
-                del y_validation
-
-                if sample_weight is not None:
-                    del sample_weight
-                    del train_data["sample_weight"]
-                if sample_weight_validation is not None:
-                    del sample_weight_validation
-                    del validation_data["sample_weight"]
-
-                del train_data["X"]
-                del train_data["y"]
-                del validation_data["X"]
-                del validation_data["y"]
-                del train_data
-                del validation_data
-
-                gc.collect()
+            if learner.stop_training:
+                break
+            learner.update({"step": i})
 
-        # end of validation loop
-        self.callbacks.on_framework_train_end()
-        # self.get_additional_metrics()
-        self._additional_metrics = self.get_additional_metrics()
+        # end of learner iters loop
+        self.callbacks.on_learner_train_end()
 
-        self.train_time = time.time() - start_time
-        logger.debug("ModelFramework end of training")
+        model_path = os.path.join(results_path, model_subpath)
+        learner.interpret(
+            X_train,
+            y_train,
+            X_validation,
+            y_validation,
+            model_file_path=model_path,
+            learner_name=learner.name,
+            class_names=self.preprocessings[-1].get_target_class_names(),
+            metric_name=self.get_metric_name(),
+            ml_task=self._ml_task,
+            explain_level=self._explain_level,
+        )
+
+        # save learner and free the memory
+        p = os.path.join(model_path, learner.get_fname())
+        learner.save(p)
+        del learner.model
+        learner.model = None
+        # end of learner training
+
+        # clear data
+        del X_train
+        del y_train
+        del X_validation
+        del y_validation
+
+        if sample_weight is not None:
+            del sample_weight
+            del train_data["sample_weight"]
+        if sample_weight_validation is not None:
+            del sample_weight_validation
+            del validation_data["sample_weight"]
+
+        del train_data["X"]
+        del train_data["y"]
+        del validation_data["X"]
+        del validation_data["y"]
+        del train_data
+        del validation_data
+
+        gc.collect()
+
+        return optuna_time
 
     def release_learners(self):
         for learner in self.learners:
@@ -344,8 +510,10 @@ class ModelFramework:
             return self.oof_predictions.copy(deep=True)
 
         if self._oof_predictions_fname is not None:
-            self.oof_predictions = pd.read_csv(self._oof_predictions_fname)
-            return self.oof_predictions.copy(deep=True)
+            if self._oof_predictions_view is None:
+                self._oof_predictions_view = OOFStore.load(self._oof_predictions_fname)
+            # data is shared, only the DataFrame is copied
+            return self._oof_predictions_view.copy(deep=False)
 
         early_stopping = self.callbacks.get("early_stopping")
         if early_stopping is None:
@@ -405,6 +573,17 @@ class ModelFramework:
         If Ensemble has only 1 model in it, then Ensemble shouldn't be used as best model"""
         return True
 
+    def get_fidelity(self):
+        """Returns the fraction of learners and train rows used by the model,
+        it is 1.0 for the model with full validation"""
+        fidelity = 1.0
+        fidelity_folds = self.validation_params.get("fidelity_folds")
+        if fidelity_folds is not None:
+            k_folds = self.validation_params.get("k_folds", 5)
+            repeats = self.validation_params.get("repeats", 1)
+            fidelity *= min(1.0, fidelity_folds / (k_folds * repeats))
+        return fidelity * self.validation_params.get("fidelity_rows", 1.0)
+
     def is_fast_enough(self, max_single_prediction_time):
         # dont need to check
         if max_single_prediction_time is None:
@@ -416,22 +595,41 @@ class ModelFramework:
 
         return self._single_prediction_time < max_single_prediction_time
 
+    def _get_preprocessings_groups(self):
+        # fold preprocessings with the same state transform data in the same way,
+        # returns lists of learners indices that can share the transformed data
+        if self._preprocessings_groups is None or sum(
+            len(g) for g in self._preprocessings_groups
+        ) != len(self.preprocessings):
+            groups = {}
+            for ind, preprocessing in enumerate(self.preprocessings):
+                key = json.dumps(preprocessing.to_json(), sort_keys=True, default=str)
+                groups[key] = groups.get(key, []) + [ind]
+            self._preprocessings_groups = list(groups.values())
+        return self._preprocessings_groups
+
     def predict(self, X):
         logger.debug("ModelFramework.predict")
 
         if self.learners is None or len(self.learners) == 0:
             raise Exception("Learnes are not initialized")
         # run predict on all learners and return the average
-        y_predicted = None  # np.zeros((X.shape[0],))
-        for ind, learner in enumerate(self.learners):
-            # preprocessing goes here
-            X_data, _, _ = self.preprocessings[ind].transform(X.copy(), None)
-            y_p = learner.predict(X_data)
-            y_p = self.preprocessings[ind].inverse_scale_target(y_p)
-
-            y_predicted = y_p if y_predicted is None else y_predicted + y_p
-
-        y_predicted_average = y_predicted / float(len(self.learners))
+        y_predicted = None
+        for group in self._get_preprocessings_groups():
+            # preprocessing goes here, once for learners with the same preprocessing
+            X_data, _, _ = self.preprocessings[group[0]].transform(X.copy(), None)
+            for ind in group:
+                y_p = self.learners[ind].predict(X_data)
+                y_p = self.preprocessings[ind].inverse_scale_target(y_p)
+
+                if y_predicted is None:
+                    y_predicted = np.array(y_p, dtype=np.float64)
+                else:
+                    y_predicted += np.asarray(y_p)
+            del X_data
+
+        y_predicted /= float(len(self.learners))
+        y_predicted_average = y_predicted
 
         y_predicted_final = self.preprocessings[0].prepare_target_labels(
             y_predicted_average
@@ -474,15 +672,9 @@ class ModelFramework:
         model_path = os.path.join(results_path, model_subpath)
         logger.info(f"Save the model {model_path}")
 
-        type_of_predictions = (
-            "validation" if "k_folds" not in self.validation_params else "out_of_folds"
+        predictions_fname = OOFStore.save(
+            results_path, model_subpath, self.get_out_of_folds()
         )
-        predictions_fname = os.path.join(
-            model_subpath, f"predictions_{type_of_predictions}.csv"
-        )
-        self._oof_predictions_fname = os.path.join(results_path, predictions_fname)
-        predictions = self.get_out_of_folds()
-        predictions.to_csv(self._oof_predictions_fname, index=False)
 
         saved = [os.path.join(model_subpath, l.get_fname()) for l in self.learners]
 
@@ -527,6 +719,13 @@ class ModelFramework:
             self._additional_metrics, self._ml_task, self.model_markdown(), model_path
         )
 
+        # release predictions from memory, they are read from OOFStore from now on
+        self._oof_predictions_fname = os.path.join(results_path, predictions_fname)
+        self.oof_predictions = None
+        early_stopping = self.callbacks.get("early_stopping")
+        if early_stopping is not None:
+            early_stopping.best_y_oof = None
+
         with open(os.path.join(model_path, "status.txt"), "w") as fout:
             fout.write("ALL OK!")
         # I'm adding save time to total train time
@@ -589,10 +788,47 @@ class ModelFramework:
             l = AlgorithmFactory.load(learner_desc, learner_path, lazy_load)
             mf.learners += [l]
 
+        # folds with the same preprocessing share one object
+        preprocessings = {}
         mf.preprocessings = []
         for p in json_desc.get("preprocessing"):
-            ps = Preprocessing()
-            ps.from_json(p, results_path)
-            mf.preprocessings += [ps]
+            key = json.dumps(p, sort_keys=True, default=str)
+            if key not in preprocessings:
+                ps = Preprocessing()
+                ps.from_json(p, results_path)
+                preprocessings[key] = ps
+            mf.preprocessings += [preprocessings[key]]
 
         return mf
+
+
+def _train_fold_in_worker(
+    framework,
+    results_path,
+    model_subpath,
+    k_fold,
+    repeat,
+    repeats,
+    n_jobs,
+    learners_cnt,
+):
+    # the framework is a copy, the training results are returned to the main process
+    original_n_jobs = framework.learner_params.get("n_jobs")
+    if original_n_jobs is not None:
+        framework.learner_params["n_jobs"] = n_jobs
+    time_constraint = framework.callbacks.get("total_time_constraint")
+    if time_constraint is not None:
+        time_constraint.expected_learners_cnt = min(
+            time_constraint.expected_learners_cnt, learners_cnt
+        )
+
+    framework._train_fold(results_path, model_subpath, k_fold, repeat, repeats)
+
+    learner = framework.learners[-1]
+    if original_n_jobs is not None:
+        # keep the same params as in sequential training
+        learner.params["n_jobs"] = original_n_jobs
+    callbacks_state = [
+        cb.get_learner_state(learner) for cb in framework.callbacks.callbacks
+    ]
+    return framework.preprocessings[-1], learner, callbacks_state
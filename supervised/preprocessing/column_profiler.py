@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+
+class ColumnProfiler(object):
+    """Computes statistics of columns used in type decisions.
+
+    Each column is read once: null count, dtype class, number of unique
+    values (exact up to `UNIQUE_CAP`, estimated with HyperLogLog above it),
+    0/1 detection and min, max, mean, std and skew for numeric columns.
+    Columns are profiled in threads.
+    """
+
+    UNIQUE_CAP = 10000
+    CHUNK_SIZE = 1000000
+    HLL_PRECISION = 14
+    PARALLEL_ROWS = 100000  # smaller data is profiled in one thread
+
+    FLOAT = "float"
+    INT = "int"
+    DATETIME = "datetime"
+    CATEGORY = "category"
+    OBJECT = "object"
+
+    @staticmethod
+    def dtype_class(dtype):
+        dtype = str(dtype)
+        if dtype.startswith("float"):
+            return ColumnProfiler.FLOAT
+        if dtype.startswith("int") or dtype.startswith("uint"):
+            return ColumnProfiler.INT
+        if dtype.startswith("datetime"):
+            return ColumnProfiler.DATETIME
+        if dtype.startswith("category"):
+            return ColumnProfiler.CATEGORY
+        return ColumnProfiler.OBJECT
+
+    @staticmethod
+    def count_unique(x, cap=UNIQUE_CAP):
+        """Returns the number of unique values and the unique values.
+
+        The count is exact up to `cap` (no limit for None), above it
+        the count is estimated and unique values are None."""
+        values = np.asarray(x)
+        uniques = values[:0]
+        for start in range(0, values.shape[0], ColumnProfiler.CHUNK_SIZE):
+            chunk = pd.unique(values[start : start + ColumnProfiler.CHUNK_SIZE])
+            uniques = pd.unique(np.concatenate([uniques, chunk]))
+            if cap is not None and len(uniques) > cap:
+                try:
+                    hashes = pd.util.hash_array(values)
+                except TypeError:
+                    return len(pd.unique(values)), None
+                return ColumnProfiler._hyperloglog(hashes), None
+        return len(uniques), uniques
+
+    @staticmethod
+    def _hyperloglog(hashes):
+        p = ColumnProfiler.HLL_PRECISION
+        m = 1 << p
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        register = (hashes >> np.uint64(64 - p)).astype(np.int64)
+        # the guard bit keeps the remaining bits non zero
+        rest = (hashes << np.uint64(p)) | np.uint64(1 << (p - 1))
+        rank = 64 - np.floor(np.log2(rest.astype(np.float64))).astype(np.int64)
+        rank = np.minimum(rank, 64 - p + 1)
+        # maximum rank in each register
+        seen = np.bincount(register * 66 + rank, minlength=m * 66).reshape(m, 66) > 0
+        registers = 65 - np.argmax(seen[:, ::-1], axis=1)
+        registers[~seen.any(axis=1)] = 0
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -registers)
+        zeros = np.sum(registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+    @staticmethod
+    def profile(x, unique_cap=UNIQUE_CAP):
+        """Returns dict with statistics of the column `x`."""
+        null_mask = pd.isnull(x)
+        nulls = int(np.sum(null_mask))
+        dtype_class = ColumnProfiler.dtype_class(x.dtype)
+        values = x[~null_mask] if nulls else x
+        profile = {
+            "rows": int(x.shape[0]),
+            "nulls": nulls,
+            "dtype_class": dtype_class,
+            "unique": 0,
+            "is_0_1": False,
+        }
+        if values.shape[0] == 0:
+            return profile
+
+        unique_cnt, uniques = ColumnProfiler.count_unique(values, unique_cap)
+        profile["unique"] = unique_cnt
+        if uniques is not None and unique_cnt == 2:
+            uniques = np.asarray(uniques)
+            profile["is_0_1"] = bool(0 in uniques and 1 in uniques)
+
+        if dtype_class in [ColumnProfiler.FLOAT, ColumnProfiler.INT]:
+            v = np.asarray(values, dtype=np.float64)
+            mean = float(np.mean(v))
+            centered = v - mean
+            m2 = float(np.mean(centered ** 2))
+            m3 = float(np.mean(centered ** 3))
+            profile["min"] = float(np.min(v))
+            profile["max"] = float(np.max(v))
+            profile["mean"] = mean
+            profile["std"] = float(np.sqrt(m2))
+            profile["skew"] = m3 / m2 ** 1.5 if m2 > 0 else 0.0
+        return profile
+
+    @staticmethod
+    def profile_frame(X, n_jobs=-1):
+        """Returns dict with profiles of all columns in `X`."""
+        if X.shape[0] < ColumnProfiler.PARALLEL_ROWS:
+            n_jobs = 1
+        # pandas and numpy release GIL in most of computations
+        profiles = Parallel(n_jobs=n_jobs, backend="threading")(
+            delayed(ColumnProfiler.profile)(X[col]) for col in X.columns
+        )
+        return dict(zip(X.columns, profiles))
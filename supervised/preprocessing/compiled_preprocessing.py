@@ -0,0 +1,217 @@
+import numpy as np
+
+from supervised.preprocessing.preprocessing_categorical import PreprocessingCategorical
+from supervised.preprocessing.scale import Scale
+
+
+def _is_null(value):
+    return value is None or (
+        isinstance(value, (float, np.floating)) and np.isnan(value)
+    )
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.number)) and not isinstance(
+        value, (bool, np.bool_)
+    )
+
+
+class CompiledPreprocessing(object):
+    """Applies fitted `Preprocessing` to a single row.
+
+    The row is a dict with column names as keys, its order of keys is the
+    same as the order of columns in a DataFrame transformed by
+    `Preprocessing.transform`. Encoders and scalers are converted into
+    lookup tables and NumPy arrays once, so there is no DataFrame and no
+    encoder built from JSON per row.
+    """
+
+    CLIP_MIN = np.finfo(np.float32).min + 1000
+    CLIP_MAX = np.finfo(np.float32).max - 1000
+
+    def __init__(self, preprocessing):
+        self._steps = []
+        self._compile(preprocessing)
+
+    @staticmethod
+    def is_supported(preprocessing):
+        if preprocessing._add_random_feature:
+            return False
+        if any(t is not None for t in preprocessing._text_transforms):
+            return False
+        if any(t is not None for t in preprocessing._datetime_transforms):
+            return False
+        for convert in preprocessing._categorical:
+            if (
+                convert is not None
+                and convert._convert_method == PreprocessingCategorical.CONVERT_LOO
+                and convert._columns
+            ):
+                return False
+        if preprocessing._kmeans is not None and preprocessing._kmeans._kmeans is None:
+            return False
+        return True
+
+    def transform(self, row):
+        row = dict(row)
+        for step in self._steps:
+            step(row)
+        return row
+
+    def _compile(self, preprocessing):
+        # the same order of steps as in Preprocessing.transform
+        if preprocessing._remove_columns:
+            self._steps += [self._drop(preprocessing._remove_columns)]
+        for missing in preprocessing._missing_values:
+            if missing is not None and missing._na_fill_params:
+                self._steps += [self._fill_missing(missing._na_fill_params)]
+        if preprocessing._fill_values:
+            self._steps += [self._fill_missing(preprocessing._fill_values)]
+        if preprocessing._golden_features is not None:
+            self._steps += [
+                self._golden_features(preprocessing._golden_features._new_features)
+            ]
+        if preprocessing._kmeans is not None:
+            self._steps += [self._kmeans(preprocessing._kmeans)]
+        for convert in preprocessing._categorical:
+            if convert is not None and convert._convert_params:
+                self._steps += [self._categorical(convert._convert_params)]
+        for scale in preprocessing._scale:
+            if scale is not None and len(scale.columns):
+                self._steps += [self._scale(scale)]
+        if preprocessing._drop_features:
+            self._steps += [self._drop(preprocessing._drop_features)]
+        self._steps += [self._clip]
+
+    @staticmethod
+    def _drop(columns):
+        def step(row):
+            for column in columns:
+                row.pop(column, None)
+
+        return step
+
+    @staticmethod
+    def _fill_missing(fill_params):
+        def step(row):
+            for column, value in fill_params.items():
+                if _is_null(row[column]):
+                    row[column] = value
+
+        return step
+
+    @staticmethod
+    def _golden_features(new_features):
+        features = [
+            (
+                "_".join([f["feature1"], f["operation"], f["feature2"]]),
+                f["feature1"],
+                f["operation"],
+                f["feature2"],
+            )
+            for f in new_features
+        ]
+
+        def step(row):
+            for new_column, feature1, operation, feature2 in features:
+                a, b = row[feature1], row[feature2]
+                if operation == "diff":
+                    row[new_column] = a - b
+                elif operation == "ratio":
+                    a, b = float(a), float(b)
+                    row[new_column] = a / b if b != 0 else 0.0
+                elif operation == "sum":
+                    row[new_column] = a + b
+                elif operation == "multiply":
+                    row[new_column] = a * b
+
+        return step
+
+    @staticmethod
+    def _kmeans(kmeans):
+        input_columns = kmeans._input_columns
+        mean = np.array(kmeans._scale.mean_, dtype=np.float64)
+        scale = np.array(kmeans._scale.scale_, dtype=np.float64)
+        centers = np.array(kmeans._kmeans.cluster_centers_, dtype=np.float64)
+        new_features = kmeans._new_features
+
+        def step(row):
+            x = np.array([row[c] for c in input_columns], dtype=np.float64)
+            x = (x - mean) / scale
+            distances = np.sqrt(np.sum((centers - x) ** 2, axis=1))
+            for column, distance in zip(new_features[:-1], distances):
+                row[column] = distance
+            row[new_features[-1]] = int(np.argmin(distances))
+
+        return step
+
+    @staticmethod
+    def _categorical(convert_params):
+        encoders = []
+        for column, lbl_params in convert_params.items():
+            if "unique_values" in lbl_params and "new_columns" in lbl_params:
+                values = lbl_params["unique_values"]
+                if len(values) == 2:
+                    values = values[1:]
+                encoders += [
+                    (column, None, [(f"{column}_{v}", v) for v in values])
+                ]
+            else:
+                table = dict(lbl_params)
+                if len(table) == 2 and "False" in table and "True" in table:
+                    table = {False: 0, True: 1}
+                encoders += [(column, table, None)]
+
+        def step(row):
+            for column, table, new_columns in encoders:
+                value = row[column]
+                if table is not None:
+                    # not seen values get the next integer, like in LabelEncoder
+                    row[column] = table.get(value, len(table))
+                else:
+                    for new_column, v in new_columns:
+                        row[new_column] = int(value == v)
+                    del row[column]
+
+        return step
+
+    @staticmethod
+    def _scale(scale):
+        columns = scale.columns
+        mean = np.array(scale.scale.mean_, dtype=np.float64)
+        std = np.array(scale.scale.scale_, dtype=np.float64)
+        min_values = None
+        if scale.scale_method == Scale.SCALE_LOG_AND_NORMAL:
+            min_values = np.array(scale.X_min_values, dtype=np.float64)
+
+        def step(row):
+            x = np.array([row[c] for c in columns], dtype=np.float64)
+            if min_values is not None:
+                x = np.log(np.clip(x - min_values + 1, a_min=1, a_max=None))
+            x = (x - mean) / std
+            for column, value in zip(columns, x.tolist()):
+                row[column] = value
+
+        return step
+
+    @staticmethod
+    def _clip(row):
+        for column, value in row.items():
+            if _is_number(value):
+                row[column] = min(
+                    max(value, CompiledPreprocessing.CLIP_MIN),
+                    CompiledPreprocessing.CLIP_MAX,
+                )
+
+    @staticmethod
+    def inverse_scale_target(preprocessing):
+        """Returns function that inverts target scaling of regression."""
+        scale_y = preprocessing._scale_y
+        if scale_y is None:
+            return None
+        mean = float(scale_y.scale.mean_[0])
+        std = float(scale_y.scale.scale_[0])
+        if scale_y.scale_method == Scale.SCALE_LOG_AND_NORMAL:
+            min_value = float(scale_y.X_min_values[0])
+            return lambda y: np.exp(y * std + mean) + min_value - 1
+        return lambda y: y * std + mean
@@ -13,10 +13,11 @@ class EncodingSelector:
     """
 
     @staticmethod
-    def get(X, y, column):
+    def get(X, y, column, unique_cnt=None):
         # return PreprocessingCategorical.CONVERT_LOO
         try:
-            unique_cnt = len(np.unique(X.loc[~pd.isnull(X[column]), column]))
+            if unique_cnt is None:
+                unique_cnt = len(np.unique(X.loc[~pd.isnull(X[column]), column]))
             if unique_cnt <= 20:
                 return PreprocessingCategorical.FEW_CATEGORIES
         except Exception as e:
@@ -0,0 +1,227 @@
+import numpy as np
+from joblib import Parallel, delayed
+
+from supervised.algorithms.registry import REGRESSION
+
+
+class GoldenFeaturesScorer(object):
+    """Scores features created from pairs of columns.
+
+    Each new feature is scored with a decision tree of depth 3 trained on
+    the train sample and evaluated on the test sample (log loss or mean
+    squared error). Trees are grown on histograms of the feature values
+    for a block of features at once. When there are many candidates,
+    features are screened by the correlation with the target first and
+    only the best of them are scored with trees.
+    """
+
+    OPERATIONS = ["diff", "ratio", "ratio_reversed", "sum", "multiply"]
+    BINS = 64
+    MAX_DEPTH = 3
+    BLOCK_SIZE = 500  # features scored at once
+    MAX_SCORED_FEATURES = 10000  # features scored with trees after screening
+    SCREEN_SAMPLES = 1000  # train samples used in screening
+    EPS = 1e-15
+
+    def __init__(self, X_train, y_train, X_test, y_test, ml_task, n_jobs=-1):
+        # read-only arrays shared by all blocks
+        self._X_train = np.asarray(X_train, dtype=np.float64)
+        self._X_test = np.asarray(X_test, dtype=np.float64)
+        self._regression = ml_task == REGRESSION
+        y_train, y_test = np.asarray(y_train), np.asarray(y_test)
+        if self._regression:
+            y_train = y_train.astype(np.float64)
+            self._y_test = y_test.astype(np.float64)
+            # statistics in bins: count, sum and sum of squares
+            self._Y_train = np.column_stack(
+                [np.ones(y_train.shape[0]), y_train, y_train ** 2]
+            )
+            self._y_screen = y_train.reshape(-1, 1)
+        else:
+            classes = np.unique(y_train)
+            codes_train = np.searchsorted(classes, y_train)
+            self._y_test = np.searchsorted(classes, y_test)
+            # statistics in bins: count of each class
+            self._Y_train = np.zeros((y_train.shape[0], len(classes)))
+            self._Y_train[np.arange(y_train.shape[0]), codes_train] = 1.0
+            self._y_screen = self._Y_train if len(classes) > 2 else self._Y_train[:, 1:]
+        self._n_jobs = n_jobs
+
+    def score(self, pairs):
+        """Returns array (len(pairs), 5) with scores of new features for
+        column index pairs, in the order of `OPERATIONS`. Not scored features
+        have NaN score."""
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        n_ops = len(GoldenFeaturesScorer.OPERATIONS)
+        # each feature is (pair index, operation index)
+        features = np.column_stack(
+            [
+                np.repeat(np.arange(pairs.shape[0]), n_ops),
+                np.tile(np.arange(n_ops), pairs.shape[0]),
+            ]
+        )
+        if features.shape[0] > GoldenFeaturesScorer.MAX_SCORED_FEATURES:
+            screen = np.concatenate(
+                self._run_blocks(self._screen_block, pairs, features)
+            )
+            selected = np.argsort(-screen, kind="stable")[
+                : GoldenFeaturesScorer.MAX_SCORED_FEATURES
+            ]
+            features = features[np.sort(selected)]
+        scores = np.full((pairs.shape[0], n_ops), np.nan)
+        if features.shape[0]:
+            scores[features[:, 0], features[:, 1]] = np.concatenate(
+                self._run_blocks(self._score_block, pairs, features)
+            )
+        return scores
+
+    def _run_blocks(self, function, pairs, features):
+        block_size = GoldenFeaturesScorer.BLOCK_SIZE
+        blocks = [
+            features[i : i + block_size]
+            for i in range(0, features.shape[0], block_size)
+        ]
+        # numpy releases GIL, threads share the data
+        return Parallel(n_jobs=self._n_jobs, backend="threading")(
+            delayed(function)(pairs, block) for block in blocks
+        )
+
+    @staticmethod
+    def compute(X, pairs, features):
+        """Returns array with new features computed from columns of `X`.
+        Each feature is (pair index, operation index)."""
+        a = X[:, pairs[features[:, 0], 0]]
+        b = X[:, pairs[features[:, 0], 1]]
+        ops = features[:, 1]
+        values = np.empty_like(a)
+        with np.errstate(all="ignore"):
+            for i, (x1, x2) in enumerate([(a, b), (a, b), (b, a), (a, b), (a, b)]):
+                cols = ops == i
+                if not np.any(cols):
+                    continue
+                x1, x2 = x1[:, cols], x2[:, cols]
+                if i == 0:
+                    values[:, cols] = x1 - x2
+                elif i in [1, 2]:
+                    values[:, cols] = np.divide(
+                        x1, x2, out=np.zeros_like(x1), where=x2 != 0
+                    )
+                elif i == 3:
+                    values[:, cols] = x1 + x2
+                else:
+                    values[:, cols] = x1 * x2
+        return values
+
+    def _screen_block(self, pairs, features):
+        n = GoldenFeaturesScorer.SCREEN_SAMPLES
+        values = self.compute(self._X_train[:n], pairs, features)
+        with np.errstate(all="ignore"):
+            values = values - values.mean(axis=0)
+            values /= np.sqrt((values ** 2).sum(axis=0))
+            y = self._y_screen[:n] - self._y_screen[:n].mean(axis=0)
+            y /= np.sqrt((y ** 2).sum(axis=0))
+            corr = np.abs(values.T @ y).max(axis=1)
+        corr[~np.isfinite(corr)] = -1.0
+        return corr
+
+    def _score_block(self, pairs, features):
+        train = self.compute(self._X_train, pairs, features)
+        test = self.compute(self._X_test, pairs, features)
+        n_features = train.shape[1]
+        valid = np.all(np.isfinite(train), axis=0) & np.all(np.isfinite(test), axis=0)
+        train[:, ~valid] = 0
+        test[:, ~valid] = 0
+
+        bins = GoldenFeaturesScorer.BINS
+        edges = np.quantile(train, np.linspace(0, 1, bins + 1)[1:-1], axis=0)
+        bins_train = np.empty(train.shape, dtype=np.int64)
+        bins_test = np.empty(test.shape, dtype=np.int64)
+        for f in range(n_features):
+            bins_train[:, f] = np.searchsorted(edges[:, f], train[:, f], side="right")
+            bins_test[:, f] = np.searchsorted(edges[:, f], test[:, f], side="right")
+
+        # statistics of target in bins, shape (features, bins, stats)
+        index = (bins_train + np.arange(n_features) * bins).ravel()
+        stats = np.stack(
+            [
+                np.bincount(
+                    index,
+                    weights=np.repeat(self._Y_train[:, k], n_features),
+                    minlength=n_features * bins,
+                )
+                for k in range(self._Y_train.shape[1])
+            ],
+            axis=1,
+        ).reshape(n_features, bins, -1)
+        leaf_values = self._grow_trees(stats)
+
+        rows = np.arange(n_features)[None, :]
+        if self._regression:
+            predictions = leaf_values[rows, bins_test, 0]
+            scores = np.mean((predictions - self._y_test[:, None]) ** 2, axis=0)
+        else:
+            proba = leaf_values[rows, bins_test, self._y_test[:, None]]
+            proba = np.clip(proba, GoldenFeaturesScorer.EPS, 1.0)
+            scores = -np.mean(np.log(proba), axis=0)
+        scores[~valid] = np.nan
+        return scores
+
+    def _impurity(self, stats):
+        # impurity multiplied by the number of samples
+        with np.errstate(all="ignore"):
+            if self._regression:
+                impurity = stats[..., 2] - stats[..., 1] ** 2 / stats[..., 0]
+            else:
+                count = stats.sum(axis=-1)
+                impurity = count - (stats ** 2).sum(axis=-1) / count
+        return np.nan_to_num(impurity, nan=0.0)
+
+    def _count(self, stats):
+        return stats[..., 0] if self._regression else stats.sum(axis=-1)
+
+    def _grow_trees(self, stats):
+        n_features, bins, _ = stats.shape
+        prefix = np.concatenate(
+            [np.zeros((n_features, 1, stats.shape[2])), np.cumsum(stats, axis=1)],
+            axis=1,
+        )
+        rows = np.arange(n_features)
+        splits = np.arange(1, bins)
+        # nodes are ranges of bins [lo, hi), empty ranges are not used
+        nodes = [(np.zeros(n_features, dtype=np.int64), np.full(n_features, bins))]
+        for _ in range(GoldenFeaturesScorer.MAX_DEPTH):
+            new_nodes = []
+            for lo, hi in nodes:
+                node = prefix[rows, hi] - prefix[rows, lo]
+                left = prefix[:, splits] - prefix[rows, lo][:, None]
+                right = prefix[rows, hi][:, None] - prefix[:, splits]
+                impurity = self._impurity(left) + self._impurity(right)
+                allowed = (
+                    (splits[None, :] > lo[:, None])
+                    & (splits[None, :] < hi[:, None])
+                    & (self._count(left) > 0)
+                    & (self._count(right) > 0)
+                )
+                impurity[~allowed] = np.inf
+                best = np.argmin(impurity, axis=1)
+                can_split = allowed[rows, best] & (self._impurity(node) > 1e-12)
+                split = np.where(can_split, splits[best], hi)
+                new_nodes += [(lo, split), (split, hi)]
+            nodes = new_nodes
+
+        leaf_values = np.zeros(stats.shape)
+        for lo, hi in nodes:
+            node = prefix[rows, hi] - prefix[rows, lo]
+            with np.errstate(all="ignore"):
+                if self._regression:
+                    value = node[:, 1:2] / node[:, 0:1]
+                else:
+                    value = node / node.sum(axis=1, keepdims=True)
+            value = np.nan_to_num(value)
+            in_node = (np.arange(bins)[None, :] >= lo[:, None]) & (
+                np.arange(bins)[None, :] < hi[:, None]
+            )
+            leaf_values[in_node, : value.shape[1]] = np.repeat(
+                value, in_node.sum(axis=1), axis=0
+            )
+        return leaf_values
@@ -5,102 +5,10 @@ import datetime
 import json
 import time
 import itertools
-from joblib import Parallel, delayed
 from sklearn.model_selection import train_test_split
-from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
-from sklearn.metrics import log_loss, mean_squared_error
-from supervised.algorithms.registry import (
-    BINARY_CLASSIFICATION,
-    MULTICLASS_CLASSIFICATION,
-    REGRESSION,
-)
+from supervised.algorithms.registry import REGRESSION
 from supervised.exceptions import AutoMLException
-
-
-def get_binary_score(X_train, y_train, X_test, y_test):
-    clf = DecisionTreeClassifier(max_depth=3)
-    clf.fit(X_train, y_train)
-    pred = clf.predict_proba(X_test)[:, 1]
-    ll = log_loss(y_test, pred)
-    return ll
-
-
-def get_regression_score(X_train, y_train, X_test, y_test):
-    clf = DecisionTreeRegressor(max_depth=3)
-    clf.fit(X_train, y_train)
-    pred = clf.predict(X_test)
-    ll = mean_squared_error(y_test, pred)
-    return ll
-
-
-def get_multiclass_score(X_train, y_train, X_test, y_test):
-    clf = DecisionTreeClassifier(max_depth=3)
-    clf.fit(X_train, y_train)
-    pred = clf.predict_proba(X_test)
-    ll = log_loss(y_test, pred)
-    return ll
-
-
-def get_score(item):
-    col1 = item[0]
-    col2 = item[1]
-    X_train = item[2]
-    y_train = item[3]
-    X_test = item[4]
-    y_test = item[5]
-    scorer = item[6]
-
-    try:
-        x_train = np.array(X_train[col1] - X_train[col2]).reshape(-1, 1)
-        x_test = np.array(X_test[col1] - X_test[col2]).reshape(-1, 1)
-        diff_score = scorer(x_train, y_train, x_test, y_test)
-    except Exception as e:
-        diff_score = None
-        print(str(e))
-
-    try:
-        a, b = (
-            np.array(X_train[col1], dtype=float),
-            np.array(X_train[col2], dtype=float),
-        )
-        x_train = np.divide(a, b, out=np.zeros_like(a), where=b != 0).reshape(-1, 1)
-        a, b = np.array(X_test[col1], dtype=float), np.array(X_test[col2], dtype=float)
-        x_test = np.divide(a, b, out=np.zeros_like(a), where=b != 0).reshape(-1, 1)
-        ratio_1_score = scorer(x_train, y_train, x_test, y_test)
-    except Exception as e:
-        print(str(e))
-        ratio_1_score = None
-
-    try:
-        b, a = (
-            np.array(X_train[col1], dtype=float),
-            np.array(X_train[col2], dtype=float),
-        )
-        x_train = np.divide(a, b, out=np.zeros_like(a), where=b != 0).reshape(-1, 1)
-        b, a = np.array(X_test[col1], dtype=float), np.array(X_test[col2], dtype=float)
-        x_test = np.divide(a, b, out=np.zeros_like(a), where=b != 0).reshape(-1, 1)
-        ratio_2_score = scorer(x_train, y_train, x_test, y_test)
-    except Exception as e:
-        print(str(e))
-        ratio_2_score = None
-
-    try:
-        x_train = np.array(X_train[col1] + X_train[col2]).reshape(-1, 1)
-        x_test = np.array(X_test[col1] + X_test[col2]).reshape(-1, 1)
-        sum_score = scorer(x_train, y_train, x_test, y_test)
-    except Exception as e:
-        sum_score = None
-        print(str(e))
-
-    try:
-        x_train = np.array(X_train[col1] * X_train[col2]).reshape(-1, 1)
-        x_test = np.array(X_test[col1] * X_test[col2]).reshape(-1, 1)
-        multiply_score = scorer(x_train, y_train, x_test, y_test)
-    except Exception as e:
-        multiply_score = None
-        print(str(e))
-
-    return (diff_score, ratio_1_score, ratio_2_score, sum_score, multiply_score)
+from supervised.preprocessing.goldenfeatures_scorer import GoldenFeaturesScorer
 
 
 class GoldenFeaturesTransformer(object):
@@ -110,14 +18,6 @@ class GoldenFeaturesTransformer(object):
         self._ml_task = ml_task
         self._features_count = features_count
         self._n_jobs = n_jobs
-        self._scorer = None
-        if self._ml_task == BINARY_CLASSIFICATION:
-            self._scorer = get_binary_score
-        elif self._ml_task == MULTICLASS_CLASSIFICATION:
-            self._scorer = get_multiclass_score
-        else:
-            self._scorer = get_regression_score
-
         self._error = None
 
         self._result_file = "golden_features.json"
@@ -142,7 +42,7 @@ class GoldenFeaturesTransformer(object):
             raise AutoMLException("Golden Features not created. No continous features.")
 
         start_time = time.time()
-        combinations = itertools.combinations(X.columns, r=2)
+        combinations = itertools.combinations(range(X.shape[1]), r=2)
         items = [i for i in combinations]
         if len(items) > 250000:
             si = np.random.choice(len(items), 250000, replace=False)
@@ -150,36 +50,30 @@ class GoldenFeaturesTransformer(object):
 
         X_train, X_test, y_train, y_test = self._subsample(X, y)
 
-        for i in range(len(items)):
-            items[i] += (X_train, y_train, X_test, y_test, self._scorer)
-
-        scores = []
-        # parallel version
-        scores = Parallel(n_jobs=self._n_jobs, backend="loky")(
-            delayed(get_score)(i) for i in items
+        scorer = GoldenFeaturesScorer(
+            X_train, y_train, X_test, y_test, self._ml_task, self._n_jobs
         )
+        scores = scorer.score(items)
 
-        # single process version
-        # for item in items:
-        #    scores += [get_score(item)]
-
-        if not scores:
+        if not np.any(np.isfinite(scores)):
             self._error = f"Golden Features not created. Empty scores. Input data shape: {X.shape}, {y.shape}"
             self.save()
             raise AutoMLException("Golden Features not created. Empty scores.")
 
+        columns = X.columns
         result = []
         for i in range(len(items)):
-            if scores[i][0] is not None:
-                result += [(items[i][0], items[i][1], "diff", scores[i][0])]
-            if scores[i][1] is not None:
-                result += [(items[i][0], items[i][1], "ratio", scores[i][1])]
-            if scores[i][2] is not None:
-                result += [(items[i][1], items[i][0], "ratio", scores[i][2])]
-            if scores[i][3] is not None:
-                result += [(items[i][1], items[i][0], "sum", scores[i][3])]
-            if scores[i][4] is not None:
-                result += [(items[i][1], items[i][0], "multiply", scores[i][4])]
+            col1, col2 = columns[items[i][0]], columns[items[i][1]]
+            if np.isfinite(scores[i][0]):
+                result += [(col1, col2, "diff", scores[i][0])]
+            if np.isfinite(scores[i][1]):
+                result += [(col1, col2, "ratio", scores[i][1])]
+            if np.isfinite(scores[i][2]):
+                result += [(col2, col1, "ratio", scores[i][2])]
+            if np.isfinite(scores[i][3]):
+                result += [(col2, col1, "sum", scores[i][3])]
+            if np.isfinite(scores[i][4]):
+                result += [(col2, col1, "multiply", scores[i][4])]
 
         df = pd.DataFrame(
             result, columns=["feature1", "feature2", "operation", "score"]
@@ -216,30 +110,39 @@ class GoldenFeaturesTransformer(object):
         )
 
     def transform(self, X):
-        for new_feature in self._new_features:
-            new_col = "_".join(
-                [
-                    new_feature["feature1"],
-                    new_feature["operation"],
-                    new_feature["feature2"],
-                ]
+        if not self._new_features:
+            return X
+        columns = list(
+            dict.fromkeys(
+                [f["feature1"] for f in self._new_features]
+                + [f["feature2"] for f in self._new_features]
             )
-            if new_feature["operation"] == "diff":
-                X[new_col] = X[new_feature["feature1"]] - X[new_feature["feature2"]]
-            elif new_feature["operation"] == "ratio":
-                a, b = (
-                    np.array(X[new_feature["feature1"]], dtype=float),
-                    np.array(X[new_feature["feature2"]], dtype=float),
-                )
-                X[new_col] = np.divide(
-                    a, b, out=np.zeros_like(a), where=b != 0
-                ).reshape(-1, 1)
-            elif new_feature["operation"] == "sum":
-                X[new_col] = X[new_feature["feature1"]] + X[new_feature["feature2"]]
-            elif new_feature["operation"] == "multiply":
-                X[new_col] = X[new_feature["feature1"]] * X[new_feature["feature2"]]
-
-        return X
+        )
+        position = {c: i for i, c in enumerate(columns)}
+        operations = GoldenFeaturesScorer.OPERATIONS
+        pairs = np.array(
+            [
+                (position[f["feature1"]], position[f["feature2"]])
+                for f in self._new_features
+            ]
+        )
+        features = np.array(
+            [
+                (i, operations.index(f["operation"]))
+                for i, f in enumerate(self._new_features)
+            ]
+        )
+        # all new features are computed as one block and added at once
+        values = GoldenFeaturesScorer.compute(
+            X[columns].to_numpy(dtype=np.float64), pairs, features
+        )
+        new_columns = [
+            "_".join([f["feature1"], f["operation"], f["feature2"]])
+            for f in self._new_features
+        ]
+        X = X.drop(columns=[c for c in new_columns if c in X.columns])
+        new_X = pd.DataFrame(values, index=X.index, columns=new_columns)
+        return pd.concat([X, new_X], axis=1)
 
     def to_json(self):
         data_json = {
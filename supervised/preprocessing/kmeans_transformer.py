@@ -77,10 +77,13 @@ class KMeansTransformer(object):
         distances = self._kmeans.transform(X_scaled)
         clusters = self._kmeans.predict(X_scaled)
 
-        X[self._new_features[:-1]] = distances
-        X[self._new_features[-1]] = clusters
-
-        return X
+        # new features are added at once
+        new_X = pd.DataFrame(
+            distances, index=X.index, columns=self._new_features[:-1]
+        )
+        new_X[self._new_features[-1]] = clusters
+        X = X.drop(columns=[c for c in self._new_features if c in X.columns])
+        return pd.concat([X, new_X], axis=1)
 
     def to_json(self):
         self.save()
@@ -108,6 +111,19 @@ class KMeansTransformer(object):
             compress=True,
         )
 
+    def get_state(self):
+        return {
+            "kmeans": self._kmeans,
+            "scale": self._scale,
+            "input_columns": self._input_columns,
+        }
+
+    def set_state(self, state):
+        self._kmeans = state["kmeans"]
+        self._scale = state["scale"]
+        self._input_columns = state["input_columns"]
+        self._create_new_features_names()
+
     def try_load(self):
         if os.path.exists(self._result_path):
             data = joblib.load(self._result_path)
@@ -37,6 +37,7 @@ class Preprocessing(object):
         model_name=None,
         k_fold=None,
         repeat=None,
+        artifacts_cache=None,
     ):
         self._params = preprocessing_params
 
@@ -58,9 +59,16 @@ class Preprocessing(object):
         self._kmeans = None
         self._add_random_feature = self._params.get("add_random_feature", False)
         self._drop_features = self._params.get("drop_features", [])
+        # transform plan computed in fit_and_transform,
+        # train-time fill values for columns not filled by missing values
+        # transformations and numeric columns to be clipped at the end
+        self._fill_values = None
+        self._clip_columns = None
         self._model_name = model_name
         self._k_fold = k_fold
         self._repeat = repeat
+        # fitted k-means models are reused across AutoML runs
+        self._artifacts_cache = artifacts_cache
 
     def _exclude_missing_targets(self, X=None, y=None):
         # check if there are missing values in target column
@@ -161,7 +169,12 @@ class Preprocessing(object):
 
         new_text_columns = []
         for col in cols_to_process:
-            t = TextTransformer()
+            vectorizer = TextTransformer.TFIDF
+            if TextTransformer.HASHING in columns_preprocessing[col]:
+                vectorizer = TextTransformer.HASHING
+            t = TextTransformer(
+                vectorizer, TextTransformer.SPARSE in columns_preprocessing[col]
+            )
             t.fit(X_train, col)
             X_train = t.transform(X_train)
             self._text_transforms += [t]
@@ -180,6 +193,10 @@ class Preprocessing(object):
             X_train = missing.transform(X_train)
             self._missing_values += [missing]
 
+        self._fill_values = {}
+        if X_train is not None and len(columns_preprocessing) > 0:
+            self._fill_values = self._get_fill_values(X_train, new_text_columns)
+
         # golden features
         golden_columns = []
         if "golden_features" in self._params:
@@ -200,7 +217,22 @@ class Preprocessing(object):
             self._kmeans = KMeansTransformer(
                 results_path, self._model_name, self._k_fold
             )
-            self._kmeans.fit(X_train[numeric_cols], y_train)
+            cache_params = {
+                "preprocessing": self._params,
+                "k_fold": self._k_fold,
+                "repeat": self._repeat,
+            }
+            cached = None
+            if self._artifacts_cache is not None:
+                cached = self._artifacts_cache.get_object("kmeans", cache_params)
+            if cached is not None:
+                self._kmeans.set_state(cached)
+            else:
+                self._kmeans.fit(X_train[numeric_cols], y_train)
+                if self._artifacts_cache is not None:
+                    self._artifacts_cache.set_object(
+                        "kmeans", cache_params, self._kmeans.get_state()
+                    )
             X_train = self._kmeans.transform(X_train)
             kmeans_columns = self._kmeans._new_features
 
@@ -295,14 +327,70 @@ class Preprocessing(object):
 
         if X_train is not None:
             # there can be catagorical columns (in CatBoost) which cant be clipped
-            numeric_cols = X_train.select_dtypes(include="number").columns.tolist()
-            X_train[numeric_cols] = X_train[numeric_cols].clip(
-                lower=np.finfo(np.float32).min + 1000,
-                upper=np.finfo(np.float32).max - 1000,
-            )
+            # text features are in the [0, 1] range
+            text_columns = set(new_text_columns)
+            self._clip_columns = [
+                c
+                for c in X_train.select_dtypes(include="number").columns
+                if c not in text_columns
+            ]
+            X_train = self._clip(X_train)
 
         return X_train, y_train, sample_weight
 
+    def _get_fill_values(self, X, skip_columns=[]):
+        fill_values = {}
+        # text features don't have missing values
+        skip_columns = set(skip_columns)
+        numeric_cols = [
+            c
+            for c in X.select_dtypes(include="number").columns
+            if c not in skip_columns
+        ]
+        for column, value in X[numeric_cols].median().items():
+            fill_values[column] = 0.0 if pd.isnull(value) else float(value)
+        for column in X.select_dtypes(include=["object", "category"]).columns:
+            counts = X[column].value_counts()
+            if len(counts):
+                value = counts.index[0]
+                value = value.item() if isinstance(value, np.generic) else value
+                if isinstance(value, (str, int, float, bool)):
+                    fill_values[column] = value
+        # keep the order of columns
+        return {c: fill_values[c] for c in X.columns if c in fill_values}
+
+    def _fill_missing(self, X):
+        for column, value in self._fill_values.items():
+            ind = pd.isnull(X[column])
+            if ind.any():
+                # replace the column, the data can be shared with the input frame
+                X[column] = X[column].where(~ind, value)
+                if X[column].dtype == object and isinstance(value, float):
+                    # numeric column with only missing values in the new data
+                    try:
+                        X[column] = X[column].astype(np.float64)
+                    except (TypeError, ValueError):
+                        pass
+        return X
+
+    def _clip(self, X):
+        lower = np.finfo(np.float32).min + 1000
+        upper = np.finfo(np.float32).max - 1000
+        # the range is checked column by column, without a copy of the data,
+        # only columns with values out of range are replaced
+        for column in self._clip_columns:
+            values = X[column]
+            try:
+                out_of_range = values.min() < lower or values.max() > upper
+            except TypeError:
+                # not numeric values in the numeric column, clip as before
+                numeric_cols = X.select_dtypes(include="number").columns.tolist()
+                X[numeric_cols] = X[numeric_cols].clip(lower=lower, upper=upper)
+                return X
+            if out_of_range:
+                X[column] = values.clip(lower=lower, upper=upper)
+        return X
+
     def transform(self, X_validation, y_validation, sample_weight_validation=None):
         logger.debug("Preprocessing.transform")
 
@@ -370,7 +458,9 @@ class Preprocessing(object):
 
         # to be sure that all missing are filled
         # in case new data there can be gaps!
-        if (
+        if X_validation is not None and self._fill_values is not None:
+            X_validation = self._fill_missing(X_validation)
+        elif (
             X_validation is not None
             and np.sum(np.sum(pd.isnull(X_validation))) > 0
             and len(self._params["columns_preprocessing"]) > 0
@@ -419,7 +509,9 @@ class Preprocessing(object):
         if self._drop_features and X_validation is not None:
             X_validation.drop(self._drop_features, axis=1, inplace=True)
 
-        if X_validation is not None:
+        if X_validation is not None and self._clip_columns is not None:
+            X_validation = self._clip(X_validation)
+        elif X_validation is not None:
             # there can be catagorical columns (in CatBoost) which cant be clipped
             numeric_cols = X_validation.select_dtypes(include="number").columns.tolist()
             X_validation[numeric_cols] = X_validation[numeric_cols].clip(
@@ -590,6 +682,11 @@ class Preprocessing(object):
         if self._drop_features:
             preprocessing_params["drop_features"] = self._drop_features
 
+        if self._fill_values is not None:
+            preprocessing_params["fill_values"] = self._fill_values
+        if self._clip_columns is not None:
+            preprocessing_params["clip_columns"] = self._clip_columns
+
         preprocessing_params["params"] = self._params
 
         return preprocessing_params
@@ -656,3 +753,6 @@ class Preprocessing(object):
 
         self._add_random_feature = data_json.get("add_random_feature", False)
         self._drop_features = data_json.get("drop_features", [])
+        # models saved by the older versions don't have the transform plan
+        self._fill_values = data_json.get("fill_values")
+        self._clip_columns = data_json.get("clip_columns")
@@ -0,0 +1,115 @@
+import os
+import copy
+import json
+import hashlib
+from collections import OrderedDict
+import pandas as pd
+
+from supervised.utils.utils import Store
+
+
+class PreprocessingCache(object):
+    """Keeps preprocessed folds in memory.
+
+    Models with the same preprocessing params, trained on the same fold of
+    the same data, reuse the fitted preprocessing and transformed data
+    instead of computing them again. Cached values are kept in `Store`
+    under the `results_path` directory, so they are released with the
+    training data. The least recently used entries are removed when the
+    cached data is larger than `MAX_SIZE` MB.
+    """
+
+    CACHE_DIR = "preprocessing_cache"
+    MAX_SIZE = 1024
+    # size in bytes of the cached entries, in the order of use
+    _entries = OrderedDict()
+
+    @staticmethod
+    def is_cacheable(preprocessing_params):
+        # KMeans features are saved in the model directory,
+        # random feature should be different in each model
+        return "kmeans_features" not in preprocessing_params and not (
+            preprocessing_params.get("add_random_feature", False)
+        )
+
+    @staticmethod
+    def get_key(results_path, preprocessing_params, validation_params, k_fold, repeat):
+        store = Store()
+        data_versions = {}
+        for path_key in ["X_path", "y_path", "sample_weight_path"]:
+            path = validation_params.get(path_key)
+            if path is not None:
+                data_versions[path] = store.version(path)
+        desc = json.dumps(
+            {
+                "preprocessing": preprocessing_params,
+                "validation": validation_params,
+                "data": data_versions,
+                "k_fold": k_fold,
+                "repeat": repeat,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return os.path.join(
+            results_path,
+            PreprocessingCache.CACHE_DIR,
+            hashlib.md5(desc.encode("utf-8")).hexdigest(),
+        )
+
+    @staticmethod
+    def _copy(preprocessing, train_data, validation_data):
+        # returned data can be changed by learners, always return copies
+        return (
+            copy.deepcopy(preprocessing),
+            {k: v.copy() if v is not None else None for k, v in train_data.items()},
+            {
+                k: v.copy() if v is not None else None
+                for k, v in validation_data.items()
+            },
+        )
+
+    @staticmethod
+    def _nbytes(value):
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=False).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(deep=False))
+        return int(getattr(value, "nbytes", 0))
+
+    @staticmethod
+    def _evict():
+        store = Store()
+        entries = PreprocessingCache._entries
+        # entries released with the training data
+        for key in [k for k in entries if not store.contains(k)]:
+            del entries[key]
+        total_size = sum(entries.values())
+        while entries and total_size > PreprocessingCache.MAX_SIZE * 1024 * 1024:
+            key, size = entries.popitem(last=False)
+            store.delete(key)
+            total_size -= size
+
+    @staticmethod
+    def get(key):
+        store = Store()
+        if not store.contains(key):
+            return None
+        if key in PreprocessingCache._entries:
+            PreprocessingCache._entries.move_to_end(key)
+        return PreprocessingCache._copy(*store.get(key))
+
+    @staticmethod
+    def set(key, preprocessing, train_data, validation_data):
+        """Keeps the values in the cache, they are not copied and must not be
+        changed after this call. Returns copies to be used by the caller."""
+        store = Store()
+        store.set(key, (preprocessing, train_data, validation_data))
+        PreprocessingCache._entries[key] = sum(
+            PreprocessingCache._nbytes(v)
+            for data in [train_data, validation_data]
+            for v in data.values()
+        )
+        PreprocessingCache._entries.move_to_end(key)
+        PreprocessingCache._evict()
+        return PreprocessingCache._copy(preprocessing, train_data, validation_data)
@@ -23,6 +23,8 @@ class PreprocessingCategorical(object):
         self._convert_params = {}
         self._columns = columns
         self._enc = None
+        # encoding tables built from convert params on the first transform
+        self._tables = None
 
     def fit(self, X, y=None):
         if (
@@ -44,7 +46,7 @@ class PreprocessingCategorical(object):
             # this code is also used in predict.py file
             # and transform_utils.py
             # TODO it needs refactoring !!!
-            too_much_categories = len(np.unique(list(X[column].values))) > 200
+            too_much_categories = X[column].nunique(dropna=False) > 200
             lbl = None
             if (
                 self._convert_method == PreprocessingCategorical.CONVERT_ONE_HOT
@@ -58,6 +60,35 @@ class PreprocessingCategorical(object):
 
             if lbl is not None:
                 self._convert_params[column] = lbl.to_json()
+        self._tables = None
+
+    def _get_tables(self):
+        # hash tables with categories, built once from convert params
+        if self._tables is None:
+            integer, one_hot = [], []
+            for column, lbl_params in self._convert_params.items():
+                if "unique_values" in lbl_params and "new_columns" in lbl_params:
+                    values = lbl_params["unique_values"]
+                    new_columns = lbl_params["new_columns"]
+                    if len(values) == 2:
+                        # only the second value is encoded
+                        values = values[1:]
+                    categories = pd.Index(values, dtype=object)
+                    one_hot += [(column, categories, new_columns)]
+                else:
+                    keys = list(lbl_params.keys())
+                    if len(keys) == 2 and "False" in keys and "True" in keys:
+                        keys = [False, True]
+                    codes = np.array(list(lbl_params.values()), dtype=np.int64)
+                    categories = pd.Index(keys, dtype=object)
+                    integer += [(column, categories, codes)]
+            self._tables = (integer, one_hot)
+        return self._tables
+
+    @staticmethod
+    def _encode(x, categories):
+        # position of the value in categories, -1 for not seen values
+        return categories.get_indexer(np.asarray(x, dtype=object))
 
     def transform(self, X):
         if (
@@ -66,17 +97,32 @@ class PreprocessingCategorical(object):
         ):
             return self._enc.transform(X)
         else:
-            for column, lbl_params in self._convert_params.items():
-                if "unique_values" in lbl_params and "new_columns" in lbl_params:
-                    # convert to one hot
-                    lbl = LabelBinarizer()
-                    lbl.from_json(lbl_params)
-                    X = lbl.transform(X, column)
-                else:
-                    # convert to integer
-                    lbl = LabelEncoder()
-                    lbl.from_json(lbl_params)
-                    X.loc[:, column] = lbl.transform(X.loc[:, column])
+            integer, one_hot = self._get_tables()
+            for column, categories, codes in integer:
+                # not seen values are in one bucket after the known categories
+                positions = self._encode(X[column], categories)
+                X[column] = np.where(
+                    positions >= 0, codes[positions], len(categories)
+                )
+
+            if one_hot:
+                n_new_columns = sum(len(c[2]) for c in one_hot)
+                block = np.zeros((X.shape[0], n_new_columns), dtype=np.uint8)
+                rows = np.arange(X.shape[0])
+                offset = 0
+                for column, categories, new_columns in one_hot:
+                    positions = self._encode(X[column], categories)
+                    known = positions >= 0
+                    block[rows[known], offset + positions[known]] = 1
+                    offset += len(new_columns)
+                new_columns = [c for _, _, columns in one_hot for c in columns]
+                X = X.drop([c[0] for c in one_hot], axis=1)
+                # new columns that were in the data are replaced
+                X = X.drop([c for c in new_columns if c in X.columns], axis=1)
+                X = pd.concat(
+                    [X, pd.DataFrame(block, columns=new_columns, index=X.index)],
+                    axis=1,
+                )
 
             return X
 
@@ -125,6 +171,7 @@ class PreprocessingCategorical(object):
                 self._enc.from_json(params.get("enc", {}))
             else:
                 self._convert_params = params.get("convert_params", {})
+            self._tables = None
 
         else:
             self._convert_method, self._convert_params = None, None
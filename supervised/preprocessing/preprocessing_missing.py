@@ -68,7 +68,9 @@ class PreprocessingMissingValues(object):
     def _transform_na_fill(self, X):
         for column, value in self._na_fill_params.items():
             ind = pd.isnull(X.loc[:, column])
-            X.loc[ind, column] = value
+            if ind.any():
+                # replace the column, the data can be shared with the input frame
+                X[column] = X[column].where(~ind, value)
         return X
 
     def _make_sure_na_filled(self, X):
@@ -3,6 +3,8 @@ import pandas as pd
 from scipy import stats
 from sklearn import preprocessing
 
+from supervised.preprocessing.column_profiler import ColumnProfiler
+
 
 class PreprocessingUtilsException(Exception):
     pass
@@ -22,30 +24,42 @@ class PreprocessingUtils(object):
                 raise PreprocessingUtilsException(
                     "Please select one column to get its type"
                 )
-        col_type = str(x.dtype)
-
-        data_type = PreprocessingUtils.CATEGORICAL
-        if col_type.startswith("float"):
-            data_type = PreprocessingUtils.CONTINOUS
-        elif col_type.startswith("int") or col_type.startswith("uint"):
-            data_type = PreprocessingUtils.DISCRETE
-        elif col_type.startswith("datetime"):
-            data_type = PreprocessingUtils.DATETIME
-        elif col_type.startswith("category"):
+        dtype_class = ColumnProfiler.dtype_class(x.dtype)
+        unique_cnt = None
+        if dtype_class == ColumnProfiler.OBJECT:
+            unique_cnt, _ = ColumnProfiler.count_unique(x[~pd.isnull(x)])
+        return PreprocessingUtils._get_type(dtype_class, unique_cnt, x.shape[0])
+
+    @staticmethod
+    def get_type_from_profile(profile):
+        """Returns the type of a column from `ColumnProfiler.profile`.
+        Rows are counted without nulls, the same as in `is_categorical` and
+        `is_text`, which remove nulls before `get_type`."""
+        return PreprocessingUtils._get_type(
+            profile["dtype_class"],
+            profile["unique"],
+            profile["rows"] - profile["nulls"],
+        )
+
+    @staticmethod
+    def _get_type(dtype_class, unique_cnt, rows):
+        if dtype_class == ColumnProfiler.FLOAT:
+            return PreprocessingUtils.CONTINOUS
+        if dtype_class == ColumnProfiler.INT:
+            return PreprocessingUtils.DISCRETE
+        if dtype_class == ColumnProfiler.DATETIME:
+            return PreprocessingUtils.DATETIME
+        if dtype_class == ColumnProfiler.CATEGORY:
             # do not check the additional condition for text feature
             # treat it as categorical
             return PreprocessingUtils.CATEGORICAL
-
-        if data_type == PreprocessingUtils.CATEGORICAL:
-            # check maybe this categorical is a text
-            # it is a text, if:
-            # has more than 200 unique values
-            # more than half of rows is unique
-            unique_cnt = len(np.unique(x[~pd.isnull(x)]))
-            if unique_cnt > 200 and unique_cnt > int(0.5 * x.shape[0]):
-                data_type = PreprocessingUtils.TEXT
-
-        return data_type
+        # check maybe this categorical is a text
+        # it is a text, if:
+        # has more than 200 unique values
+        # more than half of rows is unique
+        if unique_cnt > 200 and unique_cnt > int(0.5 * rows):
+            return PreprocessingUtils.TEXT
+        return PreprocessingUtils.CATEGORICAL
 
     @staticmethod
     def is_categorical(x_org):
@@ -85,6 +99,10 @@ class PreprocessingUtils(object):
             return True
         return False
 
+    @staticmethod
+    def is_scale_needed_from_profile(profile):
+        return abs(profile["mean"]) > 0.5 or profile["std"] > 1.5
+
     @staticmethod
     def is_log_scale_needed(x_org):
         x_full = np.array(x_org[~pd.isnull(x_org)])
@@ -1,20 +1,46 @@
 import numpy as np
 import pandas as pd
+import scipy.sparse
 import warnings
 import datetime
 import json
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
 
 
 class TextTransformer(object):
-    def __init__(self):
+
+    TFIDF = "text_tfidf"
+    HASHING = "text_hashing"
+    SPARSE = "text_sparse"
+
+    def __init__(self, vectorizer=TFIDF, sparse=False):
         self._new_columns = []
         self._old_column = None
         self._max_features = 100
         self._vectorizer = None
+        # the hashing vectorizer is stateless, there is no vocabulary
+        self._vectorizer_type = vectorizer
+        # new columns are stored as sparse columns in the data frame
+        self._sparse = sparse
+
+    def _get_hashing_vectorizer(self):
+        return HashingVectorizer(
+            analyzer="word",
+            stop_words="english",
+            lowercase=True,
+            n_features=self._max_features,
+            alternate_sign=False,
+        )
 
     def fit(self, X, column):
         self._old_column = column
+        if self._vectorizer_type == TextTransformer.HASHING:
+            self._vectorizer = self._get_hashing_vectorizer()
+            self._new_columns = [
+                f"{self._old_column}_hash_{i}" for i in range(self._max_features)
+            ]
+            return
+
         self._vectorizer = TfidfVectorizer(
             analyzer="word",
             stop_words="english",
@@ -29,37 +55,56 @@ class TextTransformer(object):
             self._new_columns += [new_col]
 
     def transform(self, X):
-        with warnings.catch_warnings():
-            warnings.simplefilter(
-                action="ignore", category=pd.errors.PerformanceWarning
+        ii = np.array(~pd.isnull(X[self._old_column]))
+        vect = scipy.sparse.csr_matrix(
+            self._vectorizer.transform(X[self._old_column][ii])
+        )
+        # rows with missing text have no values
+        indptr = np.zeros(X.shape[0] + 1, dtype=vect.indptr.dtype)
+        indptr[1:][ii] = np.diff(vect.indptr)
+        vect = scipy.sparse.csr_matrix(
+            (vect.data, vect.indices, np.cumsum(indptr)),
+            shape=(X.shape[0], len(self._new_columns)),
+        )
+        if self._sparse:
+            new_X = pd.DataFrame.sparse.from_spmatrix(
+                vect, index=X.index, columns=self._new_columns
             )
-            ii = ~pd.isnull(X[self._old_column])
-            x = X[self._old_column][ii]
-            vect = self._vectorizer.transform(x)
-
-            for f in self._new_columns:
-                X[f] = 0.0
-
-            X.loc[ii, self._new_columns] = vect.toarray()
-            X.drop(self._old_column, axis=1, inplace=True)
-        return X
+        else:
+            new_X = pd.DataFrame(
+                vect.toarray(), index=X.index, columns=self._new_columns
+            )
+        X = X.drop(self._old_column, axis=1)
+        # all new columns are added at once
+        return pd.concat([X, new_X], axis=1)
 
     def to_json(self):
-        for k in self._vectorizer.vocabulary_.keys():
-            self._vectorizer.vocabulary_[k] = int(self._vectorizer.vocabulary_[k])
-
         data_json = {
             "new_columns": list(self._new_columns),
             "old_column": self._old_column,
-            "vocabulary": self._vectorizer.vocabulary_,
-            "fixed_vocabulary": self._vectorizer.fixed_vocabulary_,
-            "idf": list(self._vectorizer.idf_),
         }
+        if self._sparse:
+            data_json["sparse"] = True
+        if self._vectorizer_type == TextTransformer.HASHING:
+            data_json["vectorizer"] = self._vectorizer_type
+            return data_json
+
+        for k in self._vectorizer.vocabulary_.keys():
+            self._vectorizer.vocabulary_[k] = int(self._vectorizer.vocabulary_[k])
+
+        data_json["vocabulary"] = self._vectorizer.vocabulary_
+        data_json["fixed_vocabulary"] = self._vectorizer.fixed_vocabulary_
+        data_json["idf"] = list(self._vectorizer.idf_)
         return data_json
 
     def from_json(self, data_json):
         self._new_columns = data_json.get("new_columns", None)
         self._old_column = data_json.get("old_column", None)
+        self._sparse = data_json.get("sparse", False)
+        self._vectorizer_type = data_json.get("vectorizer", TextTransformer.TFIDF)
+        if self._vectorizer_type == TextTransformer.HASHING:
+            self._vectorizer = self._get_hashing_vectorizer()
+            return
         vocabulary = data_json.get("vocabulary")
         fixed_vocabulary = data_json.get("fixed_vocabulary")
         idf = data_json.get("idf")
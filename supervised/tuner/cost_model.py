@@ -0,0 +1,88 @@
+import numpy as np
+
+
+class CostModel(object):
+    """Predicts the train time of a model from the data size and hyperparameters.
+
+    For each algorithm, the log of train time is a linear function of the
+    logs of rows, columns, learners (folds x repeats), tree depth, learning
+    rate and number of trees. Coefficients are fitted with ridge regression
+    towards the prior slopes, so one record is enough to scale the prior
+    and the next records correct the slopes.
+    """
+
+    FEATURES = ["rows", "cols", "learners", "depth", "learning_rate", "trees"]
+    PRIOR = np.array([1.0, 1.0, 1.0, 0.5, -0.5, 1.0])
+    ALPHA = 1.0
+
+    def __init__(self):
+        self._coefficients = {}
+
+    @staticmethod
+    def get_features(learner_params, rows, cols, learners):
+        """Returns dict with features of the model used in predictions."""
+        depth = learner_params.get("max_depth", learner_params.get("depth"))
+        if depth is None and learner_params.get("num_leaves") is not None:
+            depth = np.log2(learner_params["num_leaves"])
+        learning_rate = learner_params.get("eta", learner_params.get("learning_rate"))
+        trees = None
+        for key in ["max_rounds", "n_estimators", "max_steps"]:
+            if learner_params.get(key) is not None:
+                trees = learner_params[key]
+                break
+        features = {
+            "rows": rows,
+            "cols": cols,
+            "learners": learners,
+            "depth": depth,
+            "learning_rate": learning_rate,
+            "trees": trees,
+        }
+        # features are saved in JSON with time records
+        for k, v in features.items():
+            try:
+                features[k] = float(v)
+            except (TypeError, ValueError):
+                features[k] = None
+        return features
+
+    @staticmethod
+    def _to_vector(features):
+        x = []
+        for name in CostModel.FEATURES:
+            value = features.get(name)
+            # missing features do not change the prediction
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                value = 1.0
+            x += [np.log(value) if value > 0 else 0.0]
+        return np.array(x)
+
+    def fit(self, records):
+        """Fits coefficients from records with `model_type`, `features` and `train_time`."""
+        self._coefficients = {}
+        by_type = {}
+        for r in records:
+            if r.get("features") is None or not r.get("train_time", 0) > 0:
+                continue
+            by_type.setdefault(r["model_type"], []).append(
+                (CostModel._to_vector(r["features"]), np.log(r["train_time"]))
+            )
+        for model_type, rows in by_type.items():
+            X = np.array([r[0] for r in rows])
+            y = np.array([r[1] for r in rows])
+            X_mean, y_mean = X.mean(axis=0), y.mean()
+            Xc, yc = X - X_mean, y - y_mean
+            beta = CostModel.PRIOR + np.linalg.solve(
+                Xc.T @ Xc + CostModel.ALPHA * np.eye(X.shape[1]),
+                Xc.T @ (yc - Xc @ CostModel.PRIOR),
+            )
+            self._coefficients[model_type] = (y_mean - X_mean @ beta, beta)
+
+    def predict(self, model_type, features):
+        """Returns predicted train time in seconds, None for not seen algorithm."""
+        if model_type not in self._coefficients:
+            return None
+        intercept, beta = self._coefficients[model_type]
+        return float(np.exp(intercept + CostModel._to_vector(features) @ beta))
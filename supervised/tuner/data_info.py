@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 from supervised.preprocessing.preprocessing_utils import PreprocessingUtils
+from supervised.preprocessing.column_profiler import ColumnProfiler
 from supervised.preprocessing.preprocessing_categorical import PreprocessingCategorical
 from supervised.preprocessing.preprocessing_missing import PreprocessingMissingValues
 from supervised.preprocessing.scale import Scale
@@ -15,51 +16,59 @@ from supervised.algorithms.registry import (
 
 class DataInfo:
     @staticmethod
-    def compute(X, y, machinelearning_task):
+    def compute(X, y, machinelearning_task, n_jobs=-1):
 
+        # all columns are profiled at once, type decisions read the profiles
+        profiles = ColumnProfiler.profile_frame(X, n_jobs=n_jobs)
         columns_info = {}
         for col in X.columns:
             columns_info[col] = []
+            profile = profiles[col]
             #
-            empty_column = np.sum(pd.isnull(X[col]) == True) == X.shape[0]
+            empty_column = profile["nulls"] == profile["rows"]
             if empty_column:
                 columns_info[col] += ["empty_column"]
                 continue
             #
-            constant_column = len(np.unique(X.loc[~pd.isnull(X[col]), col])) == 1
+            constant_column = profile["unique"] == 1
             if constant_column:
                 columns_info[col] += ["constant_column"]
                 continue
             #
-            if PreprocessingUtils.is_na(X[col]):
+            if profile["nulls"] > 0:
                 columns_info[col] += ["missing_values"]
             #
-            if PreprocessingUtils.is_categorical(X[col]):
+            col_type = PreprocessingUtils.get_type_from_profile(profile)
+            if col_type == PreprocessingUtils.CATEGORICAL:
                 columns_info[col] += ["categorical"]
-                columns_info[col] += [EncodingSelector.get(X, y, col)]
-            elif PreprocessingUtils.is_datetime(X[col]):
+                columns_info[col] += [
+                    EncodingSelector.get(X, y, col, unique_cnt=profile["unique"])
+                ]
+            elif col_type == PreprocessingUtils.DATETIME:
                 columns_info[col] += ["datetime_transform"]
-            elif PreprocessingUtils.is_text(X[col]):
+            elif col_type == PreprocessingUtils.TEXT:
                 columns_info[col] = ["text_transform"]  # override other transforms
             else:
                 # numeric type, check if scale needed
-                if PreprocessingUtils.is_scale_needed(X[col]):
+                if PreprocessingUtils.is_scale_needed_from_profile(profile):
                     columns_info[col] += ["scale"]
 
+        # the number of classes is exact
+        target_profile = ColumnProfiler.profile(y, unique_cap=None)
         target_info = []
         if machinelearning_task == BINARY_CLASSIFICATION:
-            if not PreprocessingUtils.is_0_1(y):
+            if not target_profile["is_0_1"]:
                 target_info += ["convert_0_1"]
 
         if machinelearning_task == REGRESSION:
             if PreprocessingUtils.is_log_scale_needed(y):
                 target_info += ["scale_log"]
-            elif PreprocessingUtils.is_scale_needed(y):
+            elif PreprocessingUtils.is_scale_needed_from_profile(target_profile):
                 target_info += ["scale"]
 
         num_class = None
         if machinelearning_task == MULTICLASS_CLASSIFICATION:
-            num_class = PreprocessingUtils.num_class(y)
+            num_class = target_profile["unique"]
 
         return {
             "columns_info": columns_info,
@@ -29,6 +29,13 @@ logger.setLevel(LOG_LEVEL)
 
 
 class MljarTuner:
+    # successive halving: candidates are checked on low fidelity,
+    # the best 1 of HALVING_ETA models is promoted to the full validation
+    HALVING_ETA = 3
+    FIDELITY_FOLDS = 1  # learners trained by the low fidelity model
+    FIDELITY_ROWS = 0.25  # fraction of train rows used by the low fidelity model
+    FIDELITY_MIN_ROWS = 100000  # smaller data is not subsampled
+
     def __init__(
         self,
         tuner_params,
@@ -51,6 +58,8 @@ class MljarTuner:
         optuna_verbose,
         n_jobs,
         seed,
+        text_vectorizer="tfidf",
+        successive_halving=False,
     ):
         logger.debug("MljarTuner.__init__")
         self._start_random_models = tuner_params.get("start_random_models", 5)
@@ -69,6 +78,8 @@ class MljarTuner:
         self._boost_on_errors = boost_on_errors
         self._kmeans_features = kmeans_features
         self._mix_encoding = mix_encoding
+        self._text_vectorizer = text_vectorizer
+        self._successive_halving = successive_halving
         self._optuna_time_budget = optuna_time_budget
         self._optuna_init_params = optuna_init_params
         self._optuna_verbose = optuna_verbose
@@ -153,6 +164,8 @@ class MljarTuner:
 
         if self._start_random_models > 1:
             all_steps += ["not_so_random"]
+            if self._successive_halving:
+                all_steps += ["not_so_random_promote"]
 
         categorical_strategies = self._apply_categorical_strategies()
         if PreprocessingTuner.CATEGORICALS_MIX in categorical_strategies:
@@ -168,6 +181,8 @@ class MljarTuner:
             all_steps += ["features_selection"]
         for i in range(self._hill_climbing_steps):
             all_steps += [f"hill_climbing_{i+1}"]
+            if self._successive_halving:
+                all_steps += [f"hill_climbing_{i+1}_promote"]
         if self._boost_on_errors:
             all_steps += ["boost_on_errors"]
         if self._train_ensemble:
@@ -185,10 +200,18 @@ class MljarTuner:
         return [m for m in models if "RandomFeature" not in m.get_name()]
 
     def generate_params(
-        self, step, models, results_path, stacked_models, total_time_limit
+        self,
+        step,
+        models,
+        results_path,
+        stacked_models,
+        total_time_limit,
+        low_fidelity_models=None,
     ):
+        if low_fidelity_models is None:
+            low_fidelity_models = []
         try:
-            models_cnt = len(models)
+            models_cnt = len(models) + len(low_fidelity_models)
             if step == "adjust_validation":
                 return self.adjust_validation_params(models_cnt)
             elif step == "simple_algorithms":
@@ -196,7 +219,11 @@ class MljarTuner:
             elif step == "default_algorithms":
                 return self.default_params(models_cnt)
             elif step == "not_so_random":
-                return self.get_not_so_random_params(models_cnt)
+                return self.get_not_so_random_params(models_cnt, step)
+            elif step.endswith("_promote"):
+                return self.get_promoted_params(
+                    models, low_fidelity_models, step[: -len("_promote")]
+                )
             elif step == "mix_encoding":
                 return self.get_mix_categorical_strategy(models, total_time_limit)
             elif step == "loo_encoding":
@@ -221,7 +248,9 @@ class MljarTuner:
                 )
             elif "hill_climbing" in step:
                 return self.get_hill_climbing_params(
-                    self.filter_random_feature_model(models)
+                    self.filter_random_feature_model(models),
+                    low_fidelity_models,
+                    step,
                 )
             elif step == "boost_on_errors":
                 return self.boost_params(models, results_path, total_time_limit)
@@ -457,7 +486,26 @@ class MljarTuner:
 
         return generated_params
 
-    def get_not_so_random_params(self, models_cnt):
+    def _can_use_successive_halving(self):
+        # low fidelity needs k-fold validation with many learners
+        if not self._successive_halving or self._optuna_time_budget is not None:
+            return False
+        if self._validation_strategy.get("validation_type") != "kfold":
+            return False
+        k_folds = self._validation_strategy.get("k_folds", 5)
+        repeats = self._validation_strategy.get("repeats", 1)
+        return k_folds * repeats > MljarTuner.FIDELITY_FOLDS
+
+    def _set_low_fidelity(self, params, step):
+        """Sets the validation of the model to low fidelity in the step"""
+        validation_strategy = dict(params["validation_strategy"])
+        validation_strategy["fidelity_folds"] = MljarTuner.FIDELITY_FOLDS
+        if self._data_info.get("rows", 0) >= MljarTuner.FIDELITY_MIN_ROWS:
+            validation_strategy["fidelity_rows"] = MljarTuner.FIDELITY_ROWS
+        params["validation_strategy"] = validation_strategy
+        params["fidelity_step"] = step
+
+    def get_not_so_random_params(self, models_cnt, step=None):
 
         model_types = [
             "Xgboost",
@@ -470,6 +518,12 @@ class MljarTuner:
         ]
 
         generated_params = {m: [] for m in model_types}
+        low_fidelity = step is not None and self._can_use_successive_halving()
+        # minus 1 because already have 1 default
+        random_models = self._start_random_models - 1
+        if low_fidelity:
+            # low fidelity models are cheap, check more of them
+            random_models *= MljarTuner.HALVING_ETA
 
         for model_type in model_types:
             if model_type not in self._algorithms:
@@ -477,8 +531,7 @@ class MljarTuner:
 
             if self.skip_if_rows_cols_limit(model_type):
                 continue
-            # minus 1 because already have 1 default
-            for i in range(self._start_random_models - 1):
+            for i in range(random_models):
 
                 logger.info(
                     f"Generate not-so-random parameters for {model_type} (#{models_cnt+1})"
@@ -496,6 +549,8 @@ class MljarTuner:
                     params["optuna_time_budget"] = self._optuna_time_budget
                     params["optuna_init_params"] = self._optuna_init_params
                     params["optuna_verbose"] = self._optuna_verbose
+                if low_fidelity:
+                    self._set_low_fidelity(params, step)
 
                 unique_params_key = MljarTuner.get_params_key(params)
                 if unique_params_key not in self._unique_params_keys:
@@ -545,10 +600,15 @@ class MljarTuner:
 
         return return_params
 
-    def get_hill_climbing_params(self, current_models):
+    def get_hill_climbing_params(
+        self, current_models, low_fidelity_models=None, step=None
+    ):
+        if low_fidelity_models is None:
+            low_fidelity_models = []
         df_models, algorithms = self.df_models_algorithms(current_models)
         generated_params = []
         counts = {model_type: 0 for model_type in algorithms}
+        low_fidelity = step is not None and self._can_use_successive_halving()
 
         for i in range(df_models.shape[0]):
 
@@ -564,7 +624,8 @@ class MljarTuner:
             ):
 
                 model_indices = [
-                    int(m.get_name().split("_")[0]) for m in current_models
+                    int(m.get_name().split("_")[0])
+                    for m in current_models + low_fidelity_models
                 ]
                 model_max_index = np.max(model_indices)
 
@@ -589,6 +650,8 @@ class MljarTuner:
                     all_params["status"] = "initialized"
                     all_params["final_loss"] = None
                     all_params["train_time"] = None
+                    if low_fidelity:
+                        self._set_low_fidelity(all_params, step)
                     unique_params_key = MljarTuner.get_params_key(all_params)
 
                     if unique_params_key not in self._unique_params_keys:
@@ -596,6 +659,49 @@ class MljarTuner:
 
         return generated_params
 
+    def get_promoted_params(self, current_models, low_fidelity_models, step):
+        """Returns params of the best low fidelity models from the step,
+        the best 1 of HALVING_ETA models of each algorithm is promoted
+        to the full validation."""
+        step_models = [
+            m for m in low_fidelity_models if m.params.get("fidelity_step") == step
+        ]
+        if not step_models:
+            return []
+        df_models, algorithms = self.df_models_algorithms(step_models)
+        model_max_index = np.max(
+            [
+                int(m.get_name().split("_")[0])
+                for m in current_models + low_fidelity_models
+            ]
+        )
+        generated_params = []
+        for model_type in algorithms:
+            df = df_models[df_models.model_type == model_type]
+            promote_cnt = int(np.ceil(df.shape[0] / MljarTuner.HALVING_ETA))
+            for m in df["model"].iloc[:promote_cnt]:
+                all_params = copy.deepcopy(m.params)
+                all_params["validation_strategy"] = {
+                    k: v
+                    for k, v in all_params["validation_strategy"].items()
+                    if k not in ["fidelity_folds", "fidelity_rows"]
+                }
+                del all_params["fidelity_step"]
+                # keep the suffix of the name, for example _GoldenFeatures
+                all_params["name"] = "{}_{}".format(
+                    model_max_index + 1 + len(generated_params),
+                    m.get_name().split("_", 1)[1],
+                )
+                all_params["status"] = "initialized"
+                all_params["final_loss"] = None
+                all_params["train_time"] = None
+                unique_params_key = MljarTuner.get_params_key(all_params)
+
+                if unique_params_key not in self._unique_params_keys:
+                    generated_params += [all_params]
+
+        return generated_params
+
     def get_all_int_categorical_strategy(self, current_models, total_time_limit):
         return self.get_categorical_strategy(
             current_models, PreprocessingTuner.CATEGORICALS_ALL_INT, total_time_limit
@@ -989,7 +1095,10 @@ class MljarTuner:
         required_preprocessing = model_info["required_preprocessing"]
         model_additional = model_info["additional"]
         preprocessing_params = PreprocessingTuner.get(
-            required_preprocessing, self._data_info, self._ml_task
+            required_preprocessing,
+            self._data_info,
+            self._ml_task,
+            text_vectorizer=self._text_vectorizer,
         )
 
         model_params = {
@@ -4,6 +4,7 @@ from supervised.preprocessing.preprocessing_utils import PreprocessingUtils
 from supervised.preprocessing.preprocessing_categorical import PreprocessingCategorical
 from supervised.preprocessing.preprocessing_missing import PreprocessingMissingValues
 from supervised.preprocessing.scale import Scale
+from supervised.preprocessing.text_transformer import TextTransformer
 
 from supervised.algorithms.registry import (
     REGRESSION,
@@ -28,6 +29,7 @@ class PreprocessingTuner:
         data_info,
         machinelearning_task,
         categorical_strategy=CATEGORICALS_ALL_INT,
+        text_vectorizer="tfidf",
     ):
 
         columns_preprocessing = {}
@@ -98,6 +100,11 @@ class PreprocessingTuner:
                 and "text_transform" in preprocessing_needed
             ):
                 preprocessing_to_apply += ["text_transform"]
+                if text_vectorizer == "hashing":
+                    preprocessing_to_apply += [TextTransformer.HASHING]
+                # the algorithm can be trained on sparse data
+                if "sparse_text" in required_preprocessing:
+                    preprocessing_to_apply += [TextTransformer.SPARSE]
 
             if "scale" in required_preprocessing:
                 if (
@@ -4,6 +4,7 @@ import logging
 import numpy as np
 import pandas as pd
 from supervised.utils.config import LOG_LEVEL
+from supervised.tuner.cost_model import CostModel
 
 logger = logging.getLogger(__name__)
 logger.setLevel(LOG_LEVEL)
@@ -21,6 +22,9 @@ class TimeController:
         self._spend = []
         self._is_hill_climbing = "hill_climbing_1" in steps
         self._is_stacking = "stack" in steps
+        # train time predictions, fitted from records in `_spend`
+        self._cost_model = CostModel()
+        self._cost_model_records = 0
 
     def to_json(self):
         return {
@@ -75,6 +79,12 @@ class TimeController:
             "stack": 0.2,
         }
 
+        # promotion of the best models shares the time with its step
+        promote_step = f"{fit_level}_promote"
+        if fit_level.endswith("_promote"):
+            promote_step = fit_level
+            fit_level = fit_level[: -len("_promote")]
+
         if (
             fit_level
             in [
@@ -105,10 +115,17 @@ class TimeController:
             if "hill_climbing" in fit_level:
                 # print("before hill climbing scale", ratio)
                 hill_climbing_cnt = len(
-                    [i for i in self._steps if "hill_climbing" in i]
+                    [
+                        i
+                        for i in self._steps
+                        if "hill_climbing" in i and not i.endswith("_promote")
+                    ]
                 )
                 ratio /= float(hill_climbing_cnt)
 
+            if promote_step in self._steps:
+                ratio /= 2.0
+
             should_use = self._total_time_limit * ratio
 
             return should_use
@@ -148,16 +165,51 @@ class TimeController:
 
         return True
 
-    def enough_time_for_model(self, model_type):
+    def predict_time(self, model_type, features):
+        """Returns predicted train time of the model or None if it is unknown"""
+        if features is None:
+            return None
+        if self._cost_model_records != len(self._spend):
+            self._cost_model.fit(self._spend)
+            self._cost_model_records = len(self._spend)
+        return self._cost_model.predict(model_type, features)
+
+    def step_time_left(self, fit_level):
+        """Returns time left for the step, None if the step has no time share"""
+        if self._total_time_limit is None or self.time_should_use(fit_level) == 0:
+            return None
+        total_time_spend = time.time() - self._start_time
+        return self.compound_time_should_use(fit_level) - total_time_spend
+
+    def enough_time_for_model(self, model_type, features=None):
         if self._total_time_limit is None:
             return True
 
         time_left = self._total_time_limit - self.already_spend()
+        predicted = self.predict_time(model_type, features)
+        if predicted is not None:
+            return predicted <= time_left
         spend = [s["train_time"] for s in self._spend if s["model_type"] == model_type]
         model_mean_spend = np.mean(spend)
         return model_mean_spend <= time_left
 
-    def enough_time(self, model_type, step):
+    def order_by_cost(self, fit_level, candidates):
+        """Returns the order of candidates, list of (model_type, features),
+        with the lowest predicted train time first. Candidates with unknown
+        time are first, so every algorithm is tried."""
+        order = list(range(len(candidates)))
+        if (
+            self._total_time_limit is None
+            or self._model_time_limit is not None
+            or not (
+                fit_level.startswith("not_so_random") or "hill_climbing" in fit_level
+            )
+        ):
+            return order
+        costs = [self.predict_time(t, f) for t, f in candidates]
+        return sorted(order, key=lambda i: 0 if costs[i] is None else costs[i])
+
+    def enough_time(self, model_type, step, features=None):
         """
         Check if there is enough time to train the next model.
 
@@ -169,6 +221,10 @@ class TimeController:
         step: str
             String with name of the step in the process of AutoML training.
 
+        features: dict
+            Features of the model used to predict its train time,
+            see `CostModel.get_features`.
+
 
         Returns
         -------
@@ -207,8 +263,17 @@ class TimeController:
         # dont need to check ...
         if step == "stack":
             return True
+        # the model predicted to overrun the step is skipped
+        predicted = self.predict_time(model_type, features)
+        step_time_left = self.step_time_left(step)
+        if (
+            predicted is not None
+            and step_time_left is not None
+            and predicted > step_time_left
+        ):
+            return False
         # check if there is enough time for model to train
-        return self.enough_time_for_model(model_type)
+        return self.enough_time_for_model(model_type, features)
 
     def learner_time_limit(self, model_type, fit_level, k_folds):
 
@@ -236,7 +301,7 @@ class TimeController:
         time_elapsed = time.time() - self._start_time
         time_left = self._total_time_limit - time_elapsed
 
-        if fit_level == "not_so_random":
+        if fit_level.startswith("not_so_random"):
             tt = self.time_should_use(fit_level)
 
             tt /= tune_algs_cnt  # give time equally for each algorithm
@@ -255,16 +320,17 @@ class TimeController:
             tt /= k_folds  # time is per learner (per fold)
             return tt
 
-    def log_time(self, model_name, model_type, fit_level, train_time):
+    def log_time(self, model_name, model_type, fit_level, train_time, features=None):
 
-        self._spend += [
-            {
-                "model_name": model_name,
-                "model_type": model_type,
-                "fit_level": fit_level,
-                "train_time": train_time,
-            }
-        ]
+        record = {
+            "model_name": model_name,
+            "model_type": model_type,
+            "fit_level": fit_level,
+            "train_time": train_time,
+        }
+        if features is not None:
+            record["features"] = features
+        self._spend += [record]
         # print(pd.DataFrame(self._spend))
         # print("Already spend", self.already_spend())
 
@@ -14,11 +14,6 @@ from supervised.algorithms.registry import (
     REGRESSION,
 )
 from sklearn.metrics import (
-    f1_score,
-    accuracy_score,
-    precision_score,
-    recall_score,
-    matthews_corrcoef,
     roc_auc_score,
     confusion_matrix,
     classification_report,
@@ -40,6 +35,62 @@ from tabulate import tabulate
 
 
 class AdditionalMetrics:
+    @staticmethod
+    def binary_cumulative_counts(target, predictions, sample_weight=None):
+        """Sorts predictions and computes cumulative weights of positive
+        and negative samples, used to get confusion matrix at any threshold"""
+        target = np.array(target).ravel()
+        predictions = np.array(predictions).ravel()
+        weights = (
+            np.ones(len(target))
+            if sample_weight is None
+            else np.array(sample_weight, dtype=float).ravel()
+        )
+        order = np.argsort(predictions, kind="mergesort")
+        positive = target[order] == 1
+        sorted_weights = weights[order]
+        return {
+            "sorted_predictions": predictions[order],
+            # weights of samples with predictions <= sorted_predictions[i-1]
+            "positive": np.concatenate([[0], np.cumsum(sorted_weights * positive)]),
+            "negative": np.concatenate([[0], np.cumsum(sorted_weights * ~positive)]),
+        }
+
+    @staticmethod
+    def binary_threshold_metrics(counts, thresholds):
+        """Computes metrics for response (predictions > threshold)
+        for all thresholds at once"""
+        k = np.searchsorted(
+            counts["sorted_predictions"],
+            np.array(thresholds, dtype=float),
+            side="right",
+        )
+        total_positive, total_negative = counts["positive"][-1], counts["negative"][-1]
+        tp = total_positive - counts["positive"][k]
+        fp = total_negative - counts["negative"][k]
+        fn = total_positive - tp
+        tn = total_negative - fp
+
+        def safe_divide(a, b):
+            # zero when the metric is undefined, as in sklearn
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return np.where(b > 0, a / np.where(b > 0, b, 1), 0.0)
+
+        return {
+            "tp": tp,
+            "fp": fp,
+            "fn": fn,
+            "tn": tn,
+            "f1": safe_divide(2 * tp, 2 * tp + fp + fn),
+            "accuracy": safe_divide(tp + tn, total_positive + total_negative),
+            "precision": safe_divide(tp, tp + fp),
+            "recall": safe_divide(tp, tp + fn),
+            "mcc": safe_divide(
+                tp * tn - fp * fn,
+                np.sqrt((tp + fp) * (tp + fn) * (tn + fp) * (tn + fn)),
+            ),
+        }
+
     @staticmethod
     def binary_classification(target, predictions, sample_weight=None):
 
@@ -56,16 +107,13 @@ class AdditionalMetrics:
             pass
 
         predictions = np.array(predictions)
-        sorted_predictions = np.sort(predictions)
+        # all thresholds are evaluated with counts from sorted predictions
+        counts = AdditionalMetrics.binary_cumulative_counts(
+            target, predictions, sample_weight
+        )
+        sorted_predictions = counts["sorted_predictions"]
         STEPS = 100  # can go lower for speed increase ???
-        details = {
-            "threshold": [],
-            "f1": [],
-            "accuracy": [],
-            "precision": [],
-            "recall": [],
-            "mcc": [],
-        }
+        thresholds = []
         samples_per_step = max(1, np.floor(predictions.shape[0] / STEPS))
 
         for i in range(STEPS):
@@ -79,27 +127,23 @@ class AdditionalMetrics:
                     0.5 * (sorted_predictions[idx] + sorted_predictions[idx + 1])
                 )
 
-            if np.sum(predictions > th) < 1:
+            # number of samples with predictions > th
+            if (
+                len(sorted_predictions)
+                - np.searchsorted(sorted_predictions, th, side="right")
+                < 1
+            ):
                 break
-            response = (predictions > th).astype(int)
+            thresholds += [th]
 
-            details["threshold"] += [th]
-            details["f1"] += [f1_score(target, response, sample_weight=sample_weight)]
-            details["accuracy"] += [
-                accuracy_score(target, response, sample_weight=sample_weight)
-            ]
-            details["precision"] += [
-                precision_score(target, response, sample_weight=sample_weight)
-            ]
-            details["recall"] += [
-                recall_score(target, response, sample_weight=sample_weight)
-            ]
-            if i == 0:
-                details["mcc"] += [0.0]
-            else:
-                details["mcc"] += [
-                    matthews_corrcoef(target, response, sample_weight=sample_weight)
-                ]
+        details = AdditionalMetrics.binary_threshold_metrics(counts, thresholds)
+        details["threshold"] = thresholds
+        if len(thresholds):
+            details["mcc"][0] = 0.0
+        details = {
+            k: list(details[k])
+            for k in ["threshold", "f1", "accuracy", "precision", "recall", "mcc"]
+        }
 
         # max metrics
         max_metrics = {
@@ -137,8 +181,9 @@ class AdditionalMetrics:
 
         threshold = float(max_metrics["accuracy"]["threshold"])
 
-        # updating resopnse variable for accuracy metric
-        response = (predictions > threshold).astype(int)
+        threshold_metrics = AdditionalMetrics.binary_threshold_metrics(
+            counts, [threshold]
+        )
 
         # accuracy threshold metrics
         accuracy_threshold_metrics = {
@@ -152,28 +197,17 @@ class AdditionalMetrics:
                 ),
                 "threshold": None,
             },  # there is no threshold for AUC
-            "f1": {
-                "score": f1_score(target, response, sample_weight=sample_weight),
-                "threshold": threshold,
-            },
+            "f1": {"score": threshold_metrics["f1"][0], "threshold": threshold},
             "accuracy": {
-                "score": accuracy_score(target, response, sample_weight=sample_weight),
+                "score": threshold_metrics["accuracy"][0],
                 "threshold": threshold,
             },
             "precision": {
-                "score": precision_score(target, response, sample_weight=sample_weight),
-                "threshold": threshold,
-            },
-            "recall": {
-                "score": recall_score(target, response, sample_weight=sample_weight),
-                "threshold": threshold,
-            },
-            "mcc": {
-                "score": matthews_corrcoef(
-                    target, response, sample_weight=sample_weight
-                ),
+                "score": threshold_metrics["precision"][0],
                 "threshold": threshold,
             },
+            "recall": {"score": threshold_metrics["recall"][0], "threshold": threshold},
+            "mcc": {"score": threshold_metrics["mcc"][0], "threshold": threshold},
         }
 
         # if sample_weight is not None:
@@ -184,9 +218,14 @@ class AdditionalMetrics:
 
         # confusion matrix
 
-        conf_matrix = confusion_matrix(
-            target, predictions > threshold, sample_weight=sample_weight
+        conf_matrix = np.array(
+            [
+                [threshold_metrics["tn"][0], threshold_metrics["fp"][0]],
+                [threshold_metrics["fn"][0], threshold_metrics["tp"][0]],
+            ]
         )
+        if sample_weight is None:
+            conf_matrix = conf_matrix.astype(int)
 
         conf_matrix = pd.DataFrame(
             conf_matrix,
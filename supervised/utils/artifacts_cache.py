@@ -0,0 +1,251 @@
+import os
+import json
+import uuid
+import shutil
+import hashlib
+import joblib
+import logging
+import pandas as pd
+
+from supervised.utils.config import LOG_LEVEL
+
+logger = logging.getLogger(__name__)
+logger.setLevel(LOG_LEVEL)
+
+
+class ArtifactsCache(object):
+    """Keeps data-dependent artifacts in a directory shared by AutoML runs.
+
+    Artifacts are stored under the fingerprint of the training data
+    (X, y, sample_weight) and keyed by the validation params and the
+    params of the artifact, so a new run on the same data reuses them.
+    The least recently used artifacts are removed when the cache is
+    larger than `max_size` MB. Hits and misses are logged in the
+    `results_path` of the run.
+    """
+
+    STATS_FILE = "artifacts_cache.jsonl"
+    # keys with paths specific to the run
+    RUN_KEYS = ["results_path", "artifacts_cache"]
+    PATH_KEYS = ["X_path", "y_path", "sample_weight_path", "cv_path"]
+
+    def __init__(self, params, validation_params=None):
+        self._path = params["path"]
+        self._max_size = params.get("max_size", 1024)
+        self._fingerprint = params["fingerprint"]
+        self._results_path = params.get("results_path")
+        self._validation = ArtifactsCache._strip(validation_params or {})
+
+    @staticmethod
+    def from_params(validation_params):
+        """Returns the cache set in validation params, None if it is not used."""
+        params = (validation_params or {}).get("artifacts_cache")
+        if params is None:
+            return None
+        # stacked data and boosted sample weights are not in the fingerprint
+        X_path = validation_params.get("X_path")
+        if X_path is not None and os.path.basename(X_path) != "X.data":
+            return None
+        sample_weight_path = validation_params.get("sample_weight_path")
+        if (
+            sample_weight_path is not None
+            and os.path.basename(sample_weight_path) != "sample_weight.data"
+        ):
+            return None
+        cv_path = validation_params.get("cv_path")
+        if cv_path is not None:
+            # custom folds are in the key, other splits give other artifacts
+            try:
+                with open(cv_path, "rb") as fin:
+                    cv_hash = hashlib.md5(fin.read()).hexdigest()
+            except OSError as e:
+                logger.warning(f"Cannot read custom folds, cache is not used. {str(e)}")
+                return None
+            validation_params = dict(validation_params, cv_hash=cv_hash)
+        return ArtifactsCache(params, validation_params)
+
+    @staticmethod
+    def fingerprint(X, y, sample_weight=None):
+        """Returns the hash of the data content, index is not used."""
+        md5 = hashlib.md5()
+        for data in [X, y, sample_weight]:
+            if data is None:
+                md5.update(b"None")
+                continue
+            if isinstance(data, pd.DataFrame):
+                dtypes = [[str(c), str(t)] for c, t in data.dtypes.items()]
+            else:
+                dtypes = [str(data.name), str(data.dtype)]
+            md5.update(json.dumps(dtypes).encode("utf-8"))
+            md5.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+        return md5.hexdigest()
+
+    @staticmethod
+    def _strip(params):
+        if isinstance(params, dict):
+            return {
+                k: os.path.basename(v)
+                if k in ArtifactsCache.PATH_KEYS and isinstance(v, str)
+                else ArtifactsCache._strip(v)
+                for k, v in params.items()
+                if k not in ArtifactsCache.RUN_KEYS
+            }
+        if isinstance(params, (list, tuple)):
+            return [ArtifactsCache._strip(v) for v in params]
+        return params
+
+    def _entry(self, name, params):
+        desc = json.dumps(
+            {"validation": self._validation, "params": ArtifactsCache._strip(params)},
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.md5(desc.encode("utf-8")).hexdigest()
+        return os.path.join(self._path, self._fingerprint, f"{name}_{key}")
+
+    def _log(self, name, hit):
+        if self._results_path is None or not os.path.exists(self._results_path):
+            return
+        with open(
+            os.path.join(self._results_path, ArtifactsCache.STATS_FILE), "a"
+        ) as fout:
+            fout.write(json.dumps({"artifact": name, "hit": hit}) + "\n")
+
+    def get(self, name, params=None):
+        """Returns the path of cached artifact or None."""
+        entry = self._entry(name, params)
+        try:
+            # mark as recently used
+            os.utime(entry)
+        except OSError:
+            self._log(name, False)
+            return None
+        self._log(name, True)
+        return entry
+
+    def restore(self, name, params, destination):
+        """Copies cached file or directory to the destination, returns True on hit."""
+        entry = self.get(name, params)
+        if entry is None:
+            return False
+        try:
+            if os.path.isdir(entry):
+                ArtifactsCache._copy_into(entry, destination)
+            else:
+                shutil.copyfile(entry, destination)
+        except OSError as e:
+            logger.warning(f"Cannot restore {name} from the artifacts cache. {str(e)}")
+            return False
+        return True
+
+    def set(self, name, params, source):
+        """Copies file or directory into the cache."""
+        if not os.path.exists(source):
+            return
+        self._write(name, params, lambda tmp: self._copy(source, tmp))
+
+    def get_object(self, name, params=None):
+        entry = self.get(name, params)
+        if entry is None:
+            return None
+        try:
+            return joblib.load(entry)
+        except Exception:
+            return None
+
+    def set_object(self, name, params, obj):
+        self._write(name, params, lambda tmp: joblib.dump(obj, tmp, compress=True))
+
+    @staticmethod
+    def _copy_into(source, destination):
+        # files are copied into the existing directory
+        for root, _, files in os.walk(source):
+            target = os.path.join(destination, os.path.relpath(root, source))
+            os.makedirs(target, exist_ok=True)
+            for f in files:
+                shutil.copyfile(os.path.join(root, f), os.path.join(target, f))
+
+    @staticmethod
+    def _copy(source, destination):
+        if os.path.isdir(source):
+            shutil.copytree(source, destination)
+        else:
+            shutil.copyfile(source, destination)
+
+    def _write(self, name, params, write):
+        entry = self._entry(name, params)
+        if os.path.exists(entry):
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        # other runs can read the cache, the entry is written with rename
+        tmp = f"{entry}.tmp_{uuid.uuid4().hex}"
+        try:
+            write(tmp)
+            os.replace(tmp, entry)
+            os.utime(entry)
+        except OSError as e:
+            logger.warning(f"Cannot write {name} to the artifacts cache. {str(e)}")
+        finally:
+            if os.path.isdir(tmp):
+                shutil.rmtree(tmp, ignore_errors=True)
+            elif os.path.exists(tmp):
+                os.remove(tmp)
+        self.evict()
+
+    @staticmethod
+    def _size(path):
+        if not os.path.isdir(path):
+            return os.path.getsize(path)
+        return sum(
+            os.path.getsize(os.path.join(root, f))
+            for root, _, files in os.walk(path)
+            for f in files
+        )
+
+    def evict(self):
+        """Removes the least recently used artifacts above the size limit."""
+        entries = []
+        for fingerprint in os.listdir(self._path):
+            fingerprint_path = os.path.join(self._path, fingerprint)
+            if not os.path.isdir(fingerprint_path):
+                continue
+            for name in os.listdir(fingerprint_path):
+                if ".tmp_" in name:
+                    continue
+                entry = os.path.join(fingerprint_path, name)
+                try:
+                    entries += [(os.path.getmtime(entry), self._size(entry), entry)]
+                except OSError:
+                    pass
+        total_size = sum(e[1] for e in entries)
+        max_size = self._max_size * 1024 * 1024
+        for _, size, entry in sorted(entries):
+            if total_size <= max_size:
+                break
+            if os.path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            elif os.path.exists(entry):
+                os.remove(entry)
+            total_size -= size
+        for fingerprint in os.listdir(self._path):
+            fingerprint_path = os.path.join(self._path, fingerprint)
+            if os.path.isdir(fingerprint_path) and not os.listdir(fingerprint_path):
+                shutil.rmtree(fingerprint_path, ignore_errors=True)
+
+    @staticmethod
+    def stats(results_path):
+        """Returns DataFrame with hits and misses of each artifact in the run."""
+        fname = os.path.join(results_path, ArtifactsCache.STATS_FILE)
+        if not os.path.exists(fname):
+            return None
+        with open(fname) as fin:
+            df = pd.DataFrame([json.loads(line) for line in fin if line.strip()])
+        if df.empty:
+            return None
+        df["miss"] = ~df["hit"]
+        return (
+            df.groupby("artifact", sort=True)[["hit", "miss"]]
+            .sum()
+            .rename(columns={"hit": "hits", "miss": "misses"})
+            .reset_index()
+        )
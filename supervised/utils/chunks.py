@@ -0,0 +1,102 @@
+import os
+import queue
+import threading
+import numpy as np
+import pandas as pd
+
+from supervised.exceptions import AutoMLException
+
+
+def read_chunks(source, chunk_size):
+    """Returns generator of DataFrames with at most `chunk_size` rows from
+    the `source`. Arguments are checked at the call.
+
+    The `source` can be a path to CSV or parquet file, a DataFrame,
+    a NumPy array or an iterable of DataFrames (or arrays).
+    """
+    if chunk_size is None or int(chunk_size) < 1:
+        raise AutoMLException("chunk_size must be a positive integer")
+    if isinstance(source, str) and not os.path.exists(source):
+        raise AutoMLException(f"File {source} does not exist")
+    return _read_chunks(source, int(chunk_size))
+
+
+def _read_chunks(source, chunk_size):
+    if isinstance(source, str):
+        if source.lower().endswith((".parquet", ".pq")):
+            yield from _read_parquet(source, chunk_size)
+        else:
+            with pd.read_csv(source, chunksize=chunk_size) as reader:
+                yield from reader
+    elif isinstance(source, (pd.DataFrame, np.ndarray)):
+        for start in range(0, source.shape[0], chunk_size):
+            if isinstance(source, pd.DataFrame):
+                yield source.iloc[start : start + chunk_size]
+            else:
+                yield source[start : start + chunk_size]
+    else:
+        # iterable of chunks, large chunks are split
+        for chunk in source:
+            if chunk.shape[0] > chunk_size:
+                yield from _read_chunks(chunk, chunk_size)
+            elif chunk.shape[0] > 0:
+                yield chunk
+
+
+def _read_parquet(fname, chunk_size):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise AutoMLException(
+            "Reading parquet files in chunks requires pyarrow. Please install it with `pip install pyarrow`."
+        )
+    parquet_file = pq.ParquetFile(fname)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size):
+        yield batch.to_pandas()
+
+
+_END = object()
+
+
+def prefetch(iterator, size=2):
+    """Computes items of the `iterator` in a background thread.
+
+    At most `size` items are waiting in the queue, so memory is bounded.
+    Exceptions are raised in the consumer thread.
+    """
+    items = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def worker():
+        try:
+            for item in iterator:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_END, e))
+            return
+        put((_END, None))
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        # consumer stopped early, release the worker
+        stop.set()
+        thread.join()
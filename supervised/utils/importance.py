@@ -12,6 +12,7 @@ from supervised.algorithms.registry import (
     REGRESSION,
 )
 from supervised.utils.subsample import subsample
+from supervised.utils.sparse import to_dense
 
 logger = logging.getLogger(__name__)
 from supervised.utils.config import LOG_LEVEL
@@ -69,6 +70,8 @@ class PermutationImportance:
                 else:
                     X_vald = X_validation
                     y_vald = y_validation
+                # columns are permuted in place, it is not possible in sparse columns
+                X_vald = to_dense(X_vald)
 
                 importance = permutation_importance(
                     model,
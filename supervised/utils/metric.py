@@ -18,7 +18,96 @@ from sklearn.metrics import average_precision_score
 from sklearn.metrics import accuracy_score
 
 
+def _numeric_array(values):
+    # 1-d or 2-d float array with finite values, None for unusual input
+    if values is None:
+        return None
+    values = np.asarray(values)
+    if values.dtype.kind not in "biuf" or values.ndim not in [1, 2]:
+        return None
+    if values.ndim == 2 and values.shape[1] == 1:
+        values = values.ravel()
+    values = values.astype(np.float64, copy=False)
+    if not np.isfinite(np.sum(values)):
+        return None
+    return values
+
+
+def _prepare(y_true, y_predicted, sample_weight=None):
+    """Converts input to arrays for NumPy kernels.
+
+    Returns None for input that should be handled by sklearn,
+    for example: missing values, not numeric values or wrong shapes.
+    """
+    y_true = _numeric_array(y_true)
+    y_predicted = _numeric_array(y_predicted)
+    if y_true is None or y_predicted is None or y_true.ndim != 1:
+        return None
+    if y_true.shape[0] != y_predicted.shape[0] or y_true.shape[0] < 2:
+        return None
+    if sample_weight is not None:
+        sample_weight = _numeric_array(sample_weight)
+        if (
+            sample_weight is None
+            or sample_weight.shape != y_true.shape
+            or np.sum(sample_weight) <= 0
+        ):
+            return None
+    return y_true, y_predicted, sample_weight
+
+
+def _average(values, sample_weight=None):
+    if sample_weight is None:
+        return np.mean(values)
+    return np.dot(values, sample_weight) / np.sum(sample_weight)
+
+
+def _binary_target(y_true):
+    # boolean positive class mask if target has exactly two values
+    low, high = np.min(y_true), np.max(y_true)
+    if low == high:
+        return None
+    positive = y_true == high
+    if not np.all(positive | (y_true == low)):
+        return None
+    return positive
+
+
+def _multiclass_target(y_true, classes_cnt):
+    # classes indices if target has values 0, 1, ..., classes_cnt-1
+    y_index = y_true.astype(np.int64)
+    if not np.array_equal(y_index, y_true) or np.min(y_index) < 0:
+        return None
+    if np.max(y_index) != classes_cnt - 1:
+        return None
+    if np.any(np.bincount(y_index, minlength=classes_cnt) == 0):
+        return None
+    return y_index
+
+
+def _logloss(y_true, y_predicted, sample_weight=None):
+    epsilon = 1e-6
+    y_predicted = np.clip(y_predicted, epsilon, 1 - epsilon)
+    if y_predicted.ndim == 1:
+        positive = _binary_target(y_true)
+        if positive is None:
+            return None
+        losses = -np.log(np.where(positive, y_predicted, 1 - y_predicted))
+    else:
+        y_index = _multiclass_target(y_true, y_predicted.shape[1])
+        if y_index is None:
+            return None
+        rows = np.arange(y_predicted.shape[0])
+        losses = -np.log(y_predicted[rows, y_index] / y_predicted.sum(axis=1))
+    return _average(losses, sample_weight)
+
+
 def logloss(y_true, y_predicted, sample_weight=None):
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None:
+        val = _logloss(*prepared)
+        if val is not None:
+            return val
     epsilon = 1e-6
     y_predicted = sp.maximum(epsilon, y_predicted)
     y_predicted = sp.minimum(1 - epsilon, y_predicted)
@@ -26,8 +115,36 @@ def logloss(y_true, y_predicted, sample_weight=None):
     return ll
 
 
+def mse(y_true, y_predicted, sample_weight=None):
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None and prepared[1].ndim == 1:
+        y_true, y_predicted, sample_weight = prepared
+        return _average((y_true - y_predicted) ** 2, sample_weight)
+    return mean_squared_error(y_true, y_predicted, sample_weight=sample_weight)
+
+
+def mae(y_true, y_predicted, sample_weight=None):
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None and prepared[1].ndim == 1:
+        y_true, y_predicted, sample_weight = prepared
+        return _average(np.abs(y_true - y_predicted), sample_weight)
+    return mean_absolute_error(y_true, y_predicted, sample_weight=sample_weight)
+
+
+def mape(y_true, y_predicted, sample_weight=None):
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None and prepared[1].ndim == 1:
+        y_true, y_predicted, sample_weight = prepared
+        epsilon = np.finfo(np.float64).eps
+        errors = np.abs(y_true - y_predicted) / np.maximum(np.abs(y_true), epsilon)
+        return _average(errors, sample_weight)
+    return mean_absolute_percentage_error(
+        y_true, y_predicted, sample_weight=sample_weight
+    )
+
+
 def rmse(y_true, y_predicted, sample_weight=None):
-    val = mean_squared_error(y_true, y_predicted, sample_weight=sample_weight)
+    val = mse(y_true, y_predicted, sample_weight=sample_weight)
     return np.sqrt(val) if val > 0 else -np.Inf
 
 
@@ -36,18 +153,85 @@ def rmsle(y_true, y_predicted, sample_weight=None):
     return np.sqrt(val) if val > 0 else -np.Inf
 
 
+def _auc(y_true, y_predicted, sample_weight=None):
+    # area under ROC curve from the rank statistic,
+    # tied predictions count as half
+    positive = _binary_target(y_true)
+    if positive is None or y_predicted.ndim != 1:
+        return None
+    if sample_weight is None:
+        ranks = sp.stats.rankdata(y_predicted)
+        n_pos = np.sum(positive)
+        n_neg = len(positive) - n_pos
+        return (np.sum(ranks[positive]) - n_pos * (n_pos + 1) / 2.0) / (
+            n_pos * n_neg
+        )
+    order = np.argsort(y_predicted, kind="mergesort")
+    sorted_predicted = y_predicted[order]
+    w_pos = np.where(positive[order], sample_weight[order], 0.0)
+    w_neg = sample_weight[order] - w_pos
+    # sum weights in groups of tied predictions
+    starts = np.concatenate(
+        [[0], np.flatnonzero(sorted_predicted[1:] != sorted_predicted[:-1]) + 1]
+    )
+    w_pos = np.add.reduceat(w_pos, starts)
+    w_neg = np.add.reduceat(w_neg, starts)
+    total_pos, total_neg = np.sum(w_pos), np.sum(w_neg)
+    if total_pos <= 0 or total_neg <= 0:
+        return None
+    neg_below = np.cumsum(w_neg) - w_neg
+    return np.sum(w_pos * (neg_below + 0.5 * w_neg)) / (total_pos * total_neg)
+
+
 def negative_auc(y_true, y_predicted, sample_weight=None):
-    val = roc_auc_score(y_true, y_predicted, sample_weight=sample_weight)
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    val = None if prepared is None else _auc(*prepared)
+    if val is None:
+        val = roc_auc_score(y_true, y_predicted, sample_weight=sample_weight)
     return -1.0 * val
 
 
 def negative_r2(y_true, y_predicted, sample_weight=None):
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None and prepared[1].ndim == 1:
+        y_true, y_predicted, sample_weight = prepared
+        weight = 1.0 if sample_weight is None else sample_weight
+        numerator = np.sum(weight * (y_true - y_predicted) ** 2)
+        denominator = np.sum(
+            weight * (y_true - _average(y_true, sample_weight)) ** 2
+        )
+        if denominator != 0:
+            return -1.0 * (1 - numerator / denominator)
+        # the same as in sklearn for constant target
+        return -1.0 if numerator == 0 else 0.0
     val = r2_score(y_true, y_predicted, sample_weight=sample_weight)
     return -1.0 * val
 
 
+def _labels_at_half(y_true, y_predicted):
+    # labels predicted with 0.5 threshold or argmax for multiclass
+    if y_predicted.ndim == 1:
+        if not np.all((y_true == 0) | (y_true == 1)):
+            return None
+        return (y_predicted > 0.5).astype(np.float64)
+    return np.argmax(y_predicted, axis=1).astype(np.float64)
+
+
 def negative_f1(y_true, y_predicted, sample_weight=None):
 
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None:
+        y, y_pred, weight = prepared
+        labels = _labels_at_half(y, y_pred)
+        if labels is not None:
+            weight = np.ones(len(y)) if weight is None else weight
+            if y_pred.ndim == 1:
+                tp = np.sum(weight[(labels == 1) & (y == 1)])
+                fp_fn = np.sum(weight[labels != y])
+                return -(2 * tp / (2 * tp + fp_fn)) if tp > 0 else -0.0
+            # micro f1 is equal to accuracy
+            return -np.sum(weight[labels == y]) / np.sum(weight)
+
     if isinstance(y_true, pd.DataFrame):
         y_true = np.array(y_true)
     if isinstance(y_predicted, pd.DataFrame):
@@ -71,6 +255,13 @@ def negative_f1(y_true, y_predicted, sample_weight=None):
 
 def negative_accuracy(y_true, y_predicted, sample_weight=None):
 
+    prepared = _prepare(y_true, y_predicted, sample_weight)
+    if prepared is not None:
+        y, y_pred, weight = prepared
+        labels = _labels_at_half(y, y_pred)
+        if labels is not None:
+            return -_average((labels == y).astype(np.float64), weight)
+
     if isinstance(y_true, pd.DataFrame):
         y_true = np.array(y_true)
     if isinstance(y_predicted, pd.DataFrame):
@@ -101,14 +292,32 @@ def negative_average_precision(y_true, y_predicted, sample_weight=None):
     return -val
 
 
+def _pearson(x, y):
+    x = x - np.mean(x)
+    y = y - np.mean(y)
+    return np.dot(x, y) / np.sqrt(np.dot(x, x) * np.dot(y, y))
+
+
 def negative_spearman(y_true, y_predicted, sample_weight=None):
     # sample weight is ignored
+    prepared = _prepare(y_true, y_predicted)
+    if prepared is not None and prepared[1].ndim == 1:
+        y_true, y_predicted, _ = prepared
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -_pearson(
+                sp.stats.rankdata(y_true), sp.stats.rankdata(y_predicted)
+            )
     c, _ = sp.stats.spearmanr(y_true, y_predicted)
     return -c
 
 
 def negative_pearson(y_true, y_predicted, sample_weight=None):
     # sample weight is ignored
+    prepared = _prepare(y_true, y_predicted)
+    if prepared is not None and prepared[1].ndim == 1:
+        y_true, y_predicted, _ = prepared
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return -_pearson(y_true, y_predicted)
     if isinstance(y_true, pd.DataFrame):
         y_true = np.array(y_true).ravel()
     if isinstance(y_predicted, pd.DataFrame):
@@ -116,6 +325,65 @@ def negative_pearson(y_true, y_predicted, sample_weight=None):
     return -np.corrcoef(y_true, y_predicted)[0, 1]
 
 
+def _batch_average(values, sample_weight=None):
+    # average over rows for each candidate, values have shape (candidates, rows)
+    if sample_weight is None:
+        return values.mean(axis=1)
+    return values.dot(sample_weight) / np.sum(sample_weight)
+
+
+def logloss_batch(y_true, y_predicted, sample_weight=None):
+    epsilon = 1e-6
+    classes, y_index = np.unique(y_true, return_inverse=True)
+    if y_predicted.shape[2] == 1:
+        if len(classes) != 2:
+            return None
+        p = np.clip(y_predicted[:, :, 0], epsilon, 1 - epsilon)
+        losses = -np.where(y_index == 1, np.log(p), np.log(1 - p))
+    else:
+        if len(classes) != y_predicted.shape[2]:
+            return None
+        p = np.clip(y_predicted, epsilon, 1 - epsilon)
+        rows = np.arange(p.shape[1])
+        losses = -np.log(p[:, rows, y_index] / p.sum(axis=2))
+    return _batch_average(losses, sample_weight)
+
+
+def mse_batch(y_true, y_predicted, sample_weight=None):
+    if y_predicted.shape[2] != 1:
+        return None
+    return _batch_average((y_predicted[:, :, 0] - y_true) ** 2, sample_weight)
+
+
+def rmse_batch(y_true, y_predicted, sample_weight=None):
+    val = mse_batch(y_true, y_predicted, sample_weight)
+    if val is None:
+        return None
+    return np.where(val > 0, np.sqrt(np.maximum(val, 0)), -np.Inf)
+
+
+def mae_batch(y_true, y_predicted, sample_weight=None):
+    if y_predicted.shape[2] != 1:
+        return None
+    return _batch_average(np.abs(y_predicted[:, :, 0] - y_true), sample_weight)
+
+
+def negative_auc_batch(y_true, y_predicted, sample_weight=None):
+    classes, y_index = np.unique(y_true, return_inverse=True)
+    # weighted auc is computed with sklearn
+    if y_predicted.shape[2] != 1 or len(classes) != 2 or sample_weight is not None:
+        return None
+    positives = y_index == 1
+    n_pos = np.sum(positives)
+    n_neg = len(positives) - n_pos
+    # Mann-Whitney statistic, ties get the average rank
+    ranks = sp.stats.rankdata(y_predicted[:, :, 0], axis=1)
+    auc = (ranks[:, positives].sum(axis=1) - n_pos * (n_pos + 1) / 2.0) / (
+        n_pos * n_neg
+    )
+    return -auc
+
+
 class MetricException(Exception):
     def __init__(self, message):
         Exception.__init__(self, message)
@@ -380,13 +648,13 @@ class Metric(object):
         elif self.name == "rmse":
             self.metric = rmse
         elif self.name == "mse":
-            self.metric = mean_squared_error
+            self.metric = mse
         elif self.name == "mae":
-            self.metric = mean_absolute_error
+            self.metric = mae
         elif self.name == "r2":
             self.metric = negative_r2
         elif self.name == "mape":
-            self.metric = mean_absolute_percentage_error
+            self.metric = mape
         elif self.name == "spearman":
             self.metric = negative_spearman
         elif self.name == "pearson":
@@ -407,6 +675,31 @@ class Metric(object):
     def __call__(self, y_true, y_predicted, sample_weight=None):
         return self.metric(y_true, y_predicted, sample_weight=sample_weight)
 
+    def batch(self, y_true, y_predicted, sample_weight=None):
+        """Computes the metric for many predictions at once.
+
+        y_predicted has shape (candidates, rows, columns). Returns the array
+        of scores, or None if there is no vectorized version of the metric
+        for the input.
+        """
+        metric = {
+            "logloss": logloss_batch,
+            "auc": negative_auc_batch,
+            "rmse": rmse_batch,
+            "mse": mse_batch,
+            "mae": mae_batch,
+        }.get(self.name)
+        if metric is None:
+            return None
+        y_true = np.asarray(y_true)
+        if len(y_true.shape) == 2 and y_true.shape[1] == 1:
+            y_true = y_true.ravel()
+        if len(y_true.shape) != 1:
+            return None
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight, dtype=np.float64).ravel()
+        return metric(y_true, y_predicted, sample_weight)
+
     def improvement(self, previous, current):
         if self.minimize_direction:
             return current < previous
@@ -0,0 +1,108 @@
+import os
+import json
+import hashlib
+import numpy as np
+import pandas as pd
+
+
+class OOFStore(object):
+    """Keeps out of folds predictions of all models from one `results_path`.
+
+    Predictions of each model are saved as a float32 matrix in a binary
+    `.npy` file. Target and sample weight are saved once and shared by all
+    models trained on the same rows. Arrays are memory-mapped when loaded,
+    so all consumers read the same pages and get read-only views.
+    """
+
+    STORE_DIR = "oof_store"
+
+    @staticmethod
+    def _write(fname, values):
+        # write to temporary file first, models can be saved by many processes
+        tmp_fname = f"{fname}.{os.getpid()}.tmp.npy"
+        np.save(tmp_fname, values, allow_pickle=values.dtype.kind == "O")
+        os.replace(tmp_fname, fname)
+
+    @staticmethod
+    def _save_shared(store_path, name, values):
+        # shared blocks are identified by their content
+        digest = hashlib.md5(str((values.dtype, values.shape)).encode("utf-8"))
+        if values.dtype.kind == "O":
+            digest.update(pd.util.hash_array(values.ravel()).tobytes())
+        else:
+            digest.update(np.ascontiguousarray(values).tobytes())
+        block_fname = f"{name}_{digest.hexdigest()}.npy"
+        if not os.path.exists(os.path.join(store_path, block_fname)):
+            OOFStore._write(os.path.join(store_path, block_fname), values)
+        return block_fname
+
+    @staticmethod
+    def save(results_path, model_subpath, predictions):
+        """Saves the out of folds predictions, returns the path to the
+        description file relative to `results_path`."""
+        store_path = os.path.join(results_path, OOFStore.STORE_DIR)
+        if not os.path.exists(store_path):
+            os.makedirs(store_path, exist_ok=True)
+
+        prediction_cols = [c for c in predictions.columns if "prediction" in c]
+        target_cols = [c for c in predictions.columns if "target" in c]
+
+        desc = {
+            "prediction_columns": prediction_cols,
+            "predictions": f"{model_subpath}.npy",
+            "target_columns": target_cols,
+            "target": OOFStore._save_shared(
+                store_path, "target", predictions[target_cols].values
+            ),
+            "sample_weight": None,
+        }
+        OOFStore._write(
+            os.path.join(store_path, desc["predictions"]),
+            predictions[prediction_cols].values.astype(np.float32),
+        )
+        if "sample_weight" in predictions.columns:
+            desc["sample_weight"] = OOFStore._save_shared(
+                store_path, "sample_weight", predictions["sample_weight"].values
+            )
+
+        desc_fname = os.path.join(OOFStore.STORE_DIR, f"{model_subpath}.json")
+        with open(os.path.join(results_path, desc_fname), "w") as fout:
+            fout.write(json.dumps(desc, indent=4))
+        return desc_fname
+
+    @staticmethod
+    def _load_block(fname):
+        try:
+            return np.load(fname, mmap_mode="r")
+        except ValueError:
+            # blocks with python objects can't be memory-mapped
+            values = np.load(fname, allow_pickle=True)
+            values.setflags(write=False)
+            return values
+
+    @staticmethod
+    def load(fname):
+        """Returns the out of folds predictions saved in `fname`.
+
+        Data in the returned DataFrame can't be modified in place."""
+        if fname.endswith(".csv"):
+            # predictions saved by the older versions
+            return pd.read_csv(fname)
+
+        store_path = os.path.dirname(fname)
+        with open(fname) as fin:
+            desc = json.load(fin)
+
+        oof = pd.DataFrame(
+            OOFStore._load_block(os.path.join(store_path, desc["predictions"])),
+            columns=desc["prediction_columns"],
+            copy=False,
+        )
+        target = OOFStore._load_block(os.path.join(store_path, desc["target"]))
+        for i, col in enumerate(desc["target_columns"]):
+            oof.insert(i, col, target[:, i])
+        if desc["sample_weight"] is not None:
+            oof["sample_weight"] = OOFStore._load_block(
+                os.path.join(store_path, desc["sample_weight"])
+            )
+        return oof
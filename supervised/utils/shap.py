@@ -11,6 +11,7 @@ from supervised.algorithms.registry import (
     REGRESSION,
 )
 import shap
+from supervised.utils.sparse import to_dense
 
 
 logger = logging.getLogger(__name__)
@@ -187,6 +188,7 @@ class PlotSHAP:
                 warnings.simplefilter("ignore")
                 explainer = PlotSHAP.get_explainer(algorithm, X_train)
                 X_vald, y_vald = PlotSHAP.get_sample(X_validation, y_validation)
+                X_vald = to_dense(X_vald)
                 shap_values = explainer.shap_values(X_vald)
 
             # fix problem with 1 or 2 dimensions for binary classification
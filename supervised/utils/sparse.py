@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import scipy.sparse
+
+
+def has_sparse_columns(X):
+    if not isinstance(X, pd.DataFrame):
+        return False
+    return any(isinstance(dtype, pd.SparseDtype) for dtype in X.dtypes)
+
+
+def to_csr(X):
+    """Converts data frame with sparse columns into CSR matrix, columns order is kept.
+
+    Missing values in dense columns are stored explicitly."""
+    sparse_X = X.astype(
+        {
+            column: pd.SparseDtype(np.float64, 0.0)
+            for column, dtype in X.dtypes.items()
+            if not isinstance(dtype, pd.SparseDtype)
+        }
+    )
+    return scipy.sparse.csr_matrix(sparse_X.sparse.to_coo())
+
+
+def to_dense(X):
+    if not has_sparse_columns(X):
+        return X
+    return pd.DataFrame(
+        {
+            column: X[column].sparse.to_dense()
+            if isinstance(dtype, pd.SparseDtype)
+            else X[column]
+            for column, dtype in X.dtypes.items()
+        },
+        index=X.index,
+    )
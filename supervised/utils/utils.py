@@ -1,31 +1,214 @@
-import copy
+import os
+import json
+import shutil
+import logging
 import numpy as np
 import pandas as pd
 
+from supervised.utils.config import LOG_LEVEL
+
+logger = logging.getLogger(__name__)
+logger.setLevel(LOG_LEVEL)
+
 
 class Store:
+    """In-memory store for datasets shared by AutoML components.
+
+    Each dataset is kept once and handed out as a shallow copy: readers get
+    their own frame object (index, columns) that shares the underlying
+    arrays with the stored data, so no data is copied on `get`.
+    Readers must not modify the values in place. Selecting rows with
+    `loc`, `iloc` or `take` creates new arrays, so the frames returned
+    from validators can be freely changed by the preprocessing.
+    """
+
     data = {}
+    # version of the value stored under the key, it changes on every set
+    versions = {}
+    _last_version = 0
 
     def set(self, key, value):
         Store.data[key] = value
+        Store._last_version += 1
+        Store.versions[key] = Store._last_version
+
+    def version(self, key):
+        return Store.versions.get(key)
 
     def get(self, key):
-        return copy.deepcopy(Store.data[key])
+        value = Store.data[key]
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value.copy(deep=False)
+        return value
+
+    def contains(self, key):
+        return key in Store.data
+
+    def delete(self, key):
+        Store.data.pop(key, None)
+        Store.versions.pop(key, None)
+
+    def release(self, path):
+        """Remove the data stored under the `path` key and under the `path` directory."""
+        prefix = os.path.join(path, "")
+        for key in list(Store.data.keys()):
+            if key == path or key.startswith(prefix):
+                self.delete(key)
+
+    def keys(self):
+        return list(Store.data.keys())
+
+
+class ColumnarFile:
+    """On-disk columnar format for data frames.
+
+    The data is saved in the directory `file_path` with one `.npy` file per column
+    and the `metadata.json` file with column names and types. Numeric, boolean and
+    datetime columns are saved as raw arrays and are memory-mapped on read, so only
+    the selected columns and rows are read from the disk. Other columns (for example
+    strings) are saved as integer codes with the array of unique values.
+    """
+
+    METADATA_FNAME = "metadata.json"
+
+    @staticmethod
+    def _column_kind(series):
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+            return "raw"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return "category"
+        return "codes"
+
+    @staticmethod
+    def save(file_path, df):
+        if os.path.exists(file_path):
+            shutil.rmtree(file_path, ignore_errors=True)
+        os.makedirs(file_path)
+
+        metadata = {
+            "rows": df.shape[0],
+            "columns": df.columns.tolist(),
+            "dtypes": [str(d) for d in df.dtypes],
+            "kinds": [],
+            "ordered": [],
+            "index": None,
+        }
+        for i, column in enumerate(df.columns):
+            series = df.iloc[:, i]
+            kind = ColumnarFile._column_kind(series)
+            fname = os.path.join(file_path, f"column_{i}")
+            if kind == "raw":
+                np.save(fname + ".npy", series.values)
+            elif kind == "category":
+                np.save(fname + "_codes.npy", series.cat.codes.values)
+                np.save(
+                    fname + "_uniques.npy",
+                    np.array(series.cat.categories.values),
+                    allow_pickle=True,
+                )
+            else:
+                codes, uniques = pd.factorize(series)
+                np.save(fname + "_codes.npy", codes.astype(np.int32))
+                np.save(
+                    fname + "_uniques.npy",
+                    np.array(uniques, dtype=object),
+                    allow_pickle=True,
+                )
+            metadata["kinds"] += [kind]
+            metadata["ordered"] += [kind == "category" and bool(series.cat.ordered)]
+
+        if not df.index.equals(pd.RangeIndex(df.shape[0])):
+            np.save(
+                os.path.join(file_path, "index.npy"),
+                np.array(df.index.values),
+                allow_pickle=True,
+            )
+            metadata["index"] = "index.npy"
+
+        with open(os.path.join(file_path, ColumnarFile.METADATA_FNAME), "w") as fout:
+            fout.write(json.dumps(metadata, indent=4))
+
+    @staticmethod
+    def exists(file_path):
+        return os.path.exists(os.path.join(file_path, ColumnarFile.METADATA_FNAME))
+
+    @staticmethod
+    def load(file_path, columns=None, rows=None):
+        metadata = json.load(
+            open(os.path.join(file_path, ColumnarFile.METADATA_FNAME), "r")
+        )
+        all_columns = metadata["columns"]
+        if columns is None:
+            columns = all_columns
+
+        data = {}
+        for column in columns:
+            i = all_columns.index(column)
+            kind = metadata["kinds"][i]
+            fname = os.path.join(file_path, f"column_{i}")
+            if kind == "raw":
+                values = np.load(fname + ".npy", mmap_mode="r")
+                values = np.array(values if rows is None else values[rows])
+            else:
+                codes = np.load(fname + "_codes.npy", mmap_mode="r")
+                codes = np.array(codes if rows is None else codes[rows])
+                uniques = np.load(fname + "_uniques.npy", allow_pickle=True)
+                if kind == "category":
+                    values = pd.Categorical.from_codes(
+                        codes,
+                        categories=uniques,
+                        ordered=metadata["ordered"][i],
+                    )
+                else:
+                    # missing values have code -1 and point to the last element
+                    values = np.append(uniques, np.nan)[codes]
+                    if metadata["dtypes"][i] != "object":
+                        try:
+                            values = pd.array(values, dtype=metadata["dtypes"][i])
+                        except (TypeError, ValueError) as e:
+                            # the column is kept with object values
+                            logger.warning(
+                                f"Cannot restore {metadata['dtypes'][i]} dtype "
+                                f"of column {column}. {str(e)}"
+                            )
+            data[column] = values
+
+        index = None
+        if metadata.get("index") is not None:
+            index = np.load(
+                os.path.join(file_path, metadata["index"]), allow_pickle=True
+            )
+            if rows is not None:
+                index = index[rows]
+        elif rows is not None:
+            index = np.arange(metadata["rows"])[rows]
+
+        return pd.DataFrame(data, columns=columns, index=index)
 
 
 def dump_data(file_path, df):
     store = Store()
     store.set(file_path, df)
-    # try:
-    #    df.to_parquet(file_path, index=False)
-    # except Exception as e:
-    #    df.to_csv(file_path, index=False)
+    ColumnarFile.save(file_path, df)
+
+
+def load_data(file_path, columns=None, rows=None):
+    """Load the data saved with `dump_data`. It is served from memory if available,
+    otherwise it is read from the disk. Optionally, only the `columns` subset and
+    `rows` positions are returned."""
+    store = Store()
+    if not store.contains(file_path) and ColumnarFile.exists(file_path):
+        return ColumnarFile.load(file_path, columns, rows)
+    df = store.get(file_path)
+    if columns is not None:
+        df = df[columns]
+    if rows is not None:
+        df = df.iloc[rows]
+    return df
 
 
-def load_data(file_path):
+def release_data(path):
+    """Release all data dumped under `path` (single file path or directory) from memory.
+    The data saved on the disk is kept and can be loaded again."""
     store = Store()
-    return store.get(file_path)
-    # try:
-    #    return pd.read_parquet(file_path)
-    # except Exception as e:
-    #    return pd.read_csv(file_path)
+    store.release(path)
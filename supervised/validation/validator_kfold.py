@@ -12,7 +12,8 @@ from sklearn.model_selection import KFold
 
 from supervised.validation.validator_base import BaseValidator
 from supervised.exceptions import AutoMLException
-from supervised.utils.utils import load_data
+from supervised.utils.utils import load_data, release_data, Store
+from supervised.utils.artifacts_cache import ArtifactsCache
 from supervised.utils.config import mem
 import time
 
@@ -26,6 +27,8 @@ class KFoldValidator(BaseValidator):
         self.stratify = self.params.get("stratify", False)
         self.random_seed = self.params.get("random_seed", 1906)
         self.repeats = self.params.get("repeats", 1)
+        # keep selected folds in memory to reuse them in the next models
+        self.cache_folds = self.params.get("cache_folds", False)
 
         if not self.shuffle and self.repeats > 1:
             warnings.warn("Disable repeats in validation because shuffle is disabled")
@@ -74,43 +77,83 @@ class KFoldValidator(BaseValidator):
         if not os.path.exists(folds_path):
 
             os.mkdir(folds_path)
-            X = load_data(self._X_path)
-            y = load_data(self._y_path)
-            y = y["target"]
-
-            if isinstance(y[0], bytes):
-                # see https://github.com/scikit-learn/scikit-learn/issues/16980
-                y = y.astype(str)
-
-            for repeat_cnt, skf in enumerate(self.skf):
-                for fold_cnt, (train_index, validation_index) in enumerate(
-                    skf.split(X, y)
-                ):
-                    repeat_str = f"_repeat_{repeat_cnt}" if len(self.skf) > 1 else ""
-                    train_index_file = os.path.join(
-                        self._results_path,
-                        "folds",
-                        f"fold_{fold_cnt}{repeat_str}_train_indices.npy",
-                    )
-                    validation_index_file = os.path.join(
-                        self._results_path,
-                        "folds",
-                        f"fold_{fold_cnt}{repeat_str}_validation_indices.npy",
-                    )
-
-                    np.save(train_index_file, train_index)
-                    np.save(validation_index_file, validation_index)
-            del X
-            del y
-            gc.collect()
+            # new folds, forget indices and folds kept in memory
+            release_data(folds_path)
+            # folds selected on the same data in the previous runs
+            artifacts_cache = ArtifactsCache.from_params(self.params)
+            if artifacts_cache is not None and artifacts_cache.restore(
+                "folds", None, folds_path
+            ):
+                log.debug("Folds restored from the artifacts cache")
+            else:
+                self._create_folds()
+                if artifacts_cache is not None:
+                    artifacts_cache.set("folds", None, folds_path)
 
         else:
             log.debug("Folds split already done, reuse it")
 
+    def _create_folds(self):
+        X = load_data(self._X_path)
+        y = load_data(self._y_path)
+        y = y["target"]
+
+        if isinstance(y[0], bytes):
+            # see https://github.com/scikit-learn/scikit-learn/issues/16980
+            y = y.astype(str)
+
+        for repeat_cnt, skf in enumerate(self.skf):
+            for fold_cnt, (train_index, validation_index) in enumerate(
+                skf.split(X, y)
+            ):
+                repeat_str = f"_repeat_{repeat_cnt}" if len(self.skf) > 1 else ""
+                train_index_file = os.path.join(
+                    self._results_path,
+                    "folds",
+                    f"fold_{fold_cnt}{repeat_str}_train_indices.npy",
+                )
+                validation_index_file = os.path.join(
+                    self._results_path,
+                    "folds",
+                    f"fold_{fold_cnt}{repeat_str}_validation_indices.npy",
+                )
+
+                np.save(train_index_file, train_index)
+                np.save(validation_index_file, validation_index)
+        del X
+        del y
+        gc.collect()
+
+    def _load_indices(self, index_file):
+        # indices are read once and kept in memory until the data is released
+        store = Store()
+        if not store.contains(index_file):
+            store.set(index_file, np.load(index_file))
+        return store.get(index_file)
+
     def get_split(self, k, repeat=0):
 
         repeat_str = f"_repeat_{repeat}" if self.repeats > 1 else ""
 
+        store = Store()
+        data_paths = [self._X_path, self._y_path, self._sample_weight_path]
+        data_paths = [p for p in data_paths if p is not None]
+        data_versions = [store.version(p) for p in data_paths]
+        # folds are shared by models trained on different data (stacked, boosted)
+        data_str = "_".join([os.path.basename(p) for p in data_paths])
+        fold_key = os.path.join(
+            self._results_path, "folds", f"fold_{k}{repeat_str}_{data_str}"
+        )
+        if self.cache_folds and store.contains(fold_key):
+            versions, train_data, validation_data = store.get(fold_key)
+            # the fold can be reused only if it was selected from the same data
+            if versions == data_versions:
+                # preprocessing modifies the data in place, return copies
+                return (
+                    {key: value.copy() for key, value in train_data.items()},
+                    {key: value.copy() for key, value in validation_data.items()},
+                )
+
         train_index_file = os.path.join(
             self._results_path, "folds", f"fold_{k}{repeat_str}_train_indices.npy"
         )
@@ -118,10 +161,9 @@ class KFoldValidator(BaseValidator):
             self._results_path, "folds", f"fold_{k}{repeat_str}_validation_indices.npy"
         )
 
-        train_index = np.load(train_index_file)
-        validation_index = np.load(validation_index_file)
+        train_index = self._load_indices(train_index_file)
+        validation_index = self._load_indices(validation_index_file)
 
-        X = load_data(self._X_path)
         y = load_data(self._y_path)
         y = y["target"]
 
@@ -130,11 +172,26 @@ class KFoldValidator(BaseValidator):
             sample_weight = load_data(self._sample_weight_path)
             sample_weight = sample_weight["sample_weight"]
 
-        train_data = {"X": X.loc[train_index], "y": y.loc[train_index]}
-        validation_data = {"X": X.loc[validation_index], "y": y.loc[validation_index]}
+        # indices are positions of rows, they are sorted,
+        # so rows are gathered in the order of the data
+        train_data = {
+            "X": load_data(self._X_path, rows=train_index),
+            "y": y.take(train_index),
+        }
+        validation_data = {
+            "X": load_data(self._X_path, rows=validation_index),
+            "y": y.take(validation_index),
+        }
         if sample_weight is not None:
-            train_data["sample_weight"] = sample_weight.loc[train_index]
-            validation_data["sample_weight"] = sample_weight.loc[validation_index]
+            train_data["sample_weight"] = sample_weight.take(train_index)
+            validation_data["sample_weight"] = sample_weight.take(validation_index)
+
+        if self.cache_folds:
+            store.set(fold_key, (data_versions, train_data, validation_data))
+            return (
+                {key: value.copy() for key, value in train_data.items()},
+                {key: value.copy() for key, value in validation_data.items()},
+            )
 
         return (train_data, validation_data)
 
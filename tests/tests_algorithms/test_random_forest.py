@@ -73,6 +73,20 @@ class RandomForestAlgorithmTest(unittest.TestCase):
                 assert_almost_equal(prev_loss, loss)
             prev_loss = loss
 
+    def test_snapshot(self):
+        params = {"trees_in_step": 1, "seed": 1, "ml_task": "binary_classification"}
+        model = RandomForestAlgorithm(params)
+        model.fit(self.X, self.y)
+        snapshot = model.get_snapshot()
+        self.assertEqual(snapshot, 1)
+        y_predicted = model.predict(self.X)
+        # add more trees with warm start
+        model.fit(self.X, self.y)
+        self.assertEqual(len(model.model.estimators_), 2)
+        model.restore_snapshot(snapshot)
+        self.assertEqual(len(model.model.estimators_), 1)
+        assert_almost_equal(y_predicted, model.predict(self.X))
+
     def test_fit_predict(self):
         metric = Metric({"name": "logloss"})
         params = {"ml_task": "binary_classification"}
@@ -0,0 +1,83 @@
+import unittest
+import shutil
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_almost_equal
+from sklearn import datasets
+
+from supervised import AutoML
+from supervised.exceptions import AutoMLException
+
+
+class CompiledPredictorTest(unittest.TestCase):
+
+    automl_dir = "automl_compiled_predictor"
+
+    def tearDown(self):
+        shutil.rmtree(self.automl_dir, ignore_errors=True)
+
+    def test_binary_classification(self):
+        X, y = datasets.make_classification(n_samples=300, n_features=5, random_state=0)
+        X = pd.DataFrame(X, columns=[f"f{i}" for i in range(5)])
+        X["cat"] = np.random.RandomState(1).choice(["a", "b", "c"], X.shape[0])
+        X.loc[::5, "f1"] = np.nan
+        y = np.where(y == 1, "yes", "no")
+
+        automl = AutoML(
+            results_path=self.automl_dir,
+            algorithms=["Linear", "Xgboost"],
+            explain_level=0,
+            start_random_models=1,
+            golden_features=True,
+            validation_strategy={
+                "validation_type": "kfold",
+                "k_folds": 3,
+                "shuffle": True,
+                "stratify": True,
+            },
+        )
+        automl.fit(X, y)
+
+        predictor = automl.compile_predictor()
+        self.assertTrue(predictor.is_compiled())
+        for i in range(10):
+            row = X.iloc[i].to_dict()
+            assert_almost_equal(
+                predictor.predict_proba(row), automl.predict_proba(X.iloc[[i]])[0]
+            )
+            self.assertEqual(predictor.predict(row), automl.predict(X.iloc[[i]])[0])
+        # not seen category
+        row = X.iloc[0].to_dict()
+        row["cat"] = "new"
+        assert_almost_equal(
+            predictor.predict_proba(row),
+            automl.predict_proba(pd.DataFrame([row]))[0],
+        )
+
+        row = X.iloc[0].to_dict()
+        del row["cat"]
+        with self.assertRaises(AutoMLException):
+            predictor.predict(row)
+
+    def test_regression(self):
+        X, y = datasets.make_regression(
+            n_samples=200, n_features=4, noise=0.1, random_state=0
+        )
+        automl = AutoML(
+            results_path=self.automl_dir,
+            algorithms=["Linear", "Neural Network"],
+            explain_level=0,
+            start_random_models=1,
+            train_ensemble=True,
+        )
+        automl.fit(X, y)
+
+        predictor = automl.compile_predictor()
+        self.assertTrue(predictor.is_compiled())
+        for i in range(10):
+            # numpy array as input
+            assert_almost_equal(
+                predictor.predict(X[i]), automl.predict(X[i : i + 1])[0]
+            )
+        with self.assertRaises(AutoMLException):
+            predictor.predict_proba(X[0])
@@ -0,0 +1,51 @@
+import shutil
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+
+
+class ModelFrameworkPredictTest(unittest.TestCase):
+
+    automl_dir = "automl_model_framework_predict"
+
+    def tearDown(self):
+        shutil.rmtree(self.automl_dir, ignore_errors=True)
+
+    def _check_predict(self, model, X):
+        # average of predictions from each learner
+        y_expected = 0
+        for preprocessing, learner in zip(model.preprocessings, model.learners):
+            X_data, _, _ = preprocessing.transform(X.copy(), None)
+            y_expected += preprocessing.inverse_scale_target(learner.predict(X_data))
+        y_expected /= float(len(model.learners))
+
+        y_predicted = model.predict(X)
+        self.assertTrue(np.allclose(y_predicted["prediction"].values, y_expected))
+
+    def test_predict(self):
+        X, y = datasets.make_regression(
+            n_samples=100, n_features=5, n_informative=4, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+        # missing values are filled with median from each fold
+        X_missing = X.copy()
+        X_missing.loc[::7, "f_0"] = np.nan
+
+        for X_train, groups_cnt in [(X, 1), (X_missing, 3)]:
+            automl = AutoML(
+                results_path=self.automl_dir,
+                algorithms=["Decision Tree"],
+                explain_level=0,
+                train_ensemble=False,
+                start_random_models=1,
+                validation_strategy={"validation_type": "kfold", "k_folds": 3},
+            )
+            automl.fit(X_train, y)
+            model = automl._models[0]
+            self.assertEqual(len(model._get_preprocessings_groups()), groups_cnt)
+            self._check_predict(model, X_train)
+            shutil.rmtree(self.automl_dir, ignore_errors=True)
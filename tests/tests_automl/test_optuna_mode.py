@@ -0,0 +1,48 @@
+import os
+import json
+import shutil
+import unittest
+
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+
+
+class AutoMLOptunaModeTest(unittest.TestCase):
+
+    automl_dir = "automl_optuna_mode"
+
+    def tearDown(self):
+        shutil.rmtree(self.automl_dir, ignore_errors=True)
+
+    def test_optuna_mode(self):
+        X, y = datasets.make_classification(
+            n_samples=200, n_features=5, n_informative=4, n_redundant=1, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+
+        automl = AutoML(
+            results_path=self.automl_dir,
+            mode="Optuna",
+            algorithms=["Extra Trees"],
+            optuna_time_budget=5,
+            optuna_verbose=False,
+            explain_level=0,
+            train_ensemble=False,
+            start_random_models=1,
+            validation_strategy={
+                "validation_type": "kfold",
+                "k_folds": 2,
+                "shuffle": True,
+                "stratify": True,
+            },
+        )
+        automl.fit(X, y)
+        self.assertTrue(len(automl._models) > 0)
+        self.assertTrue(
+            os.path.exists(os.path.join(self.automl_dir, "optuna", "optuna.json"))
+        )
+        # the time of Optuna tuning is not in the model train time
+        for m in automl._models:
+            self.assertTrue(m.get_train_time() < 5.0)
@@ -0,0 +1,98 @@
+import os
+import json
+import shutil
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+
+
+class AutoMLParallelFoldsTest(unittest.TestCase):
+
+    automl_dirs = ["automl_parallel_folds_1", "automl_parallel_folds_2"]
+
+    def tearDown(self):
+        for automl_dir in self.automl_dirs:
+            shutil.rmtree(automl_dir, ignore_errors=True)
+
+    def _fit(self, automl_dir, parallel_folds, X, y, **params):
+        automl = AutoML(
+            results_path=automl_dir,
+            algorithms=["Decision Tree"],
+            explain_level=0,
+            train_ensemble=False,
+            start_random_models=1,
+            validation_strategy={
+                "validation_type": "kfold",
+                "k_folds": 3,
+                "shuffle": True,
+                "stratify": True,
+                "random_seed": 1,
+                "parallel_folds": parallel_folds,
+            },
+            random_state=1,
+            **params,
+        )
+        automl.fit(X, y)
+        with open(os.path.join(automl_dir, "1_DecisionTree", "framework.json")) as fin:
+            return automl, json.load(fin)
+
+    def test_parallel_folds(self):
+        X, y = datasets.make_classification(
+            n_samples=200, n_features=5, n_informative=4, n_redundant=1, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+
+        automl_1, framework_1 = self._fit(self.automl_dirs[0], 1, X, y)
+        automl_2, framework_2 = self._fit(self.automl_dirs[1], 3, X, y)
+
+        self.assertEqual(len(framework_1["saved"]), 3)
+        self.assertEqual(framework_1["final_loss"], framework_2["final_loss"])
+        self.assertEqual(framework_1["preprocessing"], framework_2["preprocessing"])
+        self.assertEqual(
+            [l["name"] for l in framework_1["learners"]],
+            [l["name"] for l in framework_2["learners"]],
+        )
+        self.assertEqual(
+            [l["params"] for l in framework_1["learners"]],
+            [l["params"] for l in framework_2["learners"]],
+        )
+        self.assertTrue(
+            np.allclose(automl_1.predict_proba(X), automl_2.predict_proba(X))
+        )
+
+    def test_parallel_folds_with_global_random_state(self):
+        X, y = datasets.make_classification(
+            n_samples=200, n_features=5, n_informative=4, n_redundant=1, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+
+        frameworks = []
+        for automl_dir, parallel_folds in zip(self.automl_dirs, [1, 3]):
+            # the random feature is drawn from the global random state
+            self._fit(
+                automl_dir,
+                parallel_folds,
+                X,
+                y,
+                features_selection=True,
+                hill_climbing_steps=0,
+            )
+            model_dir = [
+                d for d in os.listdir(automl_dir) if d.endswith("_RandomFeature")
+            ][0]
+            with open(os.path.join(automl_dir, model_dir, "framework.json")) as fin:
+                framework = json.load(fin)
+            # timings, ids and paths are different
+            for k in ["uid", "train_time", "single_prediction_time"]:
+                framework.pop(k, None)
+            for learner in framework["learners"]:
+                del learner["uid"]
+            del framework["params"]["validation_strategy"]
+            frameworks += [framework]
+
+        self.maxDiff = None
+        self.assertEqual(frameworks[0], frameworks[1])
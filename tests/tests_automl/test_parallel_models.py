@@ -0,0 +1,67 @@
+import os
+import json
+import shutil
+import unittest
+
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+
+
+class AutoMLParallelModelsTest(unittest.TestCase):
+
+    automl_dirs = ["automl_parallel_models_1", "automl_parallel_models_2"]
+
+    def tearDown(self):
+        for automl_dir in self.automl_dirs:
+            shutil.rmtree(automl_dir, ignore_errors=True)
+
+    def _fit(self, automl_dir, n_parallel_models, X, y):
+        automl = AutoML(
+            results_path=automl_dir,
+            algorithms=["Decision Tree", "Linear"],
+            mode="Perform",
+            explain_level=0,
+            train_ensemble=False,
+            stack_models=False,
+            golden_features=False,
+            features_selection=False,
+            validation_strategy={
+                "validation_type": "kfold",
+                "k_folds": 2,
+                "shuffle": True,
+                "stratify": True,
+            },
+            n_parallel_models=n_parallel_models,
+        )
+        automl.fit(X, y)
+        return automl
+
+    def test_parallel_models(self):
+        X, y = datasets.make_classification(
+            n_samples=200, n_features=5, n_informative=4, n_redundant=1, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+
+        automl_1 = self._fit(self.automl_dirs[0], 1, X, y)
+        automl_2 = self._fit(self.automl_dirs[1], 3, X, y)
+
+        losses_1 = {m.get_name(): m.get_final_loss() for m in automl_1._models}
+        losses_2 = {m.get_name(): m.get_final_loss() for m in automl_2._models}
+        self.assertTrue(len(losses_1) > 1)
+        self.assertEqual(losses_1, losses_2)
+
+        with open(os.path.join(self.automl_dirs[1], "progress.json")) as fin:
+            progress = json.load(fin)
+        for step_params in progress["all_params"].values():
+            for params in step_params:
+                self.assertEqual(params["status"], "trained")
+
+        # models can be loaded
+        automl_3 = AutoML(results_path=self.automl_dirs[1])
+        self.assertEqual(automl_3.predict(X).shape[0], X.shape[0])
+
+    def test_wrong_n_parallel_models(self):
+        with self.assertRaises(ValueError):
+            AutoML(n_parallel_models=0)._get_n_parallel_models()
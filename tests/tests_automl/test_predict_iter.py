@@ -0,0 +1,69 @@
+import os
+import unittest
+import tempfile
+import shutil
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_almost_equal
+from sklearn import datasets
+
+from supervised import AutoML
+from supervised.exceptions import AutoMLException
+
+
+class AutoMLPredictIterTest(unittest.TestCase):
+
+    automl_dir = "automl_predict_iter"
+
+    def tearDown(self):
+        shutil.rmtree(self.automl_dir, ignore_errors=True)
+
+    def test_predict_iter(self):
+        X, y = datasets.make_classification(n_samples=300, n_features=5, random_state=0)
+        X = pd.DataFrame(X, columns=[f"f{i}" for i in range(5)])
+        automl = AutoML(
+            results_path=self.automl_dir,
+            algorithms=["Linear"],
+            explain_level=0,
+            start_random_models=1,
+        )
+        automl.fit(X, y)
+        expected = automl.predict_all(X)
+
+        for n_prefetch in [0, 2]:
+            chunks = list(automl.predict_iter(X, chunk_size=70, n_prefetch=n_prefetch))
+            self.assertEqual(len(chunks), 5)
+            self.assertTrue(max(c.shape[0] for c in chunks) <= 70)
+            predictions = pd.concat(chunks)
+            self.assertEqual(predictions.index.tolist(), X.index.tolist())
+            assert_almost_equal(predictions.values, expected.values)
+
+        # iterable of chunks
+        generator = (X.iloc[i : i + 100] for i in range(0, X.shape[0], 100))
+        predictions = pd.concat(automl.predict_iter(generator, chunk_size=40))
+        assert_almost_equal(predictions.values, expected.values)
+
+        # csv file
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "data.csv")
+            X.to_csv(fname, index=False)
+            predictions = pd.concat(automl.predict_iter(fname, chunk_size=100))
+            assert_almost_equal(predictions.values, expected.values, decimal=5)
+
+        # consumer can stop at any time
+        for predictions in automl.predict_iter(X, chunk_size=10):
+            break
+
+        with self.assertRaises(AutoMLException):
+            list(automl.predict_iter(X[["f0", "f1"]], chunk_size=100))
+
+        # arguments are checked before the iteration
+        with self.assertRaises(AutoMLException):
+            automl.predict_iter(X, chunk_size=0)
+        with self.assertRaises(AutoMLException):
+            automl.predict_iter("not_existing.csv")
+
+    def test_predict_iter_not_fitted(self):
+        automl = AutoML(results_path=self.automl_dir)
+        with self.assertRaises(AutoMLException):
+            automl.predict_iter(np.zeros((10, 2)))
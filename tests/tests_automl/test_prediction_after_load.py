@@ -54,4 +54,34 @@ class AutoMLPredictionAfterLoadTest(unittest.TestCase):
         p2 = a2.predict_all(X_test)
         
         assert_almost_equal(p["prediction_0"].iloc[0], p2["prediction_0"].iloc[0])
-        assert_almost_equal(p["prediction_7"].iloc[0], p2["prediction_7"].iloc[0])
\ No newline at end of file
+        assert_almost_equal(p["prediction_7"].iloc[0], p2["prediction_7"].iloc[0])
+    def test_lazy_load(self):
+        a = AutoML(
+            results_path=self.automl_dir,
+            algorithms=["Linear", "Decision Tree"],
+            explain_level=0,
+            train_ensemble=True,
+            start_random_models=1,
+            validation_strategy={
+                "validation_type": "kfold",
+                "k_folds": 3,
+                "shuffle": True,
+                "stratify": True,
+            },
+        )
+        X, y = datasets.make_classification(n_samples=200, random_state=0)
+        a.fit(X, y)
+        p = a.predict_proba(X)
+
+        a2 = AutoML(results_path=self.automl_dir)
+        a2.load(self.automl_dir)
+        self.assertEqual(
+            sorted(a2._models_load_time.keys()),
+            sorted([m.get_name() for m in a2._models]),
+        )
+        # learners are loaded on the first predict
+        for m in a2._models:
+            if m.get_type() != "Ensemble":
+                self.assertFalse(any([l.is_fitted() for l in m.learners]))
+        p2 = a2.predict_proba(X)
+        assert_almost_equal(p, p2)
@@ -0,0 +1,53 @@
+import os
+import unittest
+import shutil
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+from supervised.utils.artifacts_cache import ArtifactsCache
+
+
+class AutoMLArtifactsCacheTest(unittest.TestCase):
+
+    automl_dirs = ["automl_artifacts_1", "automl_artifacts_2"]
+    cache_dir = "automl_artifacts_cache"
+
+    def tearDown(self):
+        for path in self.automl_dirs + [self.cache_dir]:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def test_reuse_artifacts(self):
+        X, y = datasets.make_classification(n_samples=200, n_features=5, random_state=0)
+        X = pd.DataFrame(X, columns=[f"f{i}" for i in range(5)])
+        for results_path in self.automl_dirs:
+            automl = AutoML(
+                results_path=results_path,
+                algorithms=["Decision Tree"],
+                explain_level=0,
+                start_random_models=1,
+                hill_climbing_steps=0,
+                golden_features=True,
+                kmeans_features=True,
+                train_ensemble=False,
+                validation_strategy={
+                    "validation_type": "kfold",
+                    "k_folds": 2,
+                    "shuffle": True,
+                },
+                artifacts_cache_dir=self.cache_dir,
+            )
+            automl.fit(X, y)
+
+        stats = ArtifactsCache.stats(self.automl_dirs[1]).set_index("artifact")
+        for artifact in ["data_info", "folds", "golden_features", "kmeans"]:
+            self.assertTrue(stats.loc[artifact, "hits"] > 0, artifact)
+            self.assertEqual(stats.loc[artifact, "misses"], 0, artifact)
+
+        for path in ["folds/fold_0_train_indices.npy", "golden_features.json"]:
+            with open(os.path.join(self.automl_dirs[0], path), "rb") as f1:
+                with open(os.path.join(self.automl_dirs[1], path), "rb") as f2:
+                    self.assertEqual(f1.read(), f2.read())
+
+        with open(os.path.join(self.automl_dirs[1], "README.md")) as fin:
+            self.assertTrue("Artifacts cache" in fin.read())
@@ -0,0 +1,85 @@
+import shutil
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+from supervised.tuner.mljar_tuner import MljarTuner
+
+
+class AutoMLSuccessiveHalvingTest(unittest.TestCase):
+
+    automl_dir = "automl_successive_halving"
+
+    def tearDown(self):
+        shutil.rmtree(self.automl_dir, ignore_errors=True)
+
+    def test_successive_halving(self):
+        X, y = datasets.make_classification(
+            n_samples=200, n_features=5, n_informative=4, n_redundant=1, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+
+        automl = AutoML(
+            results_path=self.automl_dir,
+            algorithms=["Extra Trees"],
+            mode="Perform",
+            explain_level=0,
+            stack_models=False,
+            golden_features=False,
+            features_selection=False,
+            kmeans_features=False,
+            start_random_models=2,
+            hill_climbing_steps=1,
+            top_models_to_improve=1,
+            validation_strategy={
+                "validation_type": "kfold",
+                "k_folds": 3,
+                "shuffle": True,
+                "stratify": True,
+            },
+            successive_halving=True,
+        )
+        automl.fit(X, y)
+        self.assertIn("not_so_random_promote", automl.tuner.steps())
+
+        ldb = automl.get_leaderboard()
+        low_fidelity = ldb[ldb.fidelity < 1.0]
+        # not_so_random checks 3x more models on the first fold
+        self.assertTrue(low_fidelity.shape[0] >= MljarTuner.HALVING_ETA)
+        assert np.allclose(low_fidelity.fidelity, 1.0 / 3.0)
+        self.assertEqual(
+            sorted(low_fidelity.name),
+            sorted(m.get_name() for m in automl._low_fidelity_models),
+        )
+
+        # low fidelity models are not used in ensemble
+        names = [m.get_name() for m in automl._models]
+        self.assertFalse(set(names) & set(low_fidelity.name))
+        for m in automl._models:
+            self.assertEqual(m.get_fidelity(), 1.0)
+
+        # the best third of not_so_random models is promoted
+        step_models = sorted(
+            [
+                m
+                for m in automl._low_fidelity_models
+                if m.params.get("fidelity_step") == "not_so_random"
+            ],
+            key=lambda m: m.get_final_loss(),
+        )
+        promote_cnt = int(np.ceil(len(step_models) / MljarTuner.HALVING_ETA))
+        best_learners = [m.params["learner"] for m in step_models[:promote_cnt]]
+        other_learners = [m.params["learner"] for m in step_models[promote_cnt:]]
+        models = [m for m in automl._models if hasattr(m, "params")]
+        promoted = [m for m in models if m.params["learner"] in best_learners]
+        self.assertEqual(len(promoted), promote_cnt)
+        for m in promoted:
+            self.assertEqual(m.get_fidelity(), 1.0)
+            self.assertNotIn("fidelity_step", m.params)
+        self.assertFalse(
+            [m for m in models if m.params["learner"] in other_learners]
+        )
+        self.assertTrue(automl.predict(X).shape[0] == X.shape[0])
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from supervised.algorithms.algorithm import BaseAlgorithm
+from supervised.callbacks.early_stopping import EarlyStopping
+
+
+class IterativeAlgorithm(BaseAlgorithm):
+    def __init__(self, params):
+        super(IterativeAlgorithm, self).__init__(params)
+        self.iters = 0
+
+    def copy(self):
+        raise Exception("Should not be called")
+
+    def get_snapshot(self):
+        return self.iters
+
+    def restore_snapshot(self, snapshot):
+        self.iters = snapshot
+
+
+class EarlyStoppingTest(unittest.TestCase):
+    def _train(self, es, learner):
+        es.add_and_set_learner(learner)
+        es.on_learner_train_start(None)
+
+        y = pd.Series(np.arange(10, dtype=float))
+        # the validation error is the lowest after the second iteration
+        for i, shift in enumerate([2.0, 0.5, 1.0, 3.0]):
+            learner.iters += 1
+            es.on_iteration_end(
+                {"iter_cnt": i},
+                {
+                    "y_validation_true": y,
+                    "y_validation_predicted": y.values + shift,
+                    "validation_index": y.index,
+                },
+            )
+        self.assertEqual(es.best_iter[learner.uid], 1)
+        self.assertEqual(learner.iters, 4)
+        es.on_learner_train_end(None)
+
+    def test_restore_best_iteration(self):
+        es = EarlyStopping({"metric": {"name": "mse"}, "restore_best_model": True})
+        learner = IterativeAlgorithm({"ml_task": "regression"})
+        self._train(es, learner)
+        self.assertEqual(learner.iters, 2)
+        self.assertIsNone(es.best_models[learner.uid])
+
+    def test_keep_last_iteration(self):
+        es = EarlyStopping({"metric": {"name": "mse"}})
+        learner = IterativeAlgorithm({"ml_task": "regression"})
+        self._train(es, learner)
+        # the learner is not changed by default
+        self.assertEqual(learner.iters, 4)
+        self.assertIsNone(es.best_models[learner.uid])
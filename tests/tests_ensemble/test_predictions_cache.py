@@ -0,0 +1,62 @@
+import shutil
+import unittest
+from unittest import mock
+
+import pandas as pd
+from sklearn import datasets
+
+from supervised import AutoML
+from supervised.model_framework import ModelFramework
+
+from supervised.algorithms.xgboost import additional
+
+additional["max_rounds"] = 10
+
+
+class EnsemblePredictionsCacheTest(unittest.TestCase):
+
+    automl_dir = "automl_predictions_cache"
+
+    def tearDown(self):
+        shutil.rmtree(self.automl_dir, ignore_errors=True)
+
+    def test_stacked_ensemble_predicts_once(self):
+        a = AutoML(
+            results_path=self.automl_dir,
+            mode="Compete",
+            algorithms=["Decision Tree", "Linear", "Xgboost"],
+            explain_level=0,
+            # stacking needs at least 5 models
+            start_random_models=3,
+            hill_climbing_steps=0,
+            golden_features=False,
+            features_selection=False,
+            kmeans_features=False,
+            boost_on_errors=False,
+            train_ensemble=True,
+            stack_models=True,
+            validation_strategy={"validation_type": "kfold", "k_folds": 3},
+        )
+        X, y = datasets.make_classification(
+            n_samples=200, n_features=5, n_informative=4, n_redundant=1, random_state=0
+        )
+        X = pd.DataFrame(X, columns=[f"f_{i}" for i in range(X.shape[1])])
+        a.fit(X, y)
+
+        ensemble = [m for m in a._models if m.get_name() == "Ensemble_Stacked"][0]
+        expected = a._base_predict(X, ensemble)
+
+        predicted_models = []
+        original_predict = ModelFramework.predict
+
+        def predict(model, X_predict):
+            predicted_models.append(model.get_name())
+            return original_predict(model, X_predict)
+
+        with mock.patch.object(ModelFramework, "predict", predict):
+            predictions = a._base_predict(X, ensemble)
+
+        self.assertTrue(len(predicted_models) > 0)
+        self.assertEqual(len(predicted_models), len(set(predicted_models)))
+        pd.testing.assert_frame_equal(expected, predictions)
+
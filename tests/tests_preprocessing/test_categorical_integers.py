@@ -88,12 +88,13 @@ class CategoricalIntegersTest(unittest.TestCase):
         df = categorical.transform(df)
         for col in ["col1", "col2", "col3", "col4"]:
             self.assertTrue(col in df.columns)
+        # new values get the index after known values
         self.assertEqual(df["col2"][0], 0)
-        self.assertEqual(df["col2"][1], 2)  # new values get higher indexes
-        self.assertEqual(df["col2"][2], 3)  # new values get higher indexes
-        self.assertEqual(df["col4"][0], 3)  # new values get higher indexes
+        self.assertEqual(df["col2"][1], 2)
+        self.assertEqual(df["col2"][2], 2)
+        self.assertEqual(df["col4"][0], 3)
         self.assertEqual(df["col4"][1], 1)
-        self.assertEqual(df["col4"][2], 4)  # new values get higher indexes
+        self.assertEqual(df["col4"][2], 3)
 
     def test_to_and_from_json_convert_integers(self):
         # training data
@@ -123,6 +124,25 @@ class CategoricalIntegersTest(unittest.TestCase):
         self.assertEqual(df["col4"][1], 1)
         self.assertEqual(df["col4"][2], 2)
 
+    def test_fit_transform_one_hot(self):
+        d_train = {
+            "col1": [1, 2, 3],
+            "col2": ["a", "a", "c"],
+            "col3": ["x", "y", "z"],
+        }
+        df_train = pd.DataFrame(data=d_train)
+        categorical = PreprocessingCategorical(
+            ["col2", "col3"], PreprocessingCategorical.CONVERT_ONE_HOT
+        )
+        categorical.fit(df_train)
+        df = categorical.transform(
+            pd.DataFrame({"col1": [1, 2], "col2": ["c", "b"], "col3": ["y", "w"]})
+        )
+        self.assertEqual(
+            df.columns.tolist(), ["col1", "col2_c", "col3_x", "col3_y", "col3_z"]
+        )
+        self.assertEqual(df.values.tolist(), [[1, 1, 0, 1, 0], [2, 0, 0, 0, 0]])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_almost_equal
+from unittest import mock
+
+from supervised.preprocessing.column_profiler import ColumnProfiler
+from supervised.preprocessing.preprocessing_utils import PreprocessingUtils
+
+
+class ColumnProfilerTest(unittest.TestCase):
+    def test_profile_numeric(self):
+        x = pd.Series([1.0, 2.0, np.nan, 4.0, 2.0])
+        profile = ColumnProfiler.profile(x)
+        self.assertEqual(profile["rows"], 5)
+        self.assertEqual(profile["nulls"], 1)
+        self.assertEqual(profile["unique"], 3)
+        self.assertEqual(profile["dtype_class"], ColumnProfiler.FLOAT)
+        self.assertFalse(profile["is_0_1"])
+        v = np.array([1.0, 2.0, 4.0, 2.0])
+        assert_almost_equal(profile["min"], 1.0)
+        assert_almost_equal(profile["max"], 4.0)
+        assert_almost_equal(profile["mean"], np.mean(v))
+        assert_almost_equal(profile["std"], np.std(v))
+        self.assertTrue(profile["skew"] > 0)
+
+    def test_profile_0_1_and_empty(self):
+        self.assertTrue(ColumnProfiler.profile(pd.Series([0, 1, 1, 0]))["is_0_1"])
+        self.assertFalse(ColumnProfiler.profile(pd.Series(["a", "b"]))["is_0_1"])
+        profile = ColumnProfiler.profile(pd.Series([np.nan, np.nan]))
+        self.assertEqual(profile["nulls"], 2)
+        self.assertEqual(profile["unique"], 0)
+
+    def test_count_unique_estimated_above_cap(self):
+        x = np.random.RandomState(0).randint(0, 50000, size=200000)
+        exact = len(np.unique(x))
+        cnt, uniques = ColumnProfiler.count_unique(x, cap=1000)
+        self.assertIsNone(uniques)
+        self.assertTrue(abs(cnt - exact) < 0.05 * exact)
+        cnt, uniques = ColumnProfiler.count_unique(x, cap=None)
+        self.assertEqual(cnt, exact)
+        self.assertEqual(len(uniques), exact)
+
+    def test_profile_frame_types(self):
+        n = 1000
+        X = pd.DataFrame(
+            {
+                "num": np.arange(n, dtype=float),
+                "cat": ["a", "b"] * (n // 2),
+                "text": [f"text number {i}" for i in range(n)],
+                "date": pd.date_range("2020-01-01", periods=n),
+            }
+        )
+        with mock.patch.object(ColumnProfiler, "PARALLEL_ROWS", 10):
+            profiles = ColumnProfiler.profile_frame(X, n_jobs=2)
+        types = {
+            col: PreprocessingUtils.get_type_from_profile(profiles[col])
+            for col in X.columns
+        }
+        for col in X.columns:
+            self.assertEqual(types[col], PreprocessingUtils.get_type(X[col]))
+        self.assertEqual(
+            types,
+            {
+                "num": PreprocessingUtils.CONTINOUS,
+                "cat": PreprocessingUtils.CATEGORICAL,
+                "text": PreprocessingUtils.TEXT,
+                "date": PreprocessingUtils.DATETIME,
+            },
+        )
@@ -0,0 +1,44 @@
+import unittest
+import itertools
+import numpy as np
+from unittest import mock
+
+from supervised.preprocessing.goldenfeatures_scorer import GoldenFeaturesScorer
+from supervised.algorithms.registry import (
+    BINARY_CLASSIFICATION,
+    MULTICLASS_CLASSIFICATION,
+    REGRESSION,
+)
+
+
+class GoldenFeaturesScorerTest(unittest.TestCase):
+    def _data(self, ml_task):
+        rng = np.random.RandomState(1)
+        X = rng.normal(size=(1000, 5))
+        t = X[:, 0] * X[:, 1]
+        if ml_task == BINARY_CLASSIFICATION:
+            y = (t > 0).astype(int)
+        elif ml_task == MULTICLASS_CLASSIFICATION:
+            y = np.digitize(t, [-0.5, 0.5])
+        else:
+            y = t
+        return X[:500], y[:500], X[500:], y[500:]
+
+    def test_best_pair(self):
+        pairs = list(itertools.combinations(range(5), 2))
+        for ml_task in [BINARY_CLASSIFICATION, MULTICLASS_CLASSIFICATION, REGRESSION]:
+            scorer = GoldenFeaturesScorer(*self._data(ml_task), ml_task, n_jobs=1)
+            scores = scorer.score(pairs)
+            self.assertEqual(scores.shape, (len(pairs), 5))
+            self.assertTrue(np.all(np.isfinite(scores)))
+            best = np.unravel_index(np.argmin(scores), scores.shape)
+            self.assertEqual(pairs[best[0]], (0, 1))
+
+    def test_screening(self):
+        pairs = list(itertools.combinations(range(5), 2))
+        scorer = GoldenFeaturesScorer(*self._data(REGRESSION), REGRESSION, n_jobs=1)
+        with mock.patch.object(GoldenFeaturesScorer, "MAX_SCORED_FEATURES", 10):
+            scores = scorer.score(pairs)
+        self.assertEqual(np.sum(np.isfinite(scores)), 10)
+        # the product of the first pair is kept after screening
+        self.assertTrue(np.isfinite(scores[0, 4]))
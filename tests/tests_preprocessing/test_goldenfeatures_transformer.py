@@ -166,3 +166,22 @@ class GoldenFeaturesTransformerTest(unittest.TestCase):
 
             df = gft3.transform(df)
             self.assertEqual(df.shape[1], N_COLS + FEATURES_COUNT)
+
+    def test_transform_values(self):
+        df = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [2.0, 0.0, 4.0], "c": [1, 1, 2]})
+        gft = GoldenFeaturesTransformer()
+        gft._new_features = [
+            {"feature1": "a", "feature2": "b", "operation": "diff"},
+            {"feature1": "a", "feature2": "b", "operation": "ratio"},
+            {"feature1": "c", "feature2": "a", "operation": "sum"},
+            {"feature1": "b", "feature2": "c", "operation": "multiply"},
+        ]
+        df = gft.transform(df)
+        self.assertEqual(
+            list(df.columns),
+            ["a", "b", "c", "a_diff_b", "a_ratio_b", "c_sum_a", "b_multiply_c"],
+        )
+        assert_almost_equal(df["a_diff_b"], [-1.0, 2.0, -1.0])
+        assert_almost_equal(df["a_ratio_b"], [0.5, 0.0, 0.75])
+        assert_almost_equal(df["c_sum_a"], [2.0, 3.0, 5.0])
+        assert_almost_equal(df["b_multiply_c"], [2.0, 0.0, 8.0])
@@ -118,8 +118,14 @@ class PreprocessingTest(unittest.TestCase):
             self.assertTrue(col in X_train.columns)
 
         params_json = ps.to_json()
-        self.assertEqual(len(params_json), 1)  # should store params only
+        # should store params and transform plan only
+        self.assertEqual(len(params_json), 3)
         self.assertTrue("params" in params_json)
+        self.assertEqual(
+            params_json["fill_values"],
+            {"col1": 1.0, "col2": 5.5, "col3": 1.0, "col4": 2.5},
+        )
+        self.assertEqual(params_json["clip_columns"], ["col1", "col2", "col3", "col4"])
 
     def test_run_fill_median_convert_integer(self):
         # training data
@@ -377,6 +383,45 @@ class PreprocessingTest(unittest.TestCase):
         for col in ["col2", "col3", "col4"]:
             self.assertTrue(col in X_train3.columns)
 
+    def test_fill_new_missing_values_with_train_values(self):
+        # training data without missing values in col2 and col3
+        d = {
+            "col1": [1, 2, np.nan, 4],
+            "col2": [5.0, 6.0, 7.0, 100.0],
+            "col3": ["a", "b", "b", "c"],
+            "y": [0, 1, 0, 1],
+        }
+        df = pd.DataFrame(data=d)
+        X_train = df.loc[:, ["col1", "col2", "col3"]]
+        y_train = df.loc[:, "y"]
+
+        preprocessing_params = {
+            "columns_preprocessing": {
+                "col1": [PreprocessingMissingValues.FILL_NA_MEDIAN],
+                "col3": [PreprocessingCategorical.CONVERT_INTEGER],
+            }
+        }
+        ps = Preprocessing(preprocessing_params)
+        ps.fit_and_transform(X_train, y_train)
+        # fill values for all columns, also without missing values
+        self.assertEqual(list(ps._fill_values.keys()), ["col1", "col2", "col3"])
+
+        X_test = pd.DataFrame(
+            {"col1": [np.nan, 1], "col2": [np.nan, 1e40], "col3": [np.nan, "a"]}
+        )
+        X_test_copy = X_test.copy()
+        for p in [ps, Preprocessing()]:
+            if p is not ps:
+                p.from_json(json.loads(json.dumps(ps.to_json())), "./")
+            X, _, _ = p.transform(X_test, None)
+            self.assertEqual(X["col1"].iloc[0], 2)
+            # median from the training data, not from the new data
+            self.assertEqual(X["col2"].iloc[0], 6.5)
+            self.assertEqual(X["col2"].iloc[1], np.finfo(np.float32).max - 1000)
+            self.assertEqual(X["col3"].iloc[0], 1)  # "b" is the most frequent
+            # input data is not changed
+            pd.testing.assert_frame_equal(X_test, X_test_copy)
+
 
 """
     def test_run_fill_median_convert_one_hot_validation_dataset(self):
@@ -0,0 +1,118 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from supervised.preprocessing.preprocessing import Preprocessing
+from supervised.preprocessing.preprocessing_cache import PreprocessingCache
+from supervised.utils.utils import dump_data, release_data
+
+
+class PreprocessingCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._results_path = tempfile.mkdtemp()
+        self._X_path = os.path.join(self._results_path, "X.data")
+        dump_data(self._X_path, pd.DataFrame({"a": [1, 2, 3]}))
+
+    def tearDown(self):
+        release_data(self._results_path)
+        shutil.rmtree(self._results_path, ignore_errors=True)
+
+    def test_is_cacheable(self):
+        self.assertTrue(PreprocessingCache.is_cacheable({"columns_preprocessing": {}}))
+        self.assertFalse(PreprocessingCache.is_cacheable({"kmeans_features": {}}))
+        self.assertFalse(
+            PreprocessingCache.is_cacheable({"add_random_feature": True})
+        )
+
+    def test_key(self):
+        preprocessing_params = {"columns_preprocessing": {"a": ["scale_normal"]}}
+        validation_params = {"k_folds": 5, "X_path": self._X_path}
+        key = PreprocessingCache.get_key(
+            self._results_path, preprocessing_params, validation_params, 0, 0
+        )
+        # the same params give the same key
+        self.assertEqual(
+            key,
+            PreprocessingCache.get_key(
+                self._results_path,
+                {"columns_preprocessing": {"a": ["scale_normal"]}},
+                dict(validation_params),
+                0,
+                0,
+            ),
+        )
+        # other fold
+        self.assertNotEqual(
+            key,
+            PreprocessingCache.get_key(
+                self._results_path, preprocessing_params, validation_params, 1, 0
+            ),
+        )
+        # other preprocessing
+        self.assertNotEqual(
+            key,
+            PreprocessingCache.get_key(
+                self._results_path,
+                {"columns_preprocessing": {}},
+                validation_params,
+                0,
+                0,
+            ),
+        )
+        # new data
+        dump_data(self._X_path, pd.DataFrame({"a": [1, 2, 3]}))
+        self.assertNotEqual(
+            key,
+            PreprocessingCache.get_key(
+                self._results_path, preprocessing_params, validation_params, 0, 0
+            ),
+        )
+
+    def test_get_and_set(self):
+        key = os.path.join(self._results_path, "some_key")
+        self.assertTrue(PreprocessingCache.get(key) is None)
+
+        preprocessing = Preprocessing({"columns_preprocessing": {}})
+        X = pd.DataFrame({"a": np.arange(5)})
+        y = pd.Series(np.arange(5))
+        PreprocessingCache.set(
+            key,
+            preprocessing,
+            {"X": X, "y": y, "sample_weight": None},
+            {"X": X, "y": y, "sample_weight": None},
+        )
+        cached_preprocessing, train_data, validation_data = PreprocessingCache.get(key)
+        self.assertTrue(cached_preprocessing is not preprocessing)
+        self.assertTrue(train_data["sample_weight"] is None)
+        # returned data are copies
+        train_data["X"]["a"] = 100
+        _, train_data, _ = PreprocessingCache.get(key)
+        self.assertEqual(train_data["X"]["a"].tolist(), list(range(5)))
+
+        # cache is released with the data
+        release_data(self._results_path)
+        self.assertTrue(PreprocessingCache.get(key) is None)
+
+    def test_least_recently_used_are_removed(self):
+        keys = [os.path.join(self._results_path, f"key_{i}") for i in range(3)]
+        X = pd.DataFrame({"a": np.arange(1000, dtype=np.float64)})
+        max_size = PreprocessingCache.MAX_SIZE
+        try:
+            # room for two entries
+            PreprocessingCache.MAX_SIZE = 2.5 * X.memory_usage().sum() / 1024 / 1024
+            for key in keys[:2]:
+                PreprocessingCache.set(key, None, {"X": X}, {"X": None})
+            # the first entry is used, the second is the least recently used
+            self.assertTrue(PreprocessingCache.get(keys[0]) is not None)
+            _, train_data, _ = PreprocessingCache.set(
+                keys[2], None, {"X": X}, {"X": None}
+            )
+            self.assertTrue(train_data["X"] is not X)
+            self.assertTrue(PreprocessingCache.get(keys[0]) is not None)
+            self.assertTrue(PreprocessingCache.get(keys[1]) is None)
+            self.assertTrue(PreprocessingCache.get(keys[2]) is not None)
+        finally:
+            PreprocessingCache.MAX_SIZE = max_size
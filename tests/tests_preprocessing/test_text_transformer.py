@@ -35,3 +35,36 @@ class TextTransformerTest(unittest.TestCase):
         self.assertTrue("col1" not in df2.columns)
 
         assert_almost_equal(df.iloc[0, 0], df2.iloc[0, 0])
+
+    def test_hashing_sparse_transformer(self):
+        d = {
+            "col1": [
+                "This is the first document.",
+                None,
+                "And this is the third one.",
+            ],
+            "col2": [1, 2, 3],
+        }
+        df = pd.DataFrame(data=d)
+
+        dense = TextTransformer(TextTransformer.HASHING)
+        dense.fit(df, "col1")
+        df_dense = dense.transform(df.copy())
+        self.assertEqual(df_dense.shape, (3, 101))
+        self.assertEqual(df_dense.columns[0], "col2")
+        self.assertEqual(np.sum(df_dense.iloc[1, 1:]), 0)
+
+        sparse = TextTransformer(TextTransformer.HASHING, sparse=True)
+        sparse.fit(df, "col1")
+        params = json.loads(json.dumps(sparse.to_json()))
+        # no vocabulary for hashing
+        self.assertTrue("vocabulary" not in params)
+
+        transf = TextTransformer()
+        transf.from_json(params)
+        df_sparse = transf.transform(df.copy())
+        self.assertTrue(isinstance(df_sparse["col1_hash_0"].dtype, pd.SparseDtype))
+        assert_almost_equal(
+            df_sparse.iloc[:, 1:].sparse.to_dense().values,
+            df_dense.iloc[:, 1:].values,
+        )
@@ -0,0 +1,55 @@
+import unittest
+from numpy.testing import assert_almost_equal
+
+from supervised.tuner.cost_model import CostModel
+
+
+class CostModelTest(unittest.TestCase):
+    def test_get_features(self):
+        features = CostModel.get_features(
+            {"num_leaves": 64, "learning_rate": 0.05, "max_rounds": 1000}, 100, 10, 5
+        )
+        self.assertEqual(
+            features,
+            {
+                "rows": 100.0,
+                "cols": 10.0,
+                "learners": 5.0,
+                "depth": 6.0,
+                "learning_rate": 0.05,
+                "trees": 1000.0,
+            },
+        )
+        self.assertIsNone(CostModel.get_features({}, 100, 10, 5)["depth"])
+
+    def test_prior_from_one_record(self):
+        features = CostModel.get_features({"max_depth": 4, "eta": 0.1}, 1000, 10, 5)
+        cm = CostModel()
+        cm.fit(
+            [{"model_type": "Xgboost", "features": features, "train_time": 10.0}]
+        )
+        self.assertIsNone(cm.predict("LightGBM", features))
+        assert_almost_equal(cm.predict("Xgboost", features), 10.0)
+        # time is proportional to the number of rows
+        assert_almost_equal(cm.predict("Xgboost", dict(features, rows=4000)), 40.0)
+
+    def test_fit_slopes(self):
+        records = []
+        for rows in [1000, 2000, 4000, 8000, 16000]:
+            for depth in [2, 4, 8]:
+                records += [
+                    {
+                        "model_type": "Xgboost",
+                        "features": CostModel.get_features(
+                            {"max_depth": depth, "eta": 0.1}, rows, 10, 5
+                        ),
+                        # time grows with the square of rows
+                        "train_time": 1e-6 * rows ** 2 * depth,
+                    }
+                ]
+        cm = CostModel()
+        cm.fit(records)
+        features = CostModel.get_features({"max_depth": 4, "eta": 0.1}, 32000, 10, 5)
+        predicted = cm.predict("Xgboost", features)
+        expected = 1e-6 * 32000 ** 2 * 4
+        self.assertTrue(abs(predicted - expected) < 0.2 * expected)
@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+from supervised.algorithms.registry import BINARY_CLASSIFICATION
+from supervised.preprocessing.column_profiler import ColumnProfiler
+from supervised.preprocessing.preprocessing_utils import PreprocessingUtils
+from supervised.tuner.data_info import DataInfo
+
+
+class DataInfoTest(unittest.TestCase):
+    def test_profile_with_n_jobs(self):
+        X = pd.DataFrame({"a": np.arange(10), "b": ["x", "y"] * 5})
+        y = pd.Series([0, 1] * 5)
+        with mock.patch.object(
+            ColumnProfiler, "profile_frame", wraps=ColumnProfiler.profile_frame
+        ) as profile_frame:
+            info = DataInfo.compute(X, y, BINARY_CLASSIFICATION, n_jobs=1)
+        profile_frame.assert_called_once_with(X, n_jobs=1)
+        self.assertEqual(set(info["columns_info"].keys()), {"a", "b"})
+
+    def test_sparse_high_cardinality_column(self):
+        rows, nulls = 1000, 600
+        X = pd.DataFrame(
+            {
+                # 223 unique values in 400 not null rows
+                "text": [f"v{i % 223}" for i in range(rows - nulls)] + [None] * nulls,
+                # 150 unique values in 400 not null rows
+                "category": [f"v{i % 150}" for i in range(rows - nulls)]
+                + [None] * nulls,
+            }
+        )
+        y = pd.Series([0, 1] * (rows // 2))
+        info = DataInfo.compute(X, y, BINARY_CLASSIFICATION)["columns_info"]
+        # the same types as from the checks on single columns
+        self.assertTrue(PreprocessingUtils.is_text(X["text"]))
+        self.assertEqual(info["text"], ["text_transform"])
+        self.assertTrue(PreprocessingUtils.is_categorical(X["category"]))
+        self.assertEqual(info["category"][:2], ["missing_values", "categorical"])
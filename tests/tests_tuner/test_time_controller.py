@@ -59,3 +59,63 @@ class TimeControllerTest(unittest.TestCase):
             else:
                 self.assertFalse(tc.enough_time("Xgboost", "stack"))
             self.assertTrue(tc.enough_time("Ensemble_Stacked", "ensemble_stacked"))
+
+    def test_skip_model_predicted_to_overrun_step(self):
+        tc = TimeController(
+            start_time=time.time(),
+            total_time_limit=100,
+            model_time_limit=None,
+            steps=["default_algorithms", "not_so_random", "hill_climbing_1"],
+            algorithms=["Xgboost", "LightGBM"],
+        )
+        small = {"rows": 1000, "cols": 10, "learners": 5, "trees": 100}
+        tc.log_time("1_Xgboost", "Xgboost", "default_algorithms", 10, small)
+        tc.log_time("2_LightGBM", "LightGBM", "default_algorithms", 0.5, small)
+        self.assertTrue(tc.enough_time("Xgboost", "not_so_random", small))
+        # 10 times more trees, about 100 seconds
+        large = dict(small, trees=1000)
+        assert_almost_equal(tc.predict_time("Xgboost", large), 100)
+        self.assertFalse(tc.enough_time("Xgboost", "not_so_random", large))
+        self.assertEqual(
+            tc.order_by_cost(
+                "not_so_random",
+                [("Xgboost", small), ("LightGBM", large), ("CatBoost", small)],
+            ),
+            [2, 1, 0],
+        )
+        self.assertEqual(
+            tc.order_by_cost(
+                "golden_features", [("Xgboost", small), ("LightGBM", small)]
+            ),
+            [0, 1],
+        )
+
+        tc2 = TimeController.from_json(tc.to_json())
+        assert_almost_equal(tc2.predict_time("Xgboost", large), 100)
+
+    def test_promote_step_shares_time(self):
+        steps = ["default_algorithms", "not_so_random", "hill_climbing_1"]
+        tc = TimeController(time.time(), 100, None, steps, ["Xgboost"])
+        tc_promote = TimeController(
+            time.time(),
+            100,
+            None,
+            [
+                "default_algorithms",
+                "not_so_random",
+                "not_so_random_promote",
+                "hill_climbing_1",
+                "hill_climbing_1_promote",
+            ],
+            ["Xgboost"],
+        )
+        for step in ["not_so_random", "hill_climbing_1"]:
+            assert_almost_equal(
+                tc_promote.time_should_use(step)
+                + tc_promote.time_should_use(f"{step}_promote"),
+                tc.time_should_use(step),
+            )
+        assert_almost_equal(
+            tc_promote.compound_time_should_use("hill_climbing_1_promote"),
+            tc.compound_time_should_use("hill_climbing_1"),
+        )
@@ -0,0 +1,129 @@
+import os
+import unittest
+import tempfile
+import joblib
+import numpy as np
+import pandas as pd
+
+from supervised.utils.artifacts_cache import ArtifactsCache
+
+
+class ArtifactsCacheTest(unittest.TestCase):
+    def _cache(self, cache_dir, fingerprint="abc", max_size=1024, results_path=None):
+        return ArtifactsCache.from_params(
+            {
+                "k_folds": 5,
+                "X_path": "/tmp/run_1/X.data",
+                "artifacts_cache": {
+                    "path": cache_dir,
+                    "max_size": max_size,
+                    "fingerprint": fingerprint,
+                    "results_path": results_path,
+                },
+            }
+        )
+
+    def test_fingerprint(self):
+        X = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        y = pd.Series([0, 1, 0], name="target")
+        fingerprint = ArtifactsCache.fingerprint(X, y)
+        # index is not used
+        X2, y2 = X.copy(), y.copy()
+        X2.index, y2.index = [5, 6, 7], [5, 6, 7]
+        self.assertEqual(fingerprint, ArtifactsCache.fingerprint(X2, y2))
+        X2.loc[5, "a"] = 10
+        self.assertNotEqual(fingerprint, ArtifactsCache.fingerprint(X2, y2))
+        self.assertNotEqual(
+            fingerprint, ArtifactsCache.fingerprint(X, y, pd.Series([1.0, 1.0, 1.0]))
+        )
+
+    def test_stacked_data_not_cached(self):
+        params = {
+            "X_path": "/tmp/X_stacked.data",
+            "artifacts_cache": {"path": "/tmp", "fingerprint": "abc"},
+        }
+        self.assertIsNone(ArtifactsCache.from_params(params))
+        self.assertIsNone(ArtifactsCache.from_params({"k_folds": 5}))
+
+    def test_custom_folds_in_key(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            caches = []
+            for i, folds in enumerate([[0, 1], [0, 1], [1, 0]]):
+                run_path = os.path.join(tmpdir, f"run_{i}")
+                os.mkdir(run_path)
+                cv_path = os.path.join(run_path, "cv.data")
+                joblib.dump([(np.array([folds[0]]), np.array([folds[1]]))], cv_path)
+                caches += [
+                    ArtifactsCache.from_params(
+                        {
+                            "validation_type": "custom",
+                            "cv_path": cv_path,
+                            "artifacts_cache": {"path": tmpdir, "fingerprint": "abc"},
+                        }
+                    )
+                ]
+            caches[0].set_object("kmeans", None, {"fold": 0})
+            # the same folds
+            self.assertEqual(caches[1].get_object("kmeans"), {"fold": 0})
+            # other folds
+            self.assertIsNone(caches[2].get_object("kmeans"))
+            # folds can't be read
+            self.assertIsNone(
+                ArtifactsCache.from_params(
+                    {
+                        "validation_type": "custom",
+                        "cv_path": os.path.join(tmpdir, "missing", "cv.data"),
+                        "artifacts_cache": {"path": tmpdir, "fingerprint": "abc"},
+                    }
+                )
+            )
+
+    def test_set_and_restore(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = os.path.join(tmpdir, "cache")
+            os.mkdir(cache_dir)
+            results_path = os.path.join(tmpdir, "run")
+            os.mkdir(results_path)
+            cache = self._cache(cache_dir, results_path=results_path)
+
+            self.assertIsNone(cache.get_object("info", {"ml_task": "regression"}))
+            cache.set_object("info", {"ml_task": "regression"}, {"rows": 10})
+            # paths specific to the run are not in the key
+            other = self._cache(cache_dir)
+            other._validation["X_path"] = "X.data"
+            self.assertEqual(
+                other.get_object("info", {"ml_task": "regression"}), {"rows": 10}
+            )
+            self.assertIsNone(other.get_object("info", {"ml_task": "binary"}))
+
+            source = os.path.join(tmpdir, "folds")
+            os.mkdir(source)
+            np.save(os.path.join(source, "fold_0.npy"), np.arange(5))
+            cache.set("folds", None, source)
+            destination = os.path.join(tmpdir, "restored")
+            self.assertTrue(cache.restore("folds", None, destination))
+            np.testing.assert_array_equal(
+                np.load(os.path.join(destination, "fold_0.npy")), np.arange(5)
+            )
+            # restore into the existing directory
+            self.assertTrue(cache.restore("folds", None, destination))
+
+            stats = ArtifactsCache.stats(results_path)
+            self.assertEqual(stats["artifact"].tolist(), ["folds", "info"])
+            self.assertEqual(stats["hits"].tolist(), [2, 0])
+            self.assertEqual(stats["misses"].tolist(), [0, 1])
+
+    def test_evict_least_recently_used(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # about 0.4 MB for each artifact, 1 MB limit
+            cache = self._cache(tmpdir, max_size=1)
+            data = np.random.RandomState(0).rand(50000)
+            cache.set_object("a", None, data)
+            cache.set_object("b", None, data + 1)
+            os.utime(cache._entry("a", None), (0, 0))
+            os.utime(cache._entry("b", None), (1, 1))
+            self.assertIsNotNone(cache.get("a"))
+            cache.set_object("c", None, data + 2)
+            self.assertTrue(os.path.exists(cache._entry("a", None)))
+            self.assertFalse(os.path.exists(cache._entry("b", None)))
+            self.assertTrue(os.path.exists(cache._entry("c", None)))
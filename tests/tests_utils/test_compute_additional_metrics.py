@@ -6,6 +6,13 @@ import pandas as pd
 
 from numpy.testing import assert_almost_equal
 from sklearn import datasets
+from sklearn.metrics import (
+    f1_score,
+    accuracy_score,
+    precision_score,
+    recall_score,
+    matthews_corrcoef,
+)
 
 from supervised.utils.additional_metrics import AdditionalMetrics
 from supervised.utils.metric import Metric
@@ -53,3 +60,26 @@ class ComputeAdditionalMetricsTest(unittest.TestCase):
         conf = info["confusion_matrix"]
         self.assertTrue(max_metrics["f1"]["score"] < 1)
         self.assertTrue(max_metrics["mcc"]["score"] < 1)
+
+    def test_binary_threshold_metrics(self):
+        np.random.seed(1)
+        target = np.random.randint(0, 2, 100)
+        # rounded predictions to have ties
+        pred = np.round(np.random.rand(100), 1)
+        thresholds = [-0.1, 0.05, 0.3, 0.5, 0.55, 0.9, 1.0]
+        for sample_weight in [None, np.random.rand(100)]:
+            counts = AdditionalMetrics.binary_cumulative_counts(
+                target, pred, sample_weight
+            )
+            metrics = AdditionalMetrics.binary_threshold_metrics(counts, thresholds)
+            for i, th in enumerate(thresholds):
+                response = (pred > th).astype(int)
+                for name, metric in [
+                    ("f1", f1_score),
+                    ("accuracy", accuracy_score),
+                    ("precision", precision_score),
+                    ("recall", recall_score),
+                    ("mcc", matthews_corrcoef),
+                ]:
+                    expected = metric(target, response, sample_weight=sample_weight)
+                    assert_almost_equal(metrics[name][i], expected)
@@ -72,3 +72,34 @@ class MetricTest(unittest.TestCase):
 
         score = m(a, a)
         self.assertEqual(score, 6)
+
+    def test_batch(self):
+        np.random.seed(1)
+        y_binary = np.random.randint(0, 2, 50)
+        y_multiclass = np.random.randint(0, 3, 50)
+        y_regression = np.random.rand(50)
+        sample_weight = np.random.rand(50)
+
+        for name, y_true, columns in [
+            ("logloss", y_binary, 1),
+            ("logloss", y_multiclass, 3),
+            ("auc", y_binary, 1),
+            ("rmse", y_regression, 1),
+            ("mse", y_regression, 1),
+            ("mae", y_regression, 1),
+        ]:
+            metric = Metric({"name": name})
+            y_predicted = np.random.rand(4, 50, columns)
+            for weight in [None, sample_weight]:
+                scores = metric.batch(y_true, y_predicted, weight)
+                if scores is None:
+                    # weighted auc doesnt have vectorized version
+                    self.assertEqual(name, "auc")
+                    continue
+                for i in range(y_predicted.shape[0]):
+                    y_pred = y_predicted[i] if columns > 1 else y_predicted[i, :, 0]
+                    assert_almost_equal(scores[i], metric(y_true, y_pred, weight))
+
+        self.assertIsNone(
+            Metric({"name": "r2"}).batch(y_regression, np.random.rand(4, 50, 1))
+        )
@@ -0,0 +1,131 @@
+import unittest
+import numpy as np
+import pandas as pd
+import scipy as sp
+from numpy.testing import assert_almost_equal
+from sklearn.metrics import (
+    log_loss,
+    roc_auc_score,
+    mean_squared_error,
+    mean_absolute_error,
+    mean_absolute_percentage_error,
+    r2_score,
+    f1_score,
+    accuracy_score,
+)
+
+from supervised.utils.metric import (
+    logloss,
+    negative_auc,
+    rmse,
+    mse,
+    mae,
+    mape,
+    negative_r2,
+    negative_f1,
+    negative_accuracy,
+    negative_spearman,
+    negative_pearson,
+)
+
+
+class MetricKernelsTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(1)
+        self.n = 500
+        self.y_binary = rng.randint(0, 2, self.n)
+        # rounded predictions to have ties
+        self.p_binary = np.round(rng.uniform(size=self.n), 2)
+        self.y_multi = rng.randint(0, 3, self.n)
+        self.p_multi = rng.uniform(size=(self.n, 3))
+        self.p_multi /= self.p_multi.sum(axis=1, keepdims=True)
+        self.y_reg = rng.normal(size=self.n)
+        self.p_reg = self.y_reg + rng.normal(scale=0.5, size=self.n)
+        self.weights = [None, rng.uniform(0.1, 2.0, self.n)]
+
+    def test_binary(self):
+        for w in self.weights:
+            p = np.clip(self.p_binary, 1e-6, 1 - 1e-6)
+            assert_almost_equal(
+                logloss(self.y_binary, self.p_binary, w),
+                log_loss(self.y_binary, p, sample_weight=w),
+            )
+            assert_almost_equal(
+                negative_auc(self.y_binary, self.p_binary, w),
+                -roc_auc_score(self.y_binary, self.p_binary, sample_weight=w),
+            )
+            labels = (self.p_binary > 0.5).astype(int)
+            assert_almost_equal(
+                negative_f1(self.y_binary, self.p_binary, w),
+                -f1_score(self.y_binary, labels, sample_weight=w),
+            )
+            assert_almost_equal(
+                negative_accuracy(self.y_binary, self.p_binary, w),
+                -accuracy_score(self.y_binary, labels, sample_weight=w),
+            )
+
+    def test_binary_pandas_input(self):
+        y = pd.DataFrame({"target": self.y_binary})
+        p = pd.DataFrame({"prediction": self.p_binary})
+        assert_almost_equal(
+            negative_auc(y, p), -roc_auc_score(self.y_binary, self.p_binary)
+        )
+        assert_almost_equal(
+            logloss(y, p),
+            log_loss(self.y_binary, np.clip(self.p_binary, 1e-6, 1 - 1e-6)),
+        )
+
+    def test_multiclass(self):
+        for w in self.weights:
+            assert_almost_equal(
+                logloss(self.y_multi, self.p_multi, w),
+                log_loss(self.y_multi, self.p_multi, sample_weight=w),
+            )
+            labels = np.argmax(self.p_multi, axis=1)
+            assert_almost_equal(
+                negative_f1(self.y_multi, self.p_multi, w),
+                -f1_score(self.y_multi, labels, sample_weight=w, average="micro"),
+            )
+            assert_almost_equal(
+                negative_accuracy(self.y_multi, self.p_multi, w),
+                -accuracy_score(self.y_multi, labels, sample_weight=w),
+            )
+
+    def test_regression(self):
+        for w in self.weights:
+            y, p = self.y_reg, self.p_reg
+            assert_almost_equal(
+                mse(y, p, w), mean_squared_error(y, p, sample_weight=w)
+            )
+            assert_almost_equal(
+                rmse(y, p, w), np.sqrt(mean_squared_error(y, p, sample_weight=w))
+            )
+            assert_almost_equal(
+                mae(y, p, w), mean_absolute_error(y, p, sample_weight=w)
+            )
+            assert_almost_equal(
+                mape(y, p, w),
+                mean_absolute_percentage_error(y, p, sample_weight=w),
+            )
+            assert_almost_equal(negative_r2(y, p, w), -r2_score(y, p, sample_weight=w))
+        assert_almost_equal(
+            negative_pearson(self.y_reg, self.p_reg),
+            -np.corrcoef(self.y_reg, self.p_reg)[0, 1],
+        )
+        assert_almost_equal(
+            negative_spearman(self.y_reg, np.round(self.p_reg, 1)),
+            -sp.stats.spearmanr(self.y_reg, np.round(self.p_reg, 1))[0],
+        )
+
+    def test_constant_target(self):
+        y = np.ones(10)
+        assert_almost_equal(negative_r2(y, y), -r2_score(y, y))
+        assert_almost_equal(negative_r2(y, y + 1), -r2_score(y, y + 1))
+        self.assertEqual(rmse(y, y), -np.Inf)
+
+    def test_fallback_to_sklearn(self):
+        # not numeric target is handled by sklearn
+        y = np.array(["a", "b", "a", "b"])
+        p = np.array([0.1, 0.9, 0.2, 0.7])
+        assert_almost_equal(negative_auc(y, p), -1.0)
+        assert_almost_equal(logloss(y, p), log_loss(y, p))
@@ -0,0 +1,52 @@
+import os
+import shutil
+import unittest
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_almost_equal
+
+from supervised.utils.oof_store import OOFStore
+
+
+class OOFStoreTest(unittest.TestCase):
+
+    results_path = "./tests_oof_store"
+
+    def setUp(self):
+        shutil.rmtree(self.results_path, ignore_errors=True)
+        os.mkdir(self.results_path)
+        self.oof = pd.DataFrame(
+            {
+                "target": [0, 1, 2, 1],
+                "prediction_a": [0.1, 0.2, 0.3, 0.4],
+                "prediction_b": [0.9, 0.8, 0.7, 0.6],
+                "sample_weight": [1.0, 2.0, 3.0, 4.0],
+            }
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.results_path, ignore_errors=True)
+
+    def test_save_and_load(self):
+        fname = OOFStore.save(self.results_path, "1_Model", self.oof)
+        oof = OOFStore.load(os.path.join(self.results_path, fname))
+
+        self.assertEqual(oof.columns.tolist(), self.oof.columns.tolist())
+        assert_almost_equal(oof.values, self.oof.values)
+        self.assertEqual(oof["prediction_a"].dtype, np.float32)
+        # returned data is read-only
+        with self.assertRaises(ValueError):
+            oof.iloc[0, 1] = 0.5
+
+    def test_shared_target(self):
+        OOFStore.save(self.results_path, "1_Model", self.oof)
+        OOFStore.save(self.results_path, "2_Model", self.oof)
+        files = os.listdir(os.path.join(self.results_path, OOFStore.STORE_DIR))
+        self.assertEqual(len([f for f in files if f.startswith("target_")]), 1)
+        self.assertEqual(len([f for f in files if f.startswith("sample_weight_")]), 1)
+
+    def test_load_csv(self):
+        fname = os.path.join(self.results_path, "predictions_out_of_folds.csv")
+        self.oof.to_csv(fname, index=False)
+        oof = OOFStore.load(fname)
+        assert_almost_equal(oof.values, self.oof.values)
@@ -0,0 +1,88 @@
+import os
+import shutil
+import unittest
+import tempfile
+import numpy as np
+import pandas as pd
+
+from supervised.utils.utils import Store, dump_data, load_data, release_data
+
+
+class StoreTest(unittest.TestCase):
+    def setUp(self):
+        self._results_path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        release_data(self._results_path)
+        shutil.rmtree(self._results_path, ignore_errors=True)
+
+    def test_load_data_without_copy(self):
+        X = pd.DataFrame({"a": np.arange(10), "b": np.random.rand(10)})
+        X_path = os.path.join(self._results_path, "X.data")
+        dump_data(X_path, X)
+
+        X_loaded = load_data(X_path)
+        self.assertTrue(X_loaded is not X)
+        # the same memory is used
+        self.assertTrue(np.shares_memory(X_loaded["b"].values, X["b"].values))
+
+        # changes in loaded frame doesnt affect stored data
+        X_loaded.reset_index(drop=True, inplace=True)
+        X_loaded.index = X_loaded.index + 10
+        X_train = X_loaded.loc[[10, 11, 12]]
+        X_train["b"] = 0
+        self.assertEqual(load_data(X_path).index[0], 0)
+        self.assertTrue(np.sum(load_data(X_path)["b"].values == 0) == 0)
+
+    def test_release_data(self):
+        X_path = os.path.join(self._results_path, "X.data")
+        y_path = os.path.join(self._results_path, "y.data")
+        other_path = self._results_path + "_other"
+        dump_data(X_path, pd.DataFrame({"a": [1, 2]}))
+        dump_data(y_path, pd.DataFrame({"target": [0, 1]}))
+        Store().set(other_path, pd.DataFrame({"a": [1]}))
+
+        release_data(self._results_path)
+
+        keys = Store().keys()
+        self.assertTrue(X_path not in keys)
+        self.assertTrue(y_path not in keys)
+        self.assertTrue(other_path in keys)
+
+        release_data(other_path)
+        self.assertTrue(other_path not in Store().keys())
+
+    def test_load_data_from_disk(self):
+        X = pd.DataFrame(
+            {
+                "num": np.random.rand(6),
+                "int": np.arange(6),
+                "text": ["a", "b", None, "a", "c", np.nan],
+                "cat": pd.Categorical(["x", "y", "x", "x", "y", "y"]),
+                "date": pd.date_range("2021-01-01", periods=6),
+            }
+        )
+        X_path = os.path.join(self._results_path, "X.data")
+        dump_data(X_path, X)
+        # data is no longer in memory
+        release_data(self._results_path)
+        self.assertTrue(X_path not in Store().keys())
+
+        X_loaded = load_data(X_path)
+        pd.testing.assert_frame_equal(X, X_loaded)
+
+        X_part = load_data(X_path, columns=["text", "num"], rows=np.array([4, 1]))
+        self.assertEqual(X_part.columns.tolist(), ["text", "num"])
+        self.assertEqual(X_part.index.tolist(), [4, 1])
+        self.assertEqual(X_part["text"].tolist(), ["c", "b"])
+        self.assertEqual(X_part["num"].tolist(), X["num"].iloc[[4, 1]].tolist())
+
+    def test_load_data_from_disk_with_index(self):
+        X = pd.DataFrame({"a": [1.0, 2.0, 3.0]}, index=[10, 20, 30])
+        X_path = os.path.join(self._results_path, "X_stacked.data")
+        dump_data(X_path, X)
+        release_data(self._results_path)
+
+        X_loaded = load_data(X_path)
+        self.assertEqual(X_loaded.index.tolist(), [10, 20, 30])
+        self.assertEqual(load_data(X_path, rows=[2]).index.tolist(), [30])
@@ -201,3 +201,45 @@ class KFoldValidatorTest(unittest.TestCase):
 
         self.assertEqual(params["k_folds"], vl.get_n_splits())
         self.assertEqual(1, vl.get_repeats())
+
+    def test_cache_folds(self):
+
+        data = {
+            "X": pd.DataFrame(
+                np.array([[0, 0], [0, 1], [1, 0], [1, 1]]), columns=["a", "b"]
+            ),
+            "y": pd.DataFrame(np.array([0, 0, 1, 1]), columns=["target"]),
+        }
+
+        X_path = os.path.join(self._results_path, "X.data")
+        y_path = os.path.join(self._results_path, "y.data")
+
+        dump_data(X_path, data["X"])
+        dump_data(y_path, data["y"])
+
+        params = {
+            "shuffle": True,
+            "stratify": True,
+            "k_folds": 2,
+            "results_path": self._results_path,
+            "X_path": X_path,
+            "y_path": y_path,
+            "cache_folds": True,
+        }
+        vl = KFoldValidator(params)
+        train, validation = vl.get_split(0)
+        # modify the data, cached fold should not change
+        train["X"]["a"] = 100
+
+        vl_next = KFoldValidator(params)
+        train_next, validation_next = vl_next.get_split(0)
+        self.assertTrue(np.sum(train_next["X"]["a"] == 100) == 0)
+        self.assertEqual(train["X"].index.tolist(), train_next["X"].index.tolist())
+        self.assertEqual(
+            validation["X"].index.tolist(), validation_next["X"].index.tolist()
+        )
+
+        # new data, folds are selected again
+        dump_data(X_path, data["X"] + 10)
+        train_new, _ = vl_next.get_split(0)
+        self.assertTrue(np.sum(train_new["X"]["a"] < 10) == 0)